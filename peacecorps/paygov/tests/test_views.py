@@ -3,7 +3,7 @@ import logging
 from django.core.urlresolvers import reverse
 from django.test import TestCase
 
-from peacecorps.models import DonorInfo, Account
+from peacecorps.models import DonorInfo, Account, DonationRollup
 
 
 class DataTests(TestCase):
@@ -114,6 +114,10 @@ class ResultsTests(TestCase):
         self.assertEqual(donation.amount, 12500)
         self.assertEqual(0, len(account.donorinfos.all()))
 
+        rollup = DonationRollup.objects.get(account=self.account)
+        self.assertEqual(('CreditCard', 12500, 1), (
+            rollup.payment_type, rollup.amount, rollup.count))
+
     def test_ach_success(self):
         """ACH transactions should not create the associated Donation entry"""
         successful = {'agency_tracking_id': 'TRACK',
@@ -135,6 +139,11 @@ class ResultsTests(TestCase):
         self.assertEqual(0, len(account.donations.all()))
         self.assertEqual(0, len(account.donorinfos.all()))
 
+        # ...but they are counted in the rollups
+        rollup = DonationRollup.objects.get(account=self.account)
+        self.assertEqual(('DirectDebit', 12500, 1), (
+            rollup.payment_type, rollup.amount, rollup.count))
+
     def test_other_amount_formats(self):
         """The payment_amount format returned by pay.gov varies"""
         self.donorinfo.delete()     # we'll make a few in the loop
@@ -1,12 +1,13 @@
 import logging
 import re
 
+from django.db import transaction
 from django.http import HttpResponse, HttpResponseBadRequest
 from django.http import HttpResponseNotAllowed
 from django.shortcuts import get_object_or_404
 from django.views.decorators.csrf import csrf_exempt
 
-from peacecorps.models import Donation, DonorInfo
+from peacecorps.models import Donation, DonationRollup, DonorInfo
 
 
 @csrf_exempt
@@ -50,13 +51,17 @@ def results(request):
     # Successful transaction
     else:
         amount = int(float(request.POST.get('payment_amount'))*100)
-        # ACH transactions shouldn't create a donation entry, as that entry
-        # would be blown away the next morning
-        if request.POST.get('payment_type') != 'DirectDebit':
-            donation = Donation(amount=amount)
-            donation.account_id = info.account_id
-            donation.save()
-        info.delete()
+        payment_type = request.POST.get('payment_type', '')
+        with transaction.atomic():
+            # ACH transactions shouldn't create a donation entry, as that
+            # entry would be blown away the next morning
+            if payment_type != 'DirectDebit':
+                donation = Donation(amount=amount, rolled_up=True)
+                donation.account_id = info.account_id
+                donation.save()
+            DonationRollup.objects.record(info.account_id, payment_type,
+                                          amount)
+            info.delete()
         logger.info("Transaction success: %s cents to %s", amount,
                     info.account.code)
     return HttpResponse('response_message=' + message,
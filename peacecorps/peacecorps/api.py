@@ -1,15 +1,20 @@
+import hashlib
 import json
 
 from django.conf import settings
-from django.core.urlresolvers import reverse
-from django.shortcuts import get_object_or_404
+from django.core.cache import caches
+from django.db.models import Sum
+from django.http import Http404
+from django.template.loader import render_to_string
 from restless.http import Http400
 from restless.models import serialize
 from restless.modelviews import DetailEndpoint
 from restless.views import Endpoint
 
+from peacecorps import sorter
 from peacecorps.forms import DonationAmountForm, DonationPaymentForm
-from peacecorps.models import Account, Campaign, Project
+from peacecorps.models import (
+    Account, Campaign, country_registry, Project, SorterEntry)
 from peacecorps.payxml import convert_to_paygov
 
 
@@ -38,17 +43,24 @@ def _serialize_account(project):
             'remaining': account.remaining()}
 
 
+def _cache_key(prefix, value):
+    """Values come from the query string; hash them so that any value makes
+    a valid (and bounded) cache key"""
+    return prefix + ':' + hashlib.md5(value.encode('utf-8')).hexdigest()
+
+
+def _serialize_totals(account):
+    """The subset of account fields which change with each donation"""
+    return {'total_donated': account.total_donated(),
+            'total_raised': account.total_raised(),
+            'percent_raised': account.percent_raised(),
+            'funded': account.funded(),
+            'remaining': account.remaining()}
+
+
 def _serialize_overflow(project):
     """Overflow url for a project; path depends on the account type"""
-    if project.overflow:
-        if project.overflow.category == Account.PROJECT:
-            view_name = 'donate project'
-        else:
-            view_name = 'donate campaign'
-        return reverse(
-            view_name,
-            kwargs={'slug': project.overflow.project_or_fund().slug})
-    return None
+    return project.overflow_url()
 
 
 def _serialize_description(project):
@@ -60,28 +72,162 @@ def _serialize_description(project):
         return None
 
 
+def _serialize_project(project):
+    """The idealized project is a bit different than the DB model"""
+    return serialize(
+        project,
+        fields=(
+            'title',
+            'tagline',
+            ('description', _serialize_description),
+            ('volunteer', _serialize_volunteer),
+            ('country', lambda o: o.country.name),
+            ('account', _serialize_account),
+            ('overflow', _serialize_overflow),
+            ('featured_image',
+                lambda o: o.featured_image.url if o.featured_image
+                else None),
+        ),
+
+    )
+
+
 class ProjectDetail(DetailEndpoint):
     model = Project     # @todo - reduce number of queries
     lookup_field = 'slug'
 
     def serialize(self, obj):
-        """The idealized project is a bit different than the DB model"""
-        return serialize(
-            obj,
-            fields=(
-                'title',
-                'tagline',
-                ('description', _serialize_description),
-                ('volunteer', _serialize_volunteer),
-                ('country', lambda o: o.country.name),
-                ('account', _serialize_account),
-                ('overflow', _serialize_overflow),
-                ('featured_image',
-                    lambda o: o.featured_image.url if o.featured_image
-                    else None),
-            ),
-
-        )
+        return _serialize_project(obj)
+
+
+class ProjectBatch(Endpoint):
+    """Several projects at once, in the same format as ProjectDetail, e.g.
+        /api/projects/?slugs=brick-oven-bakery,clean-water
+    The response maps each (published) slug to its project. Each project is
+    cached on its own; those which are missing are fetched in a fixed number
+    of queries"""
+    MAX_SLUGS = 50
+
+    def get(self, request):
+        slugs = [slug for slug in request.GET.get('slugs', '').split(',')
+                 if slug]
+        if not slugs:
+            return Http400("missing slugs")
+        if len(slugs) > self.MAX_SLUGS:
+            return Http400("too many slugs")
+
+        cache = caches['shortterm']
+        keys = {_cache_key('project', slug): slug for slug in slugs}
+        found = cache.get_many(list(keys.keys()))
+        missing = [slug for key, slug in keys.items() if key not in found]
+        if missing:
+            projects = Project.published_objects.filter(
+                slug__in=missing).select_related(
+                'account', 'country', 'featured_image',
+                'volunteerpicture').annotate(
+                donations_total=Sum('account__donations__amount'))
+            projects = list(projects)
+            for project in projects:
+                project.account.dynamic_total = project.donations_total
+            fresh = {_cache_key('project', project.slug):
+                     _serialize_project(project) for project in projects}
+            cache.set_many(fresh, settings.CACHES['shortterm']['TIMEOUT'])
+            found.update(fresh)
+        return {slug: found[key] for key, slug in keys.items()
+                if key in found}
+
+
+class AccountTotals(Endpoint):
+    """Current totals for a batch of accounts, e.g.
+        /api/totals/?codes=14-524-007,SPF-HEALTH
+    Pages embed these numbers when rendered, but may be cached for some
+    time; this allows the numbers to be updated client-side (see
+    live_totals.js). Each account's totals are cached (briefly) on their
+    own, as are unknown codes"""
+    MAX_CODES = 100
+
+    def get(self, request):
+        codes = [code for code in request.GET.get('codes', '').split(',')
+                 if code]
+        if not codes:
+            return Http400("missing codes")
+        if len(codes) > self.MAX_CODES:
+            return Http400("too many codes")
+
+        cache = caches['shortterm']
+        keys = {_cache_key('totals', code): code for code in codes}
+        found = cache.get_many(list(keys.keys()))
+        missing = [code for key, code in keys.items() if key not in found]
+        if missing:
+            fresh = {_cache_key('totals', code): False for code in missing}
+            fresh.update(
+                (_cache_key('totals', account.code),
+                 _serialize_totals(account))
+                for account in Account.objects.filter(code__in=missing))
+            cache.set_many(fresh, settings.LIVE_TOTALS_TIMEOUT)
+            found.update(fresh)
+        return {code: found[key] for key, code in keys.items() if found[key]}
+
+
+def _serialize_sorter_entry(entry):
+    """Everything needed to draw a project's card in the sorter"""
+    project = entry.project
+    country = country_registry.by_pk(entry.country_id)
+    return {'id': project.pk,
+            'slug': project.slug,
+            'title': project.title,
+            'url': project.primary_url(),
+            'abstract': project.abstract,
+            'volunteer': dict(_serialize_volunteer(project),
+                              statename=project.volunteer_statename()),
+            'country': {'code': country.code, 'name': country.name},
+            'account': project.account_id,
+            'funded': entry.funded,
+            'filters': entry.filters}
+
+
+class SorterProjects(Endpoint):
+    """Published projects, in sorter order (those still in need of funding
+    first, then by volunteer name), optionally filtered by country code,
+    issue id and funded status, e.g.
+        /api/sorter/?country=KE&issue=3&funded=false
+    Reads from the precomputed SorterEntry table. Results are paginated; the
+    `next` cursor should be passed back to retrieve the following page.
+    With html=true, the page's cards are also rendered (as `html`), for the
+    sorter's "Load more" button. Account totals are available from the
+    totals endpoint"""
+    PAGE_SIZE = sorter.PAGE_SIZE
+
+    def get(self, request):
+        entries = SorterEntry.objects.select_related(
+            'project__volunteerpicture')
+
+        if request.GET.get('country'):
+            country = country_registry.by_code(request.GET['country'])
+            entries = entries.filter(country=getattr(country, 'pk', None))
+        issue = request.GET.get('issue')
+        if issue:
+            if not issue.isdigit():
+                return Http400("invalid issue")
+            entries = entries.filter(issues=issue)
+        funded = request.GET.get('funded')
+        if funded:
+            if funded not in ('true', 'false'):
+                return Http400("invalid funded")
+            entries = entries.filter(funded=(funded == 'true'))
+
+        try:
+            page, next_cursor = sorter.page(
+                entries, request.GET.get('cursor'), self.PAGE_SIZE)
+        except ValueError:
+            return Http400("invalid cursor")
+        data = {'results': [_serialize_sorter_entry(entry) for entry in page],
+                'next': next_cursor}
+        if request.GET.get('html') == 'true':
+            data['html'] = render_to_string(
+                'donations/includes/sorter_projects.jinja',
+                sorter.card_context(page))
+        return data
 
 
 class AbstractDonation(Endpoint):
@@ -123,17 +269,21 @@ class AbstractDonation(Endpoint):
 
 class ProjectDonation(AbstractDonation):
     def post(self, request, slug):
-        project = get_object_or_404(
-            Project.published_objects.select_related('account'),
-            slug=slug)
+        try:
+            project = Project.published_objects.get_with_account_total(
+                slug=slug)
+        except Project.DoesNotExist:
+            raise Http404
         return self.errors_or_paygov(project.account, request.data,
                                      request.get_host())
 
 
 class FundDonation(AbstractDonation):
     def post(self, request, slug):
-        campaign = get_object_or_404(
-            Campaign.published_objects.select_related('account'),
-            slug=slug)
+        try:
+            campaign = Campaign.published_objects.get_with_account_total(
+                slug=slug)
+        except Campaign.DoesNotExist:
+            raise Http404
         return self.errors_or_paygov(campaign.account, request.data,
                                      request.get_host())
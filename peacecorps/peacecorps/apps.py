@@ -1,5 +1,25 @@
+import logging
+
 from django.apps import AppConfig
+from django.conf import settings
+
+
+logger = logging.getLogger(__name__)
+
 
 class PeaceCorpsConfig(AppConfig):
     name = 'peacecorps'
-    verbose_name = "Peace Corps"
\ No newline at end of file
+    verbose_name = "Peace Corps"
+
+    def ready(self):
+        """Page caching silently doing nothing is easy to miss; make the
+        active cache backends known"""
+        for alias in ('shortterm', 'midterm', 'throttle'):
+            backend = settings.CACHES[alias]['BACKEND']
+            if backend == 'peacecorps.backends.LRUFileBasedCache':
+                logger.warning(
+                    "MEMCACHED_URL is not set; the %s cache is using the "
+                    "local file cache in %s", alias,
+                    settings.CACHES[alias]['LOCATION'])
+            else:
+                logger.info("The %s cache is using %s", alias, backend)
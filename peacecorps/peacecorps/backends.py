@@ -0,0 +1,262 @@
+from collections import OrderedDict
+import os
+import pickle
+import threading
+import time
+
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache, DEFAULT_TIMEOUT
+from django.core.cache.backends.filebased import FileBasedCache
+
+
+_MISSING = object()
+
+
+class Pickled(bytes):
+    """A value held pickled in the local tier"""
+
+
+class LocalTier(object):
+    """A process' local store for one TwoTierCache. Django creates a cache
+    backend per thread, so this is shared (by LOCATION) via local_tier()
+    rather than held by the backend"""
+    def __init__(self):
+        self.entries = OrderedDict()    # key -> (expires, value, size)
+        self.size = 0
+        self.lock = threading.RLock()
+        self.generation = None
+        self.next_check = 0
+
+
+_local_tiers = {}
+_local_tiers_lock = threading.Lock()
+
+
+def local_tier(location):
+    with _local_tiers_lock:
+        if location not in _local_tiers:
+            _local_tiers[location] = LocalTier()
+        return _local_tiers[location]
+
+
+def is_immutable(value):
+    """Values which can be shared between callers as-is. Cached pages are
+    flagged with cache_immutable"""
+    return (isinstance(value, (str, bytes, int, float, type(None)))
+            or getattr(value, 'cache_immutable', False))
+
+
+class TwoTierCache(BaseCache):
+    """A small, per-process LRU in front of a shared cache (i.e. memcached).
+    The hottest pages are then served without a network round trip.
+
+    LOCATION is the alias of the shared cache. OPTIONS may include
+        LOCAL_TIMEOUT: seconds an entry may live in the local tier
+        MAX_BYTES: upper bound on the (pickled) size of the local tier
+        GENERATION_INTERVAL: seconds between checks of the generation
+
+    The local tier is shared by all of the process' threads. Immutable
+    values (e.g. cached pages) are held as-is; others are held pickled, so
+    that each hit gets its own copy, at the cost of unpickling it.
+
+    Deletes and clears bump a generation counter in the shared cache; each
+    process checks this counter (at most once per GENERATION_INTERVAL) and
+    drops its local tier when it changes. Other writes converge within
+    LOCAL_TIMEOUT"""
+    GENERATION_KEY = 'twotier:generation'
+
+    def __init__(self, location, params):
+        super(TwoTierCache, self).__init__(params)
+        options = params.get('OPTIONS', {})
+        self.shared_alias = location
+        self.local_timeout = options.get('LOCAL_TIMEOUT', 10)
+        self.max_bytes = options.get('MAX_BYTES', 32 * 1024 * 1024)
+        self.generation_interval = options.get('GENERATION_INTERVAL', 2)
+        self._tier = local_tier(location)
+
+    @property
+    def shared(self):
+        return caches[self.shared_alias]
+
+    # Local tier
+
+    def _local_key(self, key, version):
+        return self.make_key(key, version=version)
+
+    def _local_get(self, local_key):
+        tier = self._tier
+        with tier.lock:
+            entry = tier.entries.get(local_key)
+            if entry is None:
+                return _MISSING
+            expires, value, _ = entry
+            if expires < time.time():
+                self._local_delete(local_key)
+                return _MISSING
+            tier.entries.move_to_end(local_key)
+        if isinstance(value, Pickled):
+            return pickle.loads(value)
+        return value
+
+    def _local_set(self, local_key, value):
+        data = Pickled(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        size = len(data)
+        if is_immutable(value):
+            data = value
+        tier = self._tier
+        with tier.lock:
+            self._local_delete(local_key)
+            if size > self.max_bytes:
+                return
+            while tier.entries and tier.size + size > self.max_bytes:
+                oldest = next(iter(tier.entries))
+                self._local_delete(oldest)
+            tier.entries[local_key] = (time.time() + self.local_timeout,
+                                       data, size)
+            tier.size += size
+
+    def _local_delete(self, local_key):
+        tier = self._tier
+        with tier.lock:
+            entry = tier.entries.pop(local_key, None)
+            if entry:
+                tier.size -= entry[2]
+
+    def _local_clear(self):
+        tier = self._tier
+        with tier.lock:
+            tier.entries.clear()
+            tier.size = 0
+
+    # Generations
+
+    def _sync_generation(self):
+        """Drop the local tier if another process has invalidated"""
+        tier = self._tier
+        now = time.time()
+        if now < tier.next_check:
+            return
+        tier.next_check = now + self.generation_interval
+        generation = self.shared.get(self.GENERATION_KEY, 0)
+        if generation != tier.generation:
+            self._local_clear()
+            tier.generation = generation
+
+    def invalidate(self):
+        """Signal all processes to drop their local tiers"""
+        self.shared.add(self.GENERATION_KEY, 0, None)
+        try:
+            generation = self.shared.incr(self.GENERATION_KEY)
+        except ValueError:  # evicted between the add and incr
+            self.shared.set(self.GENERATION_KEY, 1, None)
+            generation = 1
+        self._local_clear()
+        self._tier.generation = generation
+
+    # Cache API
+
+    def get(self, key, default=None, version=None):
+        self._sync_generation()
+        local_key = self._local_key(key, version)
+        value = self._local_get(local_key)
+        if value is _MISSING:
+            value = self.shared.get(key, _MISSING, version=version)
+            if value is _MISSING:
+                return default
+            self._local_set(local_key, value)
+        return value
+
+    def get_many(self, keys, version=None):
+        self._sync_generation()
+        found, remote = {}, []
+        for key in keys:
+            value = self._local_get(self._local_key(key, version))
+            if value is _MISSING:
+                remote.append(key)
+            else:
+                found[key] = value
+        if remote:
+            fetched = self.shared.get_many(remote, version=version)
+            for key, value in fetched.items():
+                self._local_set(self._local_key(key, version), value)
+            found.update(fetched)
+        return found
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.shared.set(key, value, timeout, version=version)
+        self._local_set(self._local_key(key, version), value)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        self.shared.set_many(data, timeout, version=version)
+        for key, value in data.items():
+            self._local_set(self._local_key(key, version), value)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self.shared.add(key, value, timeout, version=version)
+        if added:
+            self._local_set(self._local_key(key, version), value)
+        return added
+
+    def incr(self, key, delta=1, version=None):
+        # Counters must be consistent across processes; skip the local tier
+        self._local_delete(self._local_key(key, version))
+        return self.shared.incr(key, delta, version=version)
+
+    def delete(self, key, version=None):
+        self.shared.delete(key, version=version)
+        self.invalidate()
+
+    def delete_many(self, keys, version=None):
+        self.shared.delete_many(keys, version=version)
+        self.invalidate()
+
+    def has_key(self, key, version=None):
+        return self.get(key, _MISSING, version=version) is not _MISSING
+
+    def clear(self):
+        self.shared.clear()
+        self.invalidate()
+
+
+class LRUFileBasedCache(FileBasedCache):
+    """File based cache which may be shared by all of the workers on a node.
+    Used when memcached is not configured. Reads refresh a file's mtime;
+    when the directory exceeds MAX_BYTES (or MAX_ENTRIES), the least
+    recently used files are removed until it is back under CULL_TO (a
+    fraction of those bounds)"""
+    def __init__(self, dir, params):
+        super(LRUFileBasedCache, self).__init__(dir, params)
+        options = params.get('OPTIONS', {})
+        self._max_bytes = int(options.get('MAX_BYTES', 64 * 1024 * 1024))
+        self._cull_to = float(options.get('CULL_TO', 0.9))
+
+    def get(self, key, default=None, version=None):
+        value = super(LRUFileBasedCache, self).get(key, default, version)
+        if value is not default:
+            try:
+                os.utime(self._key_to_file(key, version), None)
+            except OSError:     # removed by another worker
+                pass
+        return value
+
+    def _cull(self):
+        entries = []
+        for fname in self._list_cache_files():
+            try:
+                stat = os.stat(fname)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, fname))
+        total = sum(size for _, size, _ in entries)
+        if total < self._max_bytes and len(entries) < self._max_entries:
+            return
+
+        max_bytes = self._max_bytes * self._cull_to
+        max_entries = self._max_entries * self._cull_to
+        remaining = len(entries)
+        for _, size, fname in sorted(entries):
+            if total <= max_bytes and remaining <= max_entries:
+                break
+            self._delete(fname)
+            total -= size
+            remaining -= 1
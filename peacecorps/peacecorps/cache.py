@@ -1,12 +1,285 @@
+from calendar import timegm
+import copy
+from datetime import datetime
+from functools import wraps
+import gzip
+import hashlib
+import re
+
 from django.conf import settings
-from django.views.decorators.cache import cache_page
+from django.core.cache import caches
+from django.http import (
+    HttpResponse, HttpResponseNotModified, QueryDict)
+from django.http.response import HttpResponseBase
+from django.middleware.cache import CacheMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.decorators import decorator_from_middleware_with_args
+from django.utils.http import (
+    http_date, parse_etags, parse_http_date_safe, quote_etag)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# Query parameters which change the rendered project/fund pages
+DONATE_PAGE_PARAMS = ('payment_status',)
+# Present only when a donor is sent back to fix an invalid amount. These
+# pages are unique per donor, so there is no point in caching them
+FORM_ERROR_PARAMS = ('payment_amount', 'nonce')
+# Query parameters accepted by the project/campaign list APIs. `fields` is a
+# comma-separated set
+LIST_API_PARAMS = ('country', 'cursor', 'fields', 'funded', 'page_size')
+
+
+def _accepts(request, encoding):
+    """Does the client accept this content-encoding? Encodings explicitly
+    given a q of zero are rejected"""
+    header = request.META.get('HTTP_ACCEPT_ENCODING', '')
+    match = re.search(r'(?:^|,)\s*' + re.escape(encoding)
+                      + r'\s*(;\s*q=(\d+(?:\.\d*)?|\.\d+))?', header)
+    return bool(match) and (not match.group(2) or float(match.group(2)) > 0)
+
+
+class PrecompressedResponse(object):
+    """Picklable stand-in for a cached response. The body is compressed
+    once, when stored, with each supported encoding; cache hits send these
+    bytes directly. Never modified once created, so a process' cache may
+    share one instance between requests"""
+    cache_immutable = True
+
+    def __init__(self, response):
+        self.status_code = response.status_code
+        self.headers = [(key, value) for key, value in response.items()
+                        if key.lower() not in ('content-length',
+                                               'content-encoding')]
+        self.cookies = response.cookies
+        content = response.content
+        self.bodies = {'gzip': gzip.compress(content)}
+        if brotli:
+            self.bodies['br'] = brotli.compress(content)
+
+    def encoding_for(self, request):
+        for encoding in ('br', 'gzip'):
+            if encoding in self.bodies and _accepts(request, encoding):
+                return encoding
+
+    def as_response(self, request):
+        encoding = self.encoding_for(request)
+        if encoding:
+            content = self.bodies[encoding]
+        else:   # rare; only clients which don't support gzip
+            content = gzip.decompress(self.bodies['gzip'])
+        response = HttpResponse(content, status=self.status_code)
+        for key, value in self.headers:
+            response[key] = value
+        response.cookies = copy.deepcopy(self.cookies)
+        if encoding:
+            response['Content-Encoding'] = encoding
+        response['Content-Length'] = str(len(content))
+        patch_vary_headers(response, ('Accept-Encoding',))
+        return response
+
+
+class PrecompressingCache(object):
+    """Wraps a cache backend, storing responses as PrecompressedResponses.
+    Other values (e.g. the header lists used to build cache keys) are passed
+    through"""
+    def __init__(self, cache):
+        self.cache = cache
+
+    def get(self, key, default=None):
+        return self.cache.get(key, default)
+
+    def set(self, key, value, timeout=None):
+        if isinstance(value, HttpResponseBase):
+            value._precompressed = PrecompressedResponse(value)
+            value = value._precompressed
+        return self.cache.set(key, value, timeout)
+
+
+class PrecompressedCacheMiddleware(CacheMiddleware):
+    """Cache middleware which stores gzip (and, if available, brotli)
+    encoded bodies. Uncompressed bodies are neither stored nor compressed
+    per request. Note that the Vary: Accept-Encoding header is added after
+    the cache key is learned, so one entry serves all encodings"""
+    @property
+    def cache(self):
+        """Looked up per request, as cache connections are per thread (and
+        so that overriding CACHES, e.g. in freeze_site, takes effect)"""
+        return PrecompressingCache(caches[self.cache_alias])
+
+    @cache.setter
+    def cache(self, value):
+        """CacheMiddleware.__init__ assigns the cache; ignore it"""
+
+    def for_request(self, request):
+        """Pages wrapped in `conditional` are cached per version of their
+        content (the request's page_version), so that once an edit changes
+        the validators, the body rendered before the edit is not served.
+        Returns a copy of this middleware with that key prefix; the instance
+        is shared between requests, so is never modified"""
+        version = getattr(request, 'page_version', None)
+        if not version:
+            return self
+        middleware = copy.copy(self)
+        middleware.key_prefix = '%s:%s' % (self.key_prefix, version)
+        return middleware
+
+    def process_request(self, request):
+        cached = super(PrecompressedCacheMiddleware,
+                       self.for_request(request)).process_request(request)
+        if isinstance(cached, PrecompressedResponse):
+            return cached.as_response(request)
+        return cached
+
+    def process_response(self, request, response):
+        response = super(PrecompressedCacheMiddleware,
+                         self.for_request(request)).process_response(
+            request, response)
+        # If the response was just stored, send the compressed version
+        precompressed = getattr(response, '_precompressed', None)
+        if precompressed:
+            return precompressed.as_response(request)
+        return response
+
+
+def precompressed_cache_page(timeout, cache):
+    """Equivalent to django's cache_page, but storing compressed bodies"""
+    return decorator_from_middleware_with_args(PrecompressedCacheMiddleware)(
+        cache_timeout=timeout, cache_alias=cache)
 
 
 def midterm_cache(*args, **kwargs):
-    return cache_page(settings.CACHES['midterm']['TIMEOUT'],
-                      cache='zipped_midterm')(*args, **kwargs)
+    return precompressed_cache_page(settings.CACHES['midterm']['TIMEOUT'],
+                                    cache='midterm')(*args, **kwargs)
 
 
 def shortterm_cache(*args, **kwargs):
-    return cache_page(settings.CACHES['shortterm']['TIMEOUT'],
-                      cache='zipped_shortterm')(*args, **kwargs)
+    return precompressed_cache_page(settings.CACHES['shortterm']['TIMEOUT'],
+                                    cache='shortterm')(*args, **kwargs)
+
+
+def normalize_query(request, allowed_params, set_params=()):
+    """Strip the request's query string down to the allowed parameters (in a
+    consistent order). As the cache key is derived from the full path, this
+    prevents tracking codes, etc. from creating duplicate cache entries.
+    Values of set_params are comma-separated sets; they are sorted and
+    de-duplicated"""
+    params = QueryDict('', mutable=True)
+    for key in sorted(allowed_params):
+        if key in request.GET:
+            values = request.GET.getlist(key)
+            if key in set_params:
+                values = [','.join(sorted(
+                    {item.strip() for value in values
+                     for item in value.split(',') if item.strip()}))]
+            params.setlist(key, values)
+    request.META['QUERY_STRING'] = params.urlencode()
+    params._mutable = False
+    request.GET = params
+    return request
+
+
+def normalized_cache(timeout, cache_alias, allowed_params=(),
+                     bypass_params=(), set_params=()):
+    """Like precompressed_cache_page, but only the allowed_params are
+    considered when building the cache key. If any of the bypass_params are
+    present, the view is called directly and nothing is stored. See
+    normalize_query for set_params"""
+    def decorator(view_func):
+        cached_view = precompressed_cache_page(timeout, cache_alias)(
+            view_func)
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if any(param in request.GET for param in bypass_params):
+                return view_func(request, *args, **kwargs)
+            normalize_query(request, allowed_params, set_params)
+            return cached_view(request, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def donate_page_cache(view_func):
+    """Midterm cache for the project and fund pages. Form errors (which
+    include a random nonce) skip the cache entirely"""
+    return normalized_cache(
+        settings.CACHES['midterm']['TIMEOUT'], 'midterm',
+        allowed_params=DONATE_PAGE_PARAMS,
+        bypass_params=FORM_ERROR_PARAMS)(view_func)
+
+
+def list_api_cache(view_func):
+    """Shortterm cache for the list APIs, keyed on their (normalized)
+    parameters, including the requested field set"""
+    return normalized_cache(
+        settings.CACHES['shortterm']['TIMEOUT'], 'shortterm',
+        allowed_params=LIST_API_PARAMS, set_params=('fields',))(view_func)
+
+
+def fingerprint(*values):
+    """Short, stable digest of the values which affect a cached fragment. Used
+    as a version so that editing one object invalidates only its fragments"""
+    return hashlib.md5(repr(values).encode('utf-8')).hexdigest()
+
+
+def conditional(versions_func):
+    """Answer conditional GETs (If-None-Match/If-Modified-Since) before the
+    view (or cache) is consulted. versions_func is called with the view's
+    arguments and should cheaply return a tuple of values (timestamps,
+    counts, etc.) which change whenever the page would. The ETag is derived
+    from these values and Last-Modified from the most recent timestamp. The
+    values are also recorded as the request's page_version, which the page
+    cache includes in its keys, so the body served always matches the
+    validators.
+
+    Django's condition decorator is not used as it will not replace the
+    Last-Modified header set by the cache middleware"""
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view_func(request, *args, **kwargs)
+            versions = versions_func(request, *args, **kwargs)
+            if versions is None:
+                return view_func(request, *args, **kwargs)
+
+            request.page_version = fingerprint(versions)
+            etag = fingerprint(request.get_full_path(), versions)
+            timestamps = [timegm(v.utctimetuple()) for v in versions
+                          if isinstance(v, datetime)]
+            last_modified = max(timestamps) if timestamps else None
+
+            if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+            if_modified_since = parse_http_date_safe(
+                request.META.get('HTTP_IF_MODIFIED_SINCE', ''))
+            if if_none_match:
+                # Compressed responses have a suffix on their ETag, which
+                # only matches if the client still accepts that encoding
+                matches = [tag for tag in parse_etags(if_none_match)
+                           if tag == etag or (
+                               tag.startswith(etag + '-')
+                               and _accepts(request, tag[len(etag) + 1:]))]
+                not_modified = if_none_match == '*' or bool(matches)
+                if matches:
+                    etag = matches[0]
+            else:
+                not_modified = bool(last_modified and if_modified_since
+                                    and last_modified <= if_modified_since)
+
+            if not_modified:
+                response = HttpResponseNotModified()
+            else:
+                response = view_func(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+                if response.has_header('Content-Encoding'):
+                    etag += '-' + response['Content-Encoding']
+            response['ETag'] = quote_etag(etag)
+            if last_modified:
+                response['Last-Modified'] = http_date(last_modified)
+            return response
+        return wrapper
+    return decorator
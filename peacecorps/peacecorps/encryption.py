@@ -0,0 +1,163 @@
+"""Backends for GPGField. Select one via the GPG_BACKEND setting"""
+import logging
+import subprocess
+import threading
+import time
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+import gnupg
+
+try:
+    import pgpy
+except ImportError:     # optional; only needed for InProcessBackend
+    pgpy = None
+
+
+_backends = {}
+
+
+def get_backend():
+    """The configured backend (shared by the process), or None if GPG is not
+    set up"""
+    if not settings.GNUPG_HOME:
+        return None
+    path = settings.GPG_BACKEND
+    if path not in _backends:
+        _backends[path] = import_string(path)()
+    return _backends[path]
+
+
+class GPGError(Exception):
+    pass
+
+
+class GnuPGBackend(object):
+    """Runs the gpg binary for each value encrypted or decrypted"""
+    def __init__(self):
+        self._gpgs = {}
+
+    def gpg(self):
+        """Setting up GPG runs the binary (to check its version), so reuse
+        the instance for each GNUPG_HOME"""
+        if settings.GNUPG_HOME not in self._gpgs:
+            self._gpgs[settings.GNUPG_HOME] = gnupg.GPG(
+                gnupghome=settings.GNUPG_HOME)
+        return self._gpgs[settings.GNUPG_HOME]
+
+    def encrypt(self, plain_text, recipient):
+        """ASCII-armored ciphertext (as bytes) of the given bytes"""
+        return self.gpg().encrypt(plain_text, [recipient]).data
+
+    def decrypt(self, cipher_text):
+        return self.gpg().decrypt(cipher_text).data
+
+
+class InProcessBackend(GnuPGBackend):
+    """Encrypts within the process (via PGPy), producing the same ASCII
+    armored OpenPGP messages as gpg. Each recipient's public key is exported
+    from the GNUPG_HOME keyring once per process. Decryption requires the
+    secret key and is comparatively rare, so it still goes through gpg"""
+    def __init__(self):
+        if pgpy is None:
+            raise ImproperlyConfigured(
+                'PGPy must be installed to use InProcessBackend')
+        super(InProcessBackend, self).__init__()
+        self._keys = {}
+        self._lock = threading.Lock()
+
+    def public_key(self, recipient):
+        cache_key = (settings.GNUPG_HOME, recipient)
+        if cache_key not in self._keys:
+            with self._lock:
+                if cache_key not in self._keys:
+                    armored = self.gpg().export_keys(recipient)
+                    if not armored:
+                        raise ImproperlyConfigured(
+                            'No public key for %s in %s' % (
+                                recipient, settings.GNUPG_HOME))
+                    self._keys[cache_key], _ = pgpy.PGPKey.from_blob(armored)
+        return self._keys[cache_key]
+
+    def encrypt(self, plain_text, recipient):
+        message = pgpy.PGPMessage.new(plain_text)
+        encrypted = self.public_key(recipient).encrypt(message)
+        return str(encrypted).encode('ascii')
+
+
+class BoundedGnuPGBackend(GnuPGBackend):
+    """Bounds concurrency only: each value still costs a gpg process (see
+    InProcessBackend to avoid that), but
+        * at most MAX_PROCESSES gpg processes run at once (per web process);
+          further operations wait for a free slot
+        * a TIMEOUT (seconds) applies to each operation, after which gpg is
+          killed
+        * latency metrics are kept per operation; see metrics()
+    Options are read from GPG_BACKEND_OPTIONS"""
+    def __init__(self):
+        super(BoundedGnuPGBackend, self).__init__()
+        options = settings.GPG_BACKEND_OPTIONS
+        self.timeout = options.get('TIMEOUT', 10)
+        self._slots = threading.BoundedSemaphore(
+            options.get('MAX_PROCESSES', 4))
+        self._lock = threading.Lock()
+        self._metrics = {}
+        self.logger = logging.getLogger('peacecorps.encryption')
+
+    def _record(self, operation, elapsed, outcome):
+        with self._lock:
+            metric = self._metrics.setdefault(operation, {
+                'count': 0, 'seconds': 0.0, 'max_seconds': 0.0,
+                'errors': 0, 'timeouts': 0})
+            metric['count'] += 1
+            metric['seconds'] += elapsed
+            metric['max_seconds'] = max(metric['max_seconds'], elapsed)
+            if outcome != 'ok':
+                metric[outcome] += 1
+
+    def metrics(self):
+        """Per operation: count, total and max seconds, errors and
+        timeouts"""
+        with self._lock:
+            return {op: dict(metric) for op, metric in self._metrics.items()}
+
+    def run(self, operation, args, data):
+        """Run gpg with the given arguments, feeding it data; returns its
+        output. Raises GPGError on failure or timeout"""
+        start = time.time()
+        if not self._slots.acquire(timeout=self.timeout):
+            self._record(operation, time.time() - start, 'timeouts')
+            raise GPGError('No gpg process available for ' + operation)
+        try:
+            remaining = max(self.timeout - (time.time() - start), 0.1)
+            process = subprocess.Popen(
+                ['gpg', '--homedir', settings.GNUPG_HOME, '--batch',
+                 '--no-tty', '--quiet'] + args, stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            try:
+                stdout, stderr = process.communicate(data, timeout=remaining)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                self._record(operation, time.time() - start, 'timeouts')
+                self.logger.error("gpg %s timed out", operation)
+                raise GPGError('gpg timed out during ' + operation)
+        finally:
+            self._slots.release()
+
+        elapsed = time.time() - start
+        if process.returncode != 0:
+            self._record(operation, elapsed, 'errors')
+            self.logger.error("gpg %s failed: %s", operation,
+                              stderr.decode('utf-8', 'replace'))
+            raise GPGError('gpg failed during ' + operation)
+        self._record(operation, elapsed, 'ok')
+        return stdout
+
+    def encrypt(self, plain_text, recipient):
+        return self.run('encrypt', ['--armor', '--encrypt', '--recipient',
+                                    recipient], plain_text)
+
+    def decrypt(self, cipher_text):
+        return self.run('decrypt', ['--decrypt'], cipher_text)
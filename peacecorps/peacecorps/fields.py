@@ -3,11 +3,12 @@ import logging
 
 from django.conf import settings
 from django.db import models
-import gnupg
 
 from sirtrevor import SirTrevorContent
 from sirtrevor.fields import SirTrevorField
 
+from peacecorps.encryption import get_backend
+
 
 class GPGField(models.Field, metaclass=models.SubfieldBase):
     def __init__(self, gpg_check=False, *args, **kwargs):
@@ -22,12 +23,6 @@ class GPGField(models.Field, metaclass=models.SubfieldBase):
         encrypted data (binary) and non-encrypted data (strings)"""
         return 'BinaryField'
 
-    def gpg(self):
-        """Set up GPG; not taxing, so performed on the fly, making it easier
-        to test"""
-        if settings.GNUPG_HOME:
-            return gnupg.GPG(gnupghome=settings.GNUPG_HOME)
-
     def to_python(self, value):
         """Convert ciphertext into plaintext"""
         if value is None:
@@ -39,9 +34,9 @@ class GPGField(models.Field, metaclass=models.SubfieldBase):
         if isinstance(value, memoryview):
             value = value.tobytes()
 
-        gpg = self.gpg()
-        if gpg:
-            return gpg.decrypt(value).data.decode('utf-8')
+        backend = get_backend()
+        if backend:
+            return backend.decrypt(value).decode('utf-8')
         else:   # No GPG; assume the value is plain text
             return value.decode('utf-8')
 
@@ -55,9 +50,9 @@ class GPGField(models.Field, metaclass=models.SubfieldBase):
                                    self.model._meta.object_name,
                                    self.name)
         recipient = settings.GPG_RECIPIENTS[field_path]
-        gpg = self.gpg()
-        if gpg:
-            return gpg.encrypt(plain_text, [recipient]).data
+        backend = get_backend()
+        if backend:
+            return backend.encrypt(plain_text, recipient)
         else:   # No GPG; just stick it in the DB
             return plain_text
 
@@ -1,11 +1,59 @@
 from django import forms
 from django.core.exceptions import ValidationError
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
 from localflavor.us.us_states import STATE_CHOICES
 
-from .models import Country
+from .models import country_registry
 from .templatetags.humanize_cents import humanize_cents
 
 
+class CountrySelect(forms.Select):
+    """The country list is long; its HTML is rendered once per combination
+    of name and attributes, until the countries change. The selected option
+    is marked afterwards, so submitted values do not grow the memo"""
+    def render(self, name, value, attrs=None, choices=()):
+        final_attrs = self.build_attrs(attrs, name=name)
+        key = (name, tuple(sorted(final_attrs.items())), tuple(choices))
+
+        def render():
+            self.choices = [(country.code, str(country))
+                            for country in country_registry.all()]
+            return super(CountrySelect, self).render(
+                name, None, attrs, choices)
+        html = country_registry.rendered(key, render)
+        if value not in (None, ''):
+            option = format_html('<option value="{0}">', value)
+            html = mark_safe(html.replace(
+                option, option[:-1] + ' selected="selected">', 1))
+        return html
+
+
+class CountryChoiceField(forms.ChoiceField):
+    """Equivalent to a ModelChoiceField of countries (by code), but backed by
+    the country registry, so needs no queries"""
+    widget = CountrySelect
+    default_error_messages = {
+        'invalid_choice': 'Select a valid choice. That choice is not one of'
+                          ' the available choices.',
+    }
+
+    def prepare_value(self, value):
+        return getattr(value, 'code', value)
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        country = country_registry.by_code(value)
+        if country is None:
+            raise ValidationError(self.error_messages['invalid_choice'],
+                                  code='invalid_choice')
+        return country
+
+    def validate(self, value):
+        forms.Field.validate(self, value)
+
+
 class DonationPaymentForm(forms.Form):
     """Collect contact information and dedication information about a donor"""
 
@@ -28,8 +76,7 @@ class DonationPaymentForm(forms.Form):
 
     email = forms.EmailField(required=False)
     # Be sure that country is processed before billing_state/zip
-    country = forms.ModelChoiceField(
-        queryset=Country.objects, to_field_name='code', initial='USA')
+    country = CountryChoiceField(initial='USA')
     billing_address = forms.CharField(
         label="Street Address", max_length=80,
         error_messages={'required': 'Please enter a valid address'})
@@ -154,6 +201,10 @@ class DonationAmountForm(forms.Form):
         if account and account.goal:
             self.project_max = account.remaining()
         super(DonationAmountForm, self).__init__(*args, **kwargs)
+        if self.project_max is not None:
+            # in dollars, to match the input; kept current by live totals
+            self.fields['payment_amount'].widget.attrs['max'] = '%.2f' % (
+                self.project_max / 100)
 
     def clean_payment_amount(self):
         """Check for bounds, including account-specific bounds"""
@@ -0,0 +1,55 @@
+from optparse import make_option
+import time
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+
+from peacecorps.encryption import (
+    BoundedGnuPGBackend, GnuPGBackend, InProcessBackend)
+
+
+def measure(backend, plain_text, recipient, iterations):
+    """Seconds taken by each encryption"""
+    backend.encrypt(plain_text, recipient)  # warm up (e.g. load the key)
+    timings = []
+    for _ in range(iterations):
+        start = time.time()
+        backend.encrypt(plain_text, recipient)
+        timings.append(time.time() - start)
+    return sorted(timings)
+
+
+class Command(BaseCommand):
+    help = """Compare the time taken to encrypt a donor info-sized value with
+              each GPGField backend, using the configured GNUPG_HOME and
+              recipient."""
+    option_list = BaseCommand.option_list + (
+        make_option('--iterations', type='int', default=100,
+                    help='Number of values encrypted per backend'),
+        make_option('--size', type='int', default=2048,
+                    help='Bytes per value'),
+    )
+
+    def handle(self, *args, **kwargs):
+        if not settings.GNUPG_HOME:
+            raise CommandError('GNUPG_HOME is not set')
+        recipient = settings.GPG_RECIPIENTS['peacecorps.DonorInfo.xml']
+        iterations = kwargs.get('iterations', 100)
+        if iterations < 1:
+            raise CommandError('--iterations must be at least 1')
+        plain_text = b'x' * kwargs.get('size', 2048)
+
+        for backend_class in (GnuPGBackend, BoundedGnuPGBackend,
+                              InProcessBackend):
+            try:
+                backend = backend_class()
+            except ImproperlyConfigured as err:
+                self.stdout.write('%s: skipped (%s)' % (
+                    backend_class.__name__, err))
+                continue
+            timings = measure(backend, plain_text, recipient, iterations)
+            self.stdout.write('%s: mean %.2fms, p95 %.2fms' % (
+                backend_class.__name__,
+                1000 * sum(timings) / len(timings),
+                1000 * timings[int(len(timings) * .95) - 1]))
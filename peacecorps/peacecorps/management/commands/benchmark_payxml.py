@@ -0,0 +1,55 @@
+from optparse import make_option
+from xml.etree.ElementTree import tostring
+import timeit
+
+from django.core.management.base import BaseCommand, CommandError
+
+from peacecorps import payxml
+
+
+def sample_data():
+    """A collection request for a donor who filled in every field"""
+    data = {
+        'agency_tracking_id': payxml.generate_agency_tracking_id(),
+        'form_id': 'DONORFORM', 'payment_amount': 123456,
+        'payment_type': 'CreditCard', 'payer_name': 'William "Bill" Smith',
+        'billing_address': '1 Main St & Elm', 'billing_city': 'Anytown',
+        'billing_state': 'MD', 'billing_zip': '20852',
+        'success_url': 'https://example.com/success?a=1&b=2',
+        'failure_url': 'https://example.com/failure?a=1&b=2',
+        'phone_number': '1112223333', 'email': 'aaa@example.com',
+        'organization_contact': 'Bob Jones', 'dedication_name': 'Bob',
+        'dedication_contact': 'Patty', 'dedication_email': 'a@example.com',
+        'dedication_type': 'in-memory', 'card_dedication': 'In memory of <3',
+        'dedication_address': '111 Somewhere', 'project_code': '14-54FF',
+        'comments': 'Keep up the good work!', 'information_consent': True}
+    data['agency_memo'] = payxml.generate_agency_memo(data)
+    data.update(payxml.generate_custom_fields(data))
+    return data
+
+
+class Command(BaseCommand):
+    help = """Compare the time taken to serialize a pay.gov collection
+              request via ElementTree and via the precompiled template."""
+    option_list = BaseCommand.option_list + (
+        make_option('--iterations', type='int', default=10000,
+                    help='Number of requests serialized per approach'),
+    )
+
+    def handle(self, *args, **kwargs):
+        iterations = kwargs.get('iterations', 10000)
+        if iterations < 1:
+            raise CommandError('--iterations must be at least 1')
+        data = sample_data()
+        approaches = (
+            ('ElementTree', lambda: tostring(
+                payxml.generate_collection_request(data)).decode('utf-8')),
+            ('template', lambda: payxml.render_collection_request(data)),
+        )
+        if approaches[0][1]() != approaches[1][1]():
+            raise CommandError('Serializations differ')
+
+        for name, serialize in approaches:
+            seconds = timeit.timeit(serialize, number=iterations)
+            self.stdout.write('%s: mean %.1fus' % (
+                name, 1000000 * seconds / iterations))
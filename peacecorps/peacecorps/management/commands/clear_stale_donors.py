@@ -1,18 +1,79 @@
 import logging
+from optparse import make_option
+import time
 
 from django.core.management.base import BaseCommand
+from django.db import connection
 from django.utils import timezone
 
 from peacecorps.models import DonorInfo
 
 
+def delete_batch(cutoff, batch_size):
+    """Delete up to batch_size donor infos which expired by the cutoff
+    (oldest first, via the expires_at index), returning the number deleted.
+    Bypasses the ORM's collector (nothing references DonorInfo), so each
+    batch is a single, short statement"""
+    table = connection.ops.quote_name(DonorInfo._meta.db_table)
+    pk = connection.ops.quote_name(DonorInfo._meta.pk.column)
+    expires_at = connection.ops.quote_name(
+        DonorInfo._meta.get_field('expires_at').column)
+    sql = ('DELETE FROM {table} WHERE {pk} IN ('
+           'SELECT {pk} FROM {table} WHERE {expires_at} <= %s '
+           'ORDER BY {expires_at} LIMIT %s)')
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            sql.format(table=table, pk=pk, expires_at=expires_at),
+            [connection.ops.value_to_db_datetime(cutoff), batch_size])
+        return cursor.rowcount
+    finally:
+        cursor.close()
+
+
+def lag(cutoff):
+    """Seconds since the oldest remaining donor info expired"""
+    oldest = DonorInfo.objects.filter(expires_at__lte=cutoff).order_by(
+        'expires_at').values_list('expires_at', flat=True).first()
+    if oldest is None:
+        return 0
+    return (cutoff - oldest).total_seconds()
+
+
 class Command(BaseCommand):
     help = "Clear donor info structures that have expired"
+    option_list = BaseCommand.option_list + (
+        make_option('--batch-size', type='int', default=500,
+                    help='Donor infos deleted per statement'),
+        make_option('--time-budget', type='float', default=30,
+                    help='Seconds after which no further batches start'),
+    )
 
     def handle(self, *args, **kwargs):
-        queryset = DonorInfo.objects.filter(expires_at__lte=timezone.now())
-        count = queryset.count()
-        if count:
-            queryset.delete()
-            logging.getLogger('peacecorps.clear_stale_donors').info(
-                "Deleted %s expired donor info objects", count)
+        batch_size = kwargs.get('batch_size', 500)
+        time_budget = kwargs.get('time_budget', 30)
+        logger = logging.getLogger('peacecorps.clear_stale_donors')
+        cutoff = timezone.now()
+        start = time.time()
+
+        deleted, batches, exhausted = 0, 0, False
+        while True:
+            count = delete_batch(cutoff, batch_size)
+            deleted += count
+            batches += 1
+            if count < batch_size:
+                break
+            if time.time() - start >= time_budget:
+                exhausted = True
+                break
+        elapsed = time.time() - start
+
+        remaining_lag = lag(cutoff)
+        if deleted:
+            logger.info(
+                "Deleted %s expired donor info objects in %s batches "
+                "(%.2fs); lag %ds", deleted, batches, elapsed, remaining_lag)
+        if exhausted and remaining_lag:
+            logger.warning(
+                "Time budget exhausted; the oldest expired donor info "
+                "expired %ds ago", remaining_lag)
@@ -0,0 +1,163 @@
+import hashlib
+import json
+import logging
+from optparse import make_option
+import os
+import re
+import shutil
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.management.base import BaseCommand, CommandError
+from django.core.urlresolvers import reverse
+from django.test import Client
+from django.test.utils import override_settings
+
+from peacecorps import views
+from peacecorps.cache import fingerprint
+from peacecorps.models import Campaign, Project
+
+
+MANIFEST = '.freeze-manifest.json'
+
+
+def public_pages():
+    """Each public page as a url and a function returning the versions of
+    the content it displays (the same validators used for conditional
+    GETs, but read from the database)"""
+    site_versions = views.uncached_site_versions
+    pages = [
+        (reverse('donate landing'), site_versions),
+        (reverse('donate projects funds'), site_versions),
+        (reverse('donate memorial funds'), site_versions),
+        (reverse('donate faqs'), lambda: views.faq_versions(None)),
+    ]
+    for slug in Campaign.published_objects.values_list('slug', flat=True):
+        pages.append((
+            reverse('donate campaign', kwargs={'slug': slug}),
+            lambda slug=slug: views.fund_versions(None, slug)))
+    for slug in Project.published_objects.values_list('slug', flat=True):
+        pages.append((
+            reverse('donate project', kwargs={'slug': slug}),
+            lambda slug=slug: views.project_versions(None, slug)))
+    return pages
+
+
+def uncached():
+    """Settings under which pages are rendered afresh; a cached page may
+    predate the edit which caused it to be re-rendered"""
+    return override_settings(CACHES={
+        alias: {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}
+        for alias in settings.CACHES})
+
+
+def page_path(url):
+    """Directory-style file name for a url"""
+    return os.path.join(url.strip('/'), 'index.html')
+
+
+class AssetHasher(object):
+    """Rewrites references to static files so that their names include a
+    hash of their contents (allowing far-future caching), copying each
+    hashed file into the output directory"""
+    def __init__(self, output_dir, static_url):
+        self.output_dir = output_dir
+        self.static_url = static_url
+        self.hashed = {}
+        self.pattern = re.compile(
+            r'(?<=["\'(])' + re.escape(settings.STATIC_URL)
+            + r'([^"\'()?#\s]+)')
+
+    def hashed_name(self, path):
+        if path not in self.hashed:
+            source = finders.find(path)
+            if not source:
+                self.hashed[path] = None
+            else:
+                with open(source, 'rb') as f:
+                    digest = hashlib.md5(f.read()).hexdigest()[:12]
+                root, ext = os.path.splitext(path)
+                name = '%s.%s%s' % (root, digest, ext)
+                destination = os.path.join(self.output_dir, 'static', name)
+                if not os.path.exists(destination):
+                    os.makedirs(os.path.dirname(destination), exist_ok=True)
+                    shutil.copyfile(source, destination)
+                self.hashed[path] = name
+        return self.hashed[path]
+
+    def rewrite(self, html):
+        def replace(match):
+            name = self.hashed_name(match.group(1))
+            if name is None:    # not a file we know; leave it alone
+                return match.group(0)
+            return self.static_url + name
+        return self.pattern.sub(replace, html)
+
+
+class Command(BaseCommand):
+    help = """Render the public pages to a directory (for serving from the
+              static bucket/CDN). Only pages whose content has changed since
+              the last export are re-rendered."""
+    args = '<output_dir>'
+    option_list = BaseCommand.option_list + (
+        make_option('--host', default='donate.peacecorps.gov',
+                    help='Host name used when rendering'),
+        make_option('--static-url', default='/static/',
+                    help='URL prefix for the hashed static files'),
+        make_option('--force', action='store_true', default=False,
+                    help='Re-render all pages (e.g. after a deploy)'),
+    )
+
+    def handle(self, *args, **kwargs):
+        if len(args) != 1:
+            raise CommandError('Usage: freeze_site <output_dir>')
+        output_dir = args[0]
+        os.makedirs(output_dir, exist_ok=True)
+        manifest_path = os.path.join(output_dir, MANIFEST)
+        manifest = {}
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+        force = kwargs.get('force')
+
+        client = Client(HTTP_HOST=kwargs.get('host', 'donate.peacecorps.gov'))
+        hasher = AssetHasher(output_dir, kwargs.get('static_url', '/static/'))
+        logger = logging.getLogger('peacecorps.freeze_site')
+        new_manifest, rendered, failed = {}, 0, set()
+
+        for url, versions_func in public_pages():
+            version = fingerprint(versions_func())
+            path = page_path(url)
+            if (not force and manifest.get(url) == version
+                    and os.path.exists(os.path.join(output_dir, path))):
+                new_manifest[url] = version
+                continue
+
+            with uncached():
+                response = client.get(url)
+            if response.status_code != 200:
+                failed.add(url)
+                logger.error("Could not render %s (%s)", url,
+                             response.status_code)
+                continue
+            html = hasher.rewrite(
+                response.content.decode(settings.DEFAULT_CHARSET))
+            full_path = os.path.join(output_dir, path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, 'w', encoding='utf-8') as f:
+                f.write(html)
+            new_manifest[url] = version
+            rendered += 1
+            self.stdout.write('Rendered ' + url)
+
+        # Pages which are no longer public (e.g. unpublished projects)
+        for url in set(manifest) - set(new_manifest) - failed:
+            full_path = os.path.join(output_dir, page_path(url))
+            if os.path.exists(full_path):
+                os.remove(full_path)
+                self.stdout.write('Removed ' + url)
+
+        with open(manifest_path, 'w') as f:
+            json.dump(new_manifest, f, indent=2, sort_keys=True)
+        logger.info("Rendered %s of %s pages (%s failures)", rendered,
+                    len(new_manifest), len(failed))
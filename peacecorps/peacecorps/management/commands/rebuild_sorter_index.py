@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from peacecorps.models import SorterEntry
+
+
+class Command(BaseCommand):
+    help = """
+        Recompute the precomputed sorter entries (country, issue and funded
+        status of each published project) from scratch"""
+
+    def handle(self, *args, **kwargs):
+        SorterEntry.objects.rebuild()
@@ -8,7 +8,8 @@ from django.core.management.base import BaseCommand, CommandError
 import pytz
 
 from peacecorps.models import (
-    Account, Campaign, Country, NAME_LENGTH, Project, SectorMapping)
+    Account, Campaign, country_registry, DonationRollup, NAME_LENGTH, Project,
+    SectorMapping, SorterEntry)
 
 
 def datetime_from(text):
@@ -73,7 +74,7 @@ def create_campaign(account, row, name, acc_type):
     country = None
     if acc_type == Account.COUNTRY:
         country_name = row['LOCATION']
-        country = Country.objects.filter(name__iexact=country_name).first()
+        country = country_registry.by_name(country_name)
         if not country:
             logging.getLogger('peacecorps.sync_accounting').warning(
                 "%s: Country does not exist: %s",
@@ -96,7 +97,7 @@ def create_pcpp(account, row, issue_map):
     """Create and save a project (and account). This is a bit more complex for
     projects, which have goal amounts, etc."""
     country_name = row['LOCATION']
-    country = Country.objects.filter(name__iexact=country_name).first()
+    country = country_registry.by_name(country_name)
     if not country:
         logging.getLogger('peacecorps.sync_accounting').warning(
             "%s: Country does not exist: %s", row['PROJ_NO'], row['LOCATION'])
@@ -143,7 +144,9 @@ def update_account(row, account):
     """If an account already exists, synchronize the transactions and amount"""
     if row['LAST_UPDATED_FROM_PAYGOV']:
         updated_at = datetime_from(row['LAST_UPDATED_FROM_PAYGOV'])
-        account.donations.filter(time__lte=updated_at).delete()
+        accounted_for = account.donations.filter(time__lte=updated_at)
+        DonationRollup.objects.capture(accounted_for)
+        accounted_for.delete()
     if account.category == Account.PROJECT:
         set_balances(row, account)
         account.save()
@@ -195,17 +198,21 @@ def process_rows_in(reader):
 
     issue_map = IssueCache()
     logger = logging.getLogger('peacecorps.sync_accounting')
-    for row in other_rows + project_rows:
-        row = trim_row(row, logger)
-        account = Account.objects.filter(code=row['PROJ_NO']).first()
-        if account:
-            logger.info(
-                'Updating %s, new balance: %s / %s', row['PROJ_NO'],
-                row['UNIDENT_BAL'], row['PROJ_REQ'])
-            update_account(row, account)
-        else:
-            logger.info('Creating %s', row['PROJ_NO'])
-            create_account(row, issue_map)
+    # Balances (and hence funded statuses) have likely changed. Rather than
+    # rebuilding each project's sorter entry as it's saved, rebuild them all
+    # once at the end
+    with SorterEntry.objects.deferred():
+        for row in other_rows + project_rows:
+            row = trim_row(row, logger)
+            account = Account.objects.filter(code=row['PROJ_NO']).first()
+            if account:
+                logger.info(
+                    'Updating %s, new balance: %s / %s', row['PROJ_NO'],
+                    row['UNIDENT_BAL'], row['PROJ_REQ'])
+                update_account(row, account)
+            else:
+                logger.info('Creating %s', row['PROJ_NO'])
+                create_account(row, issue_map)
 
 
 def clean_description(text):
@@ -0,0 +1,76 @@
+from concurrent.futures import ThreadPoolExecutor
+import logging
+from optparse import make_option
+import time
+
+from django.core.management.base import BaseCommand
+from django.core.urlresolvers import reverse
+from django.db import connection
+from django.test import Client
+
+from peacecorps.models import Campaign, Project
+
+
+def public_urls():
+    """All of the cached, public pages. The high-traffic pages come first so
+    that they are warmed soonest"""
+    urls = [reverse('donate landing'), reverse('donate projects funds'),
+            reverse('donate memorial funds'), reverse('donate faqs')]
+    for slug in Campaign.published_objects.values_list('slug', flat=True):
+        urls.append(reverse('donate campaign', kwargs={'slug': slug}))
+    for slug in Project.published_objects.values_list('slug', flat=True):
+        urls.append(reverse('donate project', kwargs={'slug': slug}))
+        urls.append(reverse('api:project_detail', kwargs={'slug': slug}))
+    return urls
+
+
+def fetch(url, host):
+    """Render a single url through the full request stack (so that the
+    cache decorators fill their caches). Returns the url, status code, and
+    time taken (in seconds)"""
+    client = Client(HTTP_HOST=host)
+    start = time.time()
+    response = client.get(url)
+    return url, response.status_code, time.time() - start
+
+
+def fetch_in_thread(url, host):
+    """Worker threads receive their own database connections; be sure to
+    close them"""
+    try:
+        return fetch(url, host)
+    finally:
+        connection.close()
+
+
+class Command(BaseCommand):
+    help = """Fill the page caches by requesting each public page. Useful
+              after a deploy, a cache restart, or an accounting sync."""
+    option_list = BaseCommand.option_list + (
+        make_option('--host', default='donate.peacecorps.gov',
+                    help='Host name used when building cache keys'),
+        make_option('--workers', type='int', default=4,
+                    help='Maximum number of concurrent requests'),
+    )
+
+    def handle(self, *args, **kwargs):
+        host = kwargs.get('host', 'donate.peacecorps.gov')
+        workers = kwargs.get('workers', 4)
+        urls = public_urls()
+
+        start = time.time()
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(
+                    lambda url: fetch_in_thread(url, host), urls))
+        else:
+            results = [fetch(url, host) for url in urls]
+
+        failures = 0
+        for url, status, duration in results:
+            if status != 200:
+                failures += 1
+            self.stdout.write('%s %6.3fs %s' % (status, duration, url))
+        logging.getLogger('peacecorps.warm_cache').info(
+            "Warmed %s urls in %.2fs (%s failures)", len(results),
+            time.time() - start, failures)
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from collections import defaultdict
+
+from django.db import models, migrations
+from django.db.models import Sum
+
+
+def populate(apps, schema_editor):
+    """The sorter reads only from this table, so fill it now rather than
+    waiting for rebuild_sorter_index. Mirrors SorterEntryManager.rebuild"""
+    Project = apps.get_model("peacecorps", "Project")
+    Issue = apps.get_model("peacecorps", "Issue")
+    SorterEntry = apps.get_model("peacecorps", "SorterEntry")
+
+    issues_by_campaign = defaultdict(set)
+    for issue_id, campaign_id in Issue.campaigns.through.objects.values_list(
+            'issue_id', 'campaign_id'):
+        issues_by_campaign[campaign_id].add(issue_id)
+    issues_by_project = defaultdict(set)
+    for project_id, campaign_id in Project.campaigns.through.objects.\
+            values_list('project_id', 'campaign_id'):
+        issues_by_project[project_id].update(issues_by_campaign[campaign_id])
+
+    entries, memberships = [], []
+    projects = Project.objects.filter(published=True).select_related(
+        'account', 'country').annotate(
+        donations_total=Sum('account__donations__amount'))
+    for project in projects:
+        account = project.account
+        donated = account.current + (project.donations_total or 0)
+        issue_ids = sorted(issues_by_project[project.pk])
+        entries.append(SorterEntry(
+            project=project, country=project.country,
+            funded=bool(account.goal and donated >= account.goal),
+            volunteername=project.volunteername,
+            filters=','.join(
+                ['country-' + project.country.code]
+                + ['issue-' + str(issue_id) for issue_id in issue_ids])))
+        memberships.extend(
+            SorterEntry.issues.through(sorterentry_id=project.pk,
+                                       issue_id=issue_id)
+            for issue_id in issue_ids)
+    SorterEntry.objects.bulk_create(entries)
+    SorterEntry.issues.through.objects.bulk_create(memberships)
+
+
+def noop(apps, schema_editor):
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('peacecorps', '0012_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SorterEntry',
+            fields=[
+                ('project', models.OneToOneField(related_name='sorter_entry', primary_key=True, serialize=False, to='peacecorps.Project')),
+                ('funded', models.BooleanField(default=False)),
+                ('volunteername', models.CharField(max_length=120)),
+                ('filters', models.TextField()),
+                ('country', models.ForeignKey(related_name='sorter_entries', to='peacecorps.Country')),
+                ('issues', models.ManyToManyField(related_name='sorter_entries', to='peacecorps.Issue')),
+            ],
+            options={
+            },
+            bases=(models.Model,),
+        ),
+        migrations.AlterIndexTogether(
+            name='sorterentry',
+            index_together=set([('funded', 'volunteername', 'project')]),
+        ),
+        migrations.RunPython(populate, noop),
+    ]
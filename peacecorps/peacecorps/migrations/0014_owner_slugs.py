@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+
+
+def populate(apps, schema_editor):
+    """Denormalize the project/fund slugs onto accounts and overflows"""
+    Account = apps.get_model("peacecorps", "Account")
+    Project = apps.get_model("peacecorps", "Project")
+    Campaign = apps.get_model("peacecorps", "Campaign")
+
+    for account in Account.objects.all():
+        owner_model = Project if account.category == 'proj' else Campaign
+        account.owner_slug = owner_model.objects.filter(
+            account=account).values_list('slug', flat=True).first()
+        Account.objects.filter(pk=account.pk).update(
+            owner_slug=account.owner_slug)
+
+    for project in Project.objects.exclude(overflow=None).select_related(
+            'overflow'):
+        Project.objects.filter(pk=project.pk).update(
+            overflow_slug=project.overflow.owner_slug,
+            overflow_kind=project.overflow.category)
+
+
+def noop(apps, schema_editor):
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('peacecorps', '0013_sorterentry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='account',
+            name='owner_slug',
+            field=models.SlugField(max_length=120, blank=True, null=True, editable=False),
+            preserve_default=True,
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='overflow_slug',
+            field=models.SlugField(max_length=120, blank=True, null=True, editable=False),
+            preserve_default=True,
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='overflow_kind',
+            field=models.CharField(max_length=10, blank=True, null=True, editable=False, choices=[('coun', 'Country'), ('sec', 'Sector'), ('mem', 'Memorial'), ('oth', 'Other'), ('proj', 'Project')]),
+            preserve_default=True,
+        ),
+        migrations.RunPython(populate, noop),
+    ]
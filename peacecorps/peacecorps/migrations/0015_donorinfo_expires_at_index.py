@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+import peacecorps.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('peacecorps', '0014_owner_slugs'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='donorinfo',
+            name='expires_at',
+            field=models.DateTimeField(default=peacecorps.models.default_expire_time, db_index=True),
+            preserve_default=True,
+        ),
+    ]
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from collections import defaultdict
+
+from django.db import models, migrations
+from django.utils import timezone
+
+
+def roll_up(apps, schema_editor):
+    """Capture existing donations before they're pruned. Their payment type
+    was not recorded"""
+    Donation = apps.get_model("peacecorps", "Donation")
+    DonationRollup = apps.get_model("peacecorps", "DonationRollup")
+
+    totals = defaultdict(lambda: [0, 0])
+    for account_id, amount, time in Donation.objects.values_list(
+            'account_id', 'amount', 'time'):
+        total = totals[(account_id, timezone.localtime(time).date())]
+        total[0] += amount
+        total[1] += 1
+    DonationRollup.objects.bulk_create(
+        DonationRollup(account_id=account_id, day=day, payment_type='',
+                       amount=amount, count=count)
+        for (account_id, day), (amount, count) in totals.items())
+    Donation.objects.update(rolled_up=True)
+
+
+def noop(apps, schema_editor):
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('peacecorps', '0015_donorinfo_expires_at_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DonationRollup',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('day', models.DateField(db_index=True)),
+                ('payment_type', models.CharField(max_length=20, blank=True)),
+                ('amount', models.PositiveIntegerField(default=0)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('account', models.ForeignKey(related_name='donation_rollups', to='peacecorps.Account')),
+            ],
+            options={
+            },
+            bases=(models.Model,),
+        ),
+        migrations.AlterUniqueTogether(
+            name='donationrollup',
+            unique_together=set([('account', 'day', 'payment_type')]),
+        ),
+        migrations.AddField(
+            model_name='donation',
+            name='rolled_up',
+            field=models.BooleanField(default=False, editable=False),
+            preserve_default=True,
+        ),
+        migrations.RunPython(roll_up, noop),
+    ]
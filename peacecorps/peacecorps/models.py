@@ -1,13 +1,20 @@
 # @todo split this file up, perhaps into smaller apps?
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import timedelta, datetime
 import json
 import tempfile
+import threading
+import time
 import os
 
 from django.conf import settings
+from django.core.cache import caches
 from django.core.urlresolvers import reverse
-from django.db import models
-from django.db.models import Sum
+from django.db import IntegrityError, models, transaction
+from django.db.models import F, Sum
+from django.db.models.signals import (
+    m2m_changed, post_delete, post_init, post_save, pre_delete)
 from django.template.loader import render_to_string as django_render
 from django.utils import timezone
 from django.utils.text import slugify
@@ -23,6 +30,9 @@ from peacecorps.util import svg
 
 
 NAME_LENGTH = 120   # Consistent length for project/account/fund names
+# Cache key of the validators for pages listing content from across the
+# site; see views.site_versions
+SITE_VERSIONS_KEY = 'versions:site'
 ABBR_TO_STATE = dict(USPS_CHOICES)
 
 
@@ -97,6 +107,15 @@ class PublishedManager(models.Manager):
         return super(PublishedManager, self).get_queryset().filter(
             published=True)
 
+    def get_with_account_total(self, **kwargs):
+        """Fetch a project or campaign and its account, summing the account's
+        donations in the same query (so total_donated, funded, etc. need no
+        more). Raises DoesNotExist"""
+        obj = self.get_queryset().select_related('account').annotate(
+            donations_total=Sum('account__donations__amount')).get(**kwargs)
+        obj.account.dynamic_total = obj.donations_total
+        return obj
+
 
 class AccountManager(models.Manager):
     """We more or less always want to aggregate the dynamic number of
@@ -139,6 +158,11 @@ class Account(models.Model):
     category = models.CharField(
         max_length=10, choices=CATEGORY_CHOICES, help_text="The type of \
         account.")
+    # Denormalized slug of the project or fund using this account; see
+    # update_owner_slug
+    owner_slug = models.SlugField(max_length=NAME_LENGTH, blank=True,
+                                  null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     objects = AccountManager()
 
@@ -199,7 +223,7 @@ class Account(models.Model):
 
     def project_or_fund(self):
         """Given an account, we may need to get back to the project or
-        campaign/fund associated"""
+        campaign/fund associated. Prefer owner_slug where it suffices"""
         if self.category == Account.PROJECT:
             return self.project_set.first()
         else:
@@ -270,6 +294,7 @@ class Campaign(models.Model, AbstractHTMLMixin):
     # Unlike projects, funds start published
     published = models.BooleanField(default=True, help_text="If published, \
         the project will be publicly visible on the site.")
+    updated_at = models.DateTimeField(auto_now=True)
 
     objects = models.Manager()
     published_objects = PublishedManager()
@@ -284,7 +309,9 @@ class Campaign(models.Model, AbstractHTMLMixin):
         """Save images to the Media model"""
         imagesave(self.description)
 
+        adding = self._state.adding
         super(Campaign, self).save(*args, **kwargs)
+        owner_saved(self, adding)
 
     def primary_url(self):
         if self.slug:
@@ -298,6 +325,39 @@ class Campaign(models.Model, AbstractHTMLMixin):
         return desc_text
 
 
+def update_owner_slug(owner, previous=(None, None)):
+    """Denormalize a project's or campaign's slug onto its account and onto
+    the projects which overflow into it. previous is the (account, slug)
+    the owner had; if it has moved, its old account no longer has an
+    owner"""
+    previous_account, previous_slug = previous
+    if previous_account and previous_account != owner.account_id:
+        Account._base_manager.filter(
+            pk=previous_account, owner_slug=previous_slug).update(
+            owner_slug=None)
+        Project.objects.filter(
+            overflow=previous_account, overflow_slug=previous_slug).update(
+            overflow_slug=None, updated_at=timezone.now())
+    Account._base_manager.filter(pk=owner.account_id).update(
+        owner_slug=owner.slug)
+    account = getattr(owner, owner._meta.get_field('account').get_cache_name(),
+                      None)
+    if account:
+        account.owner_slug = owner.slug
+    Project.objects.filter(overflow=owner.account_id).exclude(
+        overflow_slug=owner.slug).update(overflow_slug=owner.slug,
+                                         updated_at=timezone.now())
+
+
+def owner_saved(owner, adding):
+    """Update the denormalized slugs if the owner is new or its account or
+    slug changed"""
+    current = (owner.account_id, owner.slug)
+    if adding or current != owner._saved_owner:
+        update_owner_slug(owner, owner._saved_owner)
+        owner._saved_owner = current
+
+
 class SectorMapping(models.Model):
     """When importing data from the accounting software, a 'sector' field
     indicates how individual projects should be categorized. The text used in
@@ -318,6 +378,86 @@ class Country(models.Model):
         return '%s (%s)' % (self.name, self.code)
 
 
+class CountryRegistry(object):
+    """An in-process copy of the (small, rarely edited) Country table, so
+    that forms, the sorter and imports may look up countries without
+    queries. Edits bump a generation counter in the midterm cache; each
+    process checks the counter at most once per CHECK_INTERVAL and reloads
+    when it sees a new generation. The counter is bumped before the edit
+    commits, so another process may reload the old rows under the new
+    generation; snapshots are therefore also reloaded after MAX_AGE"""
+    GENERATION_KEY = 'countries:generation'
+    CHECK_INTERVAL = 2
+    MAX_AGE = 300
+
+    def __init__(self):
+        self._snapshot = None
+
+    def _load(self, generation):
+        countries = list(Country.objects.order_by('pk'))
+        now = time.time()
+        snapshot = {'generation': generation, 'countries': countries,
+                    'by_pk': {c.pk: c for c in countries},
+                    'by_code': {}, 'by_name': {}, 'rendered': {},
+                    'next_check': now + self.CHECK_INTERVAL,
+                    'expires': now + self.MAX_AGE}
+        for country in countries:   # the first of any duplicates wins
+            snapshot['by_code'].setdefault(country.code, country)
+            snapshot['by_name'].setdefault(country.name.lower(), country)
+        self._snapshot = snapshot
+        return snapshot
+
+    def _current(self):
+        snapshot = self._snapshot
+        now = time.time()
+        if snapshot is not None and now < snapshot['next_check']:
+            return snapshot
+        generation = caches['midterm'].get(self.GENERATION_KEY, 0)
+        if (snapshot is None or snapshot['generation'] != generation
+                or now >= snapshot['expires']):
+            return self._load(generation)
+        snapshot['next_check'] = now + self.CHECK_INTERVAL
+        return snapshot
+
+    def all(self):
+        return self._current()['countries']
+
+    def by_pk(self, pk):
+        """Ids come from rows referencing the Country table, so a miss means
+        this snapshot predates the country; reload it from the database"""
+        snapshot = self._current()
+        if pk not in snapshot['by_pk']:
+            snapshot = self._load(snapshot['generation'])
+        return snapshot['by_pk'].get(pk)
+
+    def by_code(self, code):
+        return self._current()['by_code'].get(code)
+
+    def by_name(self, name):
+        """Case insensitive"""
+        return self._current()['by_name'].get(name.lower())
+
+    def rendered(self, key, render):
+        """Memoize HTML derived from the countries (e.g. a select box) until
+        they next change"""
+        rendered = self._current()['rendered']
+        if key not in rendered:
+            rendered[key] = render()
+        return rendered[key]
+
+    def invalidate(self):
+        self._snapshot = None
+        cache = caches['midterm']
+        cache.add(self.GENERATION_KEY, 0, None)
+        try:
+            cache.incr(self.GENERATION_KEY)
+        except ValueError:  # evicted between the add and incr
+            cache.set(self.GENERATION_KEY, 1, None)
+
+
+country_registry = CountryRegistry()
+
+
 class FeaturedCampaign(models.Model):
     campaign = models.ForeignKey('Campaign', to_field='account',
                                  limit_choices_to={'published': True},
@@ -385,6 +525,7 @@ class Media(models.Model):
         help_text="If the media is a video or audio recording, transcribe it \
         for users with disabilities.",
         blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = 'Media'
@@ -451,6 +592,13 @@ class Project(models.Model, AbstractHTMLMixin):
         help_text="The fund donors will be encourage to contribute to if the \
         project is fully funded. By default, this is the project's \
         sector fund.")
+    # Denormalized from the overflow account, so that linking to it needs no
+    # queries; see save() and update_owner_slug
+    overflow_slug = models.SlugField(max_length=NAME_LENGTH, blank=True,
+                                     null=True, editable=False)
+    overflow_kind = models.CharField(max_length=10, blank=True, null=True,
+                                     choices=Account.CATEGORY_CHOICES,
+                                     editable=False)
     volunteername = models.CharField(max_length=NAME_LENGTH,
         verbose_name="Volunteer Name",
         help_text="The name of the PCV requesting funds for the project.")
@@ -469,6 +617,7 @@ class Project(models.Model, AbstractHTMLMixin):
     # Unlike funds, projects start unpublished
     published = models.BooleanField(default=False, help_text="If selected, \
         the project will be visible to the public.")
+    updated_at = models.DateTimeField(auto_now=True)
 
     objects = models.Manager()
     published_objects = PublishedManager()
@@ -489,7 +638,18 @@ class Project(models.Model, AbstractHTMLMixin):
         """Save images to the Media model"""
         imagesave(self.description)
 
+        adding = self._state.adding
+        if not self.overflow_id:
+            self.overflow_kind, self.overflow_slug = None, None
+        elif (adding or self.overflow_id != self._saved_overflow_id
+              or not self.overflow_slug):
+            self.overflow_kind = self.overflow.category
+            self.overflow_slug = self.overflow.owner_slug or getattr(
+                self.overflow.project_or_fund(), 'slug', None)
+
         super(Project, self).save(*args, **kwargs)
+        self._saved_overflow_id = self.overflow_id
+        owner_saved(self, adding)
 
     def issue(self, check_cache=True):
         """Find the "first" issue that this project is associated with, if
@@ -504,6 +664,19 @@ class Project(models.Model, AbstractHTMLMixin):
                 self._issue = None
         return self._issue
 
+    def overflow_url(self):
+        """Page of the fund (or project) donors are directed to once this
+        project is funded"""
+        if not self.overflow_id:
+            return None
+        slug, kind = self.overflow_slug, self.overflow_kind
+        if not slug:    # not yet denormalized
+            slug = self.overflow.project_or_fund().slug
+            kind = self.overflow.category
+        if kind == Account.PROJECT:
+            return reverse('donate project', kwargs={'slug': slug})
+        return reverse('donate campaign', kwargs={'slug': slug})
+
     def volunteer_statename(self):
         """Look up the volunteer's state name by abbreviation. If it
         can't be found, just use the abbreviation"""
@@ -538,6 +711,7 @@ class Issue(models.Model):
         Campaign, limit_choices_to={'campaigntype': Campaign.SECTOR},
         help_text="Sector funds to associate as being under this campaign.",
         verbose_name="Sector Funds")
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
@@ -575,6 +749,99 @@ class Issue(models.Model):
             super(Issue, self).save(*args, **kwargs)
 
 
+class SorterEntryManager(models.Manager):
+    # Per thread, so that deferring (e.g. in sync_accounting) doesn't affect
+    # requests being served concurrently
+    _deferral = threading.local()
+
+    @contextmanager
+    def deferred(self):
+        """Skip the rebuilds of individual projects (e.g. as each is saved)
+        within the block; everything is rebuilt once at its end"""
+        self._deferral.active = True
+        try:
+            yield
+        finally:
+            self._deferral.active = False
+        self.rebuild()
+
+    def rebuild(self, project_ids=None):
+        """Recompute the entries for the given projects (all projects, by
+        default). Unpublished projects lose their entries"""
+        if project_ids is not None and getattr(self._deferral, 'active',
+                                               False):
+            return
+        projects = Project.published_objects.select_related('country')
+        stale = self.all()
+        links = Project.campaigns.through.objects.all()
+        if project_ids is not None:
+            projects = projects.filter(pk__in=project_ids)
+            stale = stale.filter(project__in=project_ids)
+            links = links.filter(project__in=project_ids)
+        projects = list(projects)
+        accounts = Account.objects.in_bulk(
+            [project.account_id for project in projects])
+
+        issues_by_campaign = defaultdict(set)
+        for issue_id, campaign_id in Issue.campaigns.through.objects.\
+                values_list('issue_id', 'campaign_id'):
+            issues_by_campaign[campaign_id].add(issue_id)
+        issues_by_project = defaultdict(set)
+        for project_id, campaign_id in links.values_list('project_id',
+                                                         'campaign_id'):
+            issues_by_project[project_id].update(
+                issues_by_campaign[campaign_id])
+
+        entries, memberships = [], []
+        for project in projects:
+            issue_ids = sorted(issues_by_project[project.pk])
+            entries.append(self.model(
+                project=project, country=project.country,
+                funded=accounts[project.account_id].funded(),
+                volunteername=project.volunteername,
+                filters=','.join(
+                    ['country-' + project.country.code]
+                    + ['issue-' + str(issue_id) for issue_id in issue_ids])))
+            memberships.extend(
+                SorterEntry.issues.through(sorterentry_id=project.pk,
+                                           issue_id=issue_id)
+                for issue_id in issue_ids)
+
+        with transaction.atomic():
+            stale.delete()
+            self.bulk_create(entries)
+            SorterEntry.issues.through.objects.bulk_create(memberships)
+
+    def update_funded(self, account):
+        """Refresh the funded flag of the account's projects' entries. This is
+        a single UPDATE, so (unlike a rebuild) it can't conflict with another
+        donation and fail the payment's transaction"""
+        self.filter(project__account=account).update(funded=account.funded())
+
+
+class SorterEntry(models.Model):
+    """Precomputed membership of each published project in the sorter's
+    filters (country, issues, funded status). Derived data; see
+    SorterEntryManager.rebuild"""
+    project = models.OneToOneField(Project, primary_key=True,
+                                   related_name='sorter_entry')
+    country = models.ForeignKey(Country, related_name='sorter_entries')
+    issues = models.ManyToManyField(Issue, related_name='sorter_entries')
+    funded = models.BooleanField(default=False)
+    # Denormalized for ordering
+    volunteername = models.CharField(max_length=NAME_LENGTH)
+    # e.g. "country-KE,issue-1,issue-4", as used by the sorter's markup
+    filters = models.TextField()
+
+    objects = SorterEntryManager()
+
+    class Meta:
+        index_together = (('funded', 'volunteername', 'project'),)
+
+    def __str__(self):
+        return self.filters
+
+
 def default_expire_time():
     return timezone.now() + timedelta(minutes=settings.DONOR_EXPIRE_AFTER)
 
@@ -585,7 +852,8 @@ class DonorInfo(models.Model):
     agency_tracking_id = models.CharField(max_length=21, primary_key=True)
     account = models.ForeignKey(Account, related_name='donorinfos')
     xml = GPGField()
-    expires_at = models.DateTimeField(default=default_expire_time)
+    expires_at = models.DateTimeField(default=default_expire_time,
+                                      db_index=True)
 
 
 class Donation(models.Model):
@@ -593,6 +861,100 @@ class Donation(models.Model):
     account = models.ForeignKey(Account, related_name='donations')
     amount = models.PositiveIntegerField()
     time = models.DateTimeField(auto_now_add=True)
+    # Whether this donation is counted in DonationRollup
+    rolled_up = models.BooleanField(default=False, editable=False)
+
+
+class DonationRollupQuerySet(models.QuerySet):
+    def between(self, start=None, end=None):
+        """Restrict to days within this (inclusive) range"""
+        queryset = self
+        if start:
+            queryset = queryset.filter(day__gte=start)
+        if end:
+            queryset = queryset.filter(day__lte=end)
+        return queryset
+
+    def daily_totals(self):
+        """Dicts of day, total (cents) and donations (count), in order of
+        day. Combines accounts and payment types; filter first to restrict
+        them"""
+        return self.values('day').annotate(
+            total=Sum('amount'), donations=Sum('count')).order_by('day')
+
+    def cumulative_totals(self):
+        """(day, running total in cents) pairs, e.g. for progress charts"""
+        running, result = 0, []
+        for row in self.daily_totals():
+            running += row['total']
+            result.append((row['day'], running))
+        return result
+
+    def totals(self):
+        """Dict of total (cents) and donations (count)"""
+        totals = self.aggregate(total=Sum('amount'), donations=Sum('count'))
+        return {key: value or 0 for key, value in totals.items()}
+
+
+class DonationRollupManager(
+        models.Manager.from_queryset(DonationRollupQuerySet)):
+    def record(self, account_id, payment_type, amount, day=None, count=1):
+        """Add donations to the day's (default: today's) totals. Safe to call
+        concurrently; the row is created if need be. If another request
+        creates it first, the update is retried once; a second
+        IntegrityError is raised"""
+        day = day or timezone.localtime(timezone.now()).date()
+        key = {'account_id': account_id, 'day': day,
+               'payment_type': payment_type[:20]}
+        for attempt in range(2):
+            with transaction.atomic():
+                if self.filter(**key).update(amount=F('amount') + amount,
+                                             count=F('count') + count):
+                    return
+                try:
+                    with transaction.atomic():
+                        self.create(amount=amount, count=count, **key)
+                    return
+                except IntegrityError:
+                    # created concurrently; retry the update, once
+                    if attempt:
+                        raise
+
+    def capture(self, donations):
+        """Roll up any of these donations which haven't been (i.e. weren't
+        recorded via pay.gov's results callback), so that deleting them
+        loses no history. Their payment type is unknown"""
+        totals = defaultdict(lambda: [0, 0])
+        pks = []
+        for pk, account_id, amount, donated_at in donations.filter(
+                rolled_up=False).values_list(
+                'pk', 'account_id', 'amount', 'time'):
+            total = totals[(account_id,
+                            timezone.localtime(donated_at).date())]
+            total[0] += amount
+            total[1] += 1
+            pks.append(pk)
+        with transaction.atomic():
+            for (account_id, day), (amount, count) in totals.items():
+                self.record(account_id, '', amount, day, count)
+            Donation.objects.filter(pk__in=pks).update(rolled_up=True)
+
+
+class DonationRollup(models.Model):
+    """Daily donation totals per account and payment type. Donation rows are
+    deleted once the accounting system catches up with them; these remain,
+    so reports needn't scan donations. Unlike Donation, these include ACH
+    transactions"""
+    account = models.ForeignKey(Account, related_name='donation_rollups')
+    day = models.DateField(db_index=True)
+    payment_type = models.CharField(max_length=20, blank=True)
+    amount = models.PositiveIntegerField(default=0)
+    count = models.PositiveIntegerField(default=0)
+
+    objects = DonationRollupManager()
+
+    class Meta:
+        unique_together = ('account', 'day', 'payment_type')
 
 
 class Vignette(models.Model):
@@ -627,6 +989,7 @@ class FAQ(models.Model):
     slug = models.SlugField(max_length=50, help_text="The URL this \
         should exist at.", blank=True,
                             null=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta(object):
         ordering = ('order', )
@@ -641,12 +1004,35 @@ class FAQ(models.Model):
             self.slug = slugify(self.question)[:50]
         super(FAQ, self).save(*args, **kwargs)
 
+
+class PayGovAlertManager(models.Manager):
+    CACHE_KEY = 'paygov-alerts'
+    # Edits delete the cached alerts, but may race a reload in another
+    # process; this bounds how long a stale list can survive
+    CACHE_TIMEOUT = 5 * 60
+
+    def active(self):
+        """The newest alert whose time window includes now, if any. All of
+        the alerts are cached (until one changes; see paygov_alert_changed)
+        and their windows are checked in memory, so this needs no queries"""
+        cache = caches['midterm']
+        alerts = cache.get(self.CACHE_KEY)
+        if alerts is None:
+            alerts = list(self.get_queryset().order_by('-id'))
+            cache.set(self.CACHE_KEY, alerts, self.CACHE_TIMEOUT)
+        for alert in alerts:
+            if alert.is_active:
+                return alert
+
+
 class PayGovAlert(models.Model):
     """Specifies the message & time window for the Pay.gov service alert"""
     message = HTMLField(help_text="A message for the Pay.gov alert.")
     start_date_time = models.DateTimeField()
     end_date_time = models.DateTimeField()
 
+    objects = PayGovAlertManager()
+
     def __str__(self):
         return "Alert " + str(self.start_date_time.strftime("%m/%d/%y"))
 
@@ -657,3 +1043,131 @@ class PayGovAlert(models.Model):
         return False
 
 
+def owner_post_init(sender, instance, *args, **kwargs):
+    """Remember the account and slug (and overflow) that projects and
+    campaigns were loaded with, so saves can tell whether the denormalized
+    slugs need updating. Deferred fields are not loaded for this"""
+    values = instance.__dict__
+    instance._saved_owner = (values.get('account_id'), values.get('slug'))
+    instance._saved_overflow_id = values.get('overflow_id')
+
+
+def project_post_save(sender, instance, raw=False, *args, **kwargs):
+    """Keep the sorter entry current with the project's country, publication
+    status, etc."""
+    if not raw:
+        SorterEntry.objects.rebuild([instance.pk])
+
+
+def campaign_project_ids(campaign_ids):
+    """Projects in any of these campaigns"""
+    return set(Project.campaigns.through.objects.filter(
+        campaign__in=campaign_ids).values_list('project_id', flat=True))
+
+
+def issue_project_ids(issue):
+    """Projects in any of the issue's campaigns"""
+    return campaign_project_ids(Issue.campaigns.through.objects.filter(
+        issue=issue).values_list('campaign_id', flat=True))
+
+
+def projects_changed(project_ids):
+    """Projects' campaigns or issues have changed. Mark them as modified, so
+    that their pages' validators (see views.project_versions) do too, and
+    recompute their sorter entries"""
+    if project_ids:
+        Project.objects.filter(pk__in=project_ids).update(
+            updated_at=timezone.now())
+        SorterEntry.objects.rebuild(project_ids)
+
+
+def project_campaigns_changed(sender, instance, action, reverse, pk_set=None,
+                              *args, **kwargs):
+    """A project's sector funds determine its issues"""
+    if action == 'pre_clear' and reverse:   # instance is a campaign
+        instance._cleared_project_ids = campaign_project_ids([instance.pk])
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        projects_changed([instance.pk])
+    elif action == 'post_clear':
+        projects_changed(instance.__dict__.pop('_cleared_project_ids', ()))
+    else:
+        projects_changed(pk_set)
+
+
+def issue_campaigns_changed(sender, instance, action, reverse, pk_set=None,
+                            *args, **kwargs):
+    """Changing an issue's sector funds affects all of their projects"""
+    if action == 'pre_clear' and not reverse:   # instance is an issue
+        instance._cleared_project_ids = issue_project_ids(instance)
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if reverse:     # instance is a campaign
+        projects_changed(campaign_project_ids([instance.pk]))
+    elif action == 'post_clear':
+        projects_changed(instance.__dict__.pop('_cleared_project_ids', ()))
+    else:
+        projects_changed(campaign_project_ids(pk_set))
+
+
+def campaign_pre_delete(sender, instance, *args, **kwargs):
+    """Its project links are deleted with it; remember them"""
+    instance._deleted_project_ids = campaign_project_ids([instance.pk])
+
+
+def issue_pre_delete(sender, instance, *args, **kwargs):
+    """Its campaign links are deleted with it; remember their projects"""
+    instance._deleted_project_ids = issue_project_ids(instance)
+
+
+def sorter_post_delete(sender, instance, *args, **kwargs):
+    """Deleting a campaign or issue removes its projects from issues"""
+    projects_changed(instance.__dict__.pop('_deleted_project_ids', ()))
+
+
+def donation_post_save(sender, instance, created, raw=False, *args,
+                       **kwargs):
+    """A donation may fully fund a project. Country and issue membership are
+    unaffected, so only the funded flag is updated"""
+    if created and not raw:
+        SorterEntry.objects.update_funded(
+            Account.objects.get(pk=instance.account_id))
+
+
+def site_content_changed(sender, *args, **kwargs):
+    """The validators of pages listing content from across the site are
+    cached; see views.site_versions"""
+    caches['shortterm'].delete(SITE_VERSIONS_KEY)
+
+
+def country_changed(sender, *args, **kwargs):
+    country_registry.invalidate()
+
+
+def paygov_alert_changed(sender, *args, **kwargs):
+    """Alerts are cached by PayGovAlertManager.active"""
+    caches['midterm'].delete(PayGovAlertManager.CACHE_KEY)
+
+
+post_init.connect(owner_post_init, sender=Project)
+post_init.connect(owner_post_init, sender=Campaign)
+post_save.connect(project_post_save, sender=Project)
+post_save.connect(donation_post_save, sender=Donation)
+pre_delete.connect(campaign_pre_delete, sender=Campaign)
+pre_delete.connect(issue_pre_delete, sender=Issue)
+post_delete.connect(sorter_post_delete, sender=Campaign)
+post_delete.connect(sorter_post_delete, sender=Issue)
+m2m_changed.connect(project_campaigns_changed,
+                    sender=Project.campaigns.through)
+m2m_changed.connect(issue_campaigns_changed, sender=Issue.campaigns.through)
+for _model in (Account, Campaign, Donation, FeaturedCampaign,
+               FeaturedProjectFrontPage, Issue, Media, Project):
+    post_save.connect(site_content_changed, sender=_model)
+    post_delete.connect(site_content_changed, sender=_model)
+m2m_changed.connect(site_content_changed, sender=Project.campaigns.through)
+m2m_changed.connect(site_content_changed, sender=Issue.campaigns.through)
+post_save.connect(country_changed, sender=Country)
+post_delete.connect(country_changed, sender=Country)
+post_save.connect(paygov_alert_changed, sender=PayGovAlert)
+post_delete.connect(paygov_alert_changed, sender=PayGovAlert)
@@ -0,0 +1,81 @@
+import base64
+from collections import OrderedDict
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class OptionalCursorPagination(BasePagination):
+    """Cursor pagination ordered by primary key, which is stable as rows are
+    added and edited. Only used when the client asks for it (by providing a
+    page_size or cursor), so existing clients still receive a full list"""
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    default_page_size = 100
+    max_page_size = 500
+
+    def requested(self, request):
+        return (self.cursor_query_param in request.query_params
+                or self.page_size_query_param in request.query_params)
+
+    def encode_cursor(self, pk):
+        return base64.urlsafe_b64encode(
+            str(pk).encode('ascii')).decode('ascii')
+
+    def decode_cursor(self, cursor):
+        try:
+            return int(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        except (TypeError, ValueError):
+            raise NotFound('Invalid cursor')
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params.get(
+                self.page_size_query_param, self.default_page_size))
+        except ValueError:
+            page_size = self.default_page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    def paginate_queryset(self, queryset, request, view=None, keep=None):
+        """If given, only rows for which keep(row) is true are returned. Rows
+        are then read in batches (of max_page_size) until the page is full,
+        so the next link may lead to an empty page"""
+        if not self.requested(request):
+            return None
+        self.request = request
+        page_size = self.get_page_size(request)
+        cursor = request.query_params.get(self.cursor_query_param)
+        self.last_pk = self.decode_cursor(cursor) if cursor else None
+        queryset = queryset.order_by('pk')
+        batch_size = page_size if keep is None else self.max_page_size
+
+        page = []
+        while True:
+            if self.last_pk is not None:
+                batch = queryset.filter(pk__gt=self.last_pk)
+            else:
+                batch = queryset
+            batch = list(batch[:batch_size + 1])
+            for row in batch:
+                if len(page) == page_size:
+                    self.has_next = True
+                    return page
+                self.last_pk = row.pk
+                if keep is None or keep(row):
+                    page.append(row)
+            if len(batch) <= batch_size:
+                self.has_next = False
+                return page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param,
+            self.encode_cursor(self.last_pk))
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([('next', self.get_next_link()),
+                                     ('results', data)]))
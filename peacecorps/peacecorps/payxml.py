@@ -10,6 +10,65 @@ from peacecorps.models import Account, DonorInfo
 from peacecorps.templatetags.humanize_cents import humanize_cents
 
 
+THANK_YOU_MESSAGE = 'Thank you for your gift to the Peace Corps. Your tax-deductible donation provides crucial support as we build peace and friendship in the world. We\'ll stay in touch but you can also contact us at (202)692-2170 or donate@peacecorps.gov. Thank you again.'
+
+# The request is always the same shape, so render_collection_request just
+# fills in (escaped) values. Must match generate_collection_request
+COLLECTION_REQUEST_TEMPLATE = (
+    '<collection_request>'
+    '<protocol_version value="3.2" />'
+    '<response_message value="Success" />'
+    '<action value="SubmitCollectionInteractive" />'
+    '<interactive_request>'
+    '<success_return_url value="{success_url}" />'
+    '<failure_return_url value="{failure_url}" />'
+    '<allow_account_data_change value="True" />'
+    '<collection_auth>'
+    '<agency_tracking_id value="{agency_tracking_id}" />'
+    '<agency_memo value="{agency_memo}" />'
+    '<form_id value="{form_id}" />'
+    '<payment_amount value="{payment_amount}" />'
+    '<account_data>'
+    '<payment_type value="{payment_type}" />'
+    '<payer_name value="{payer_name}" />'
+    '<billing_address value="{billing_address}" />'
+    '<billing_city value="{billing_city}" />'
+    '<billing_state value="{billing_state}" />'
+    '<billing_zip value="{billing_zip}" />'
+    '</account_data>'
+    '<OptionalFieldsGroup>'
+    '<custom_field_1 value="{custom_field_1}" />'
+    '<custom_field_2 value="{custom_field_2}" />'
+    '<custom_field_3 value="{custom_field_3}" />'
+    '<custom_field_4 value="{custom_field_4}" />'
+    '<custom_field_5 value="{custom_field_5}" />'
+    '<custom_field_6 value="{custom_field_6}" />'
+    '<custom_field_7 value="{custom_field_7}" />'
+    '<custom_field_8 value="{custom_field_8}" />'
+    '</OptionalFieldsGroup>'
+    '</collection_auth>'
+    '</interactive_request>'
+    '</collection_request>')
+COLLECTION_REQUEST_FIELDS = (
+    'success_url', 'failure_url', 'agency_tracking_id', 'agency_memo',
+    'form_id', 'payment_type', 'payer_name', 'billing_address',
+    'billing_city', 'billing_state', 'billing_zip', 'custom_field_1',
+    'custom_field_2', 'custom_field_3', 'custom_field_4', 'custom_field_5',
+    'custom_field_6', 'custom_field_7', 'custom_field_8')
+
+
+def attribute_escapes():
+    """Translation table matching ElementTree's escaping of attribute values
+    (which differs between versions of Python)"""
+    table = {}
+    for char in '&<>"\n\r\t':
+        serialized = tostring(Element('e', {'v': char})).decode('ascii')
+        table[ord(char)] = serialized[len('<e v="'):-len('" />')]
+    return table
+
+ATTRIBUTE_ESCAPES = attribute_escapes()
+
+
 def add_subelements(parent, data, elements):
     for element in elements:
         SubElement(parent, element, {'value': str(data[element])})
@@ -28,31 +87,14 @@ def generate_agency_memo(data):
         (Donor Comment)(Project Number, Amount)(Donor Phone Number)
         (Contact info consent)(Bus Interest Conflict)(Contact Email Consent).
     """
-    memo = ''
     comments = strip_escape_chars(data.get('comments', ''))
-    memo += '(' + comments.strip() + ')'
-
     amount = humanize_cents(data['payment_amount'], commas=False)
-    memo += '(%s,%s/)' % (data['project_code'], amount)
-
-    memo += '(' + data.get('phone_number', '').strip() + ')'
-
-    if data.get('information_consent'):
-        memo += '(yes)'
-    else:
-        memo += '(no)'
-
-    if data.get('interest_conflict'):
-        memo += '(yes)'
-    else:
-        memo += '(no)'
-
-    if data.get('email_consent'):
-        memo += '(yes)'
-    else:
-        memo += '(no)'
-
-    return memo
+    flags = ''.join('(yes)' if data.get(field) else '(no)' for field in
+                    ('information_consent', 'interest_conflict',
+                     'email_consent'))
+    return '(%s)(%s,%s/)(%s)%s' % (comments, data['project_code'], amount,
+                                   data.get('phone_number', '').strip(),
+                                   flags)
 
 
 def generate_agency_tracking_id():
@@ -101,6 +143,21 @@ def generate_collection_request(data):
     return root
 
 
+def render_collection_request(data):
+    """Equivalent to tostring(generate_collection_request(data)), but
+    without building a tree"""
+    values = {field: str(data[field]).translate(ATTRIBUTE_ESCAPES)
+              for field in COLLECTION_REQUEST_FIELDS}
+    values['payment_amount'] = "%.2f" % (data['payment_amount'] / 100.0)
+    xml = COLLECTION_REQUEST_TEMPLATE.format(**values)
+    # tostring serializes as ascii, so other characters are referenced
+    return xml.encode('ascii', 'xmlcharrefreplace').decode('ascii')
+
+
+def parenthesize(*values):
+    return ''.join('(%s)' % value for value in values)
+
+
 def generate_custom_fields(data):
     """Return a dictionary composed of 'custom' fields, formatted the way we
     expect. Format is
@@ -112,51 +169,46 @@ def generate_custom_fields(data):
         Custom Field #6: Dedication_Type, Consent, Message
         Custom Field #7: Dedication_Address
         Custom Field #8: Email Confirmation Body Message"""
-    custom = {}
-    custom['custom_field_1'] = '(' + data.get('phone_number', '') + ')'
-    custom['custom_field_1'] += '(' + data.get('email', '') + ')'
-
-    custom['custom_field_2'] = '(' + data.get('billing_address', '') + ')'
-
-    custom['custom_field_3'] = '(' + data.get('billing_city', '') + ')'
-    custom['custom_field_3'] += '(' + data.get('billing_state', '') + ')'
-    custom['custom_field_3'] += '(' + data.get('billing_zip', '') + ')'
-
-    custom['custom_field_4'] = '(' + data.get('organization_contact', '') + ')'
-
-    custom['custom_field_5'] = '(' + data.get('dedication_name', '') + ')'
-    custom['custom_field_5'] += '(' + data.get('dedication_contact', '') + ')'
-    custom['custom_field_5'] += '(' + data.get('dedication_email', '') + ')'
-
     if data.get('dedication_type') == 'in-memory':
-        custom['custom_field_6'] = '(Memory)'
+        dedication_type = 'Memory'
     else:
-        custom['custom_field_6'] = '(Honor)'
+        dedication_type = 'Honor'
     if data.get('dedication_consent') == 'no-dedication-consent':
-        custom['custom_field_6'] += '(no)'
+        consent = 'no'
     else:
-        custom['custom_field_6'] += '(yes)'
-    dedication = strip_escape_chars(data.get('card_dedication', ''))
-    custom['custom_field_6'] += '(' + dedication + ')'
-
-    custom['custom_field_7'] = '(' + data.get('dedication_address', '') + ')'
-
-    custom['custom_field_8'] = 'Thank you for your gift to the Peace Corps. Your tax-deductible donation provides crucial support as we build peace and friendship in the world. We\'ll stay in touch but you can also contact us at (202)692-2170 or donate@peacecorps.gov. Thank you again.'
-
-    return custom
+        consent = 'yes'
+
+    return {
+        'custom_field_1': parenthesize(data.get('phone_number', ''),
+                                       data.get('email', '')),
+        'custom_field_2': parenthesize(data.get('billing_address', '')),
+        'custom_field_3': parenthesize(data.get('billing_city', ''),
+                                       data.get('billing_state', ''),
+                                       data.get('billing_zip', '')),
+        'custom_field_4': parenthesize(data.get('organization_contact', '')),
+        'custom_field_5': parenthesize(data.get('dedication_name', ''),
+                                       data.get('dedication_contact', ''),
+                                       data.get('dedication_email', '')),
+        'custom_field_6': parenthesize(
+            dedication_type, consent,
+            strip_escape_chars(data.get('card_dedication', ''))),
+        'custom_field_7': parenthesize(data.get('dedication_address', '')),
+        'custom_field_8': THANK_YOU_MESSAGE,
+    }
 
 
 def redirect_urls(account):
     """Success and return URLs are derived from the account. Also the
     donor's first name to the url"""
+    slug = account.owner_slug
+    if not slug:    # not yet denormalized
+        slug = account.project_or_fund().slug
     if account.category == Account.PROJECT:
-        project = account.project_set.first()
-        return (reverse('project success', kwargs={'slug': project.slug}),
-                reverse('project failure', kwargs={'slug': project.slug}))
+        return (reverse('project success', kwargs={'slug': slug}),
+                reverse('project failure', kwargs={'slug': slug}))
     else:
-        campaign = account.campaign_set.first()
-        return (reverse('campaign success', kwargs={'slug': campaign.slug}),
-                reverse('campaign failure', kwargs={'slug': campaign.slug}))
+        return (reverse('campaign success', kwargs={'slug': slug}),
+                reverse('campaign failure', kwargs={'slug': slug}))
 
 
 def convert_to_paygov(data, account, callback_base):
@@ -173,6 +225,5 @@ def convert_to_paygov(data, account, callback_base):
     data['success_url'], data['failure_url'] = (
         callback_base + url for url in redirect_urls(account))
     data.update(generate_custom_fields(data))
-    xml = generate_collection_request(data)
     return DonorInfo(agency_tracking_id=tracking_id, account=account,
-                     xml=tostring(xml).decode('utf-8'))
+                     xml=render_collection_request(data))
@@ -2,11 +2,32 @@ from rest_framework import serializers
 from rest_framework.reverse import reverse
 from peacecorps.models import Project, Campaign
 from django.db import models
+from django.db.models import Sum
 from django.utils.translation import ugettext as _
 from pprint import pprint
 
 
-class CountryCampaignSerializer(serializers.ModelSerializer):
+def requested_fields(request):
+    """The set of field names requested via ?fields=a,b,c, or None if all
+    fields should be included"""
+    param = request.query_params.get('fields') if request else None
+    if not param:
+        return None
+    return {name.strip() for name in param.split(',') if name.strip()}
+
+
+class SparseFieldsMixin(object):
+    """Prune the serializer's fields to those requested (if any)"""
+    def __init__(self, *args, **kwargs):
+        super(SparseFieldsMixin, self).__init__(*args, **kwargs)
+        requested = requested_fields(self.context.get('request'))
+        if requested is not None:
+            for name in set(self.fields) - requested:
+                self.fields.pop(name)
+
+
+class CountryCampaignSerializer(SparseFieldsMixin,
+                                serializers.ModelSerializer):
 
     country = serializers.SerializerMethodField()
     description = serializers.SerializerMethodField()
@@ -17,6 +38,14 @@ class CountryCampaignSerializer(serializers.ModelSerializer):
     def get_description(self, obj):
         return obj.description.html
 
+    @staticmethod
+    def optimize(queryset, fields=None):
+        """Join everything the serializer reads (limited to `fields`, if
+        given)"""
+        if fields is None or 'country' in fields:
+            queryset = queryset.select_related('country')
+        return queryset
+
     class Meta:
         model = Campaign
         fields = ('name','campaigntype','country','description','abstract','primary_url',)
@@ -26,7 +55,7 @@ class CampaignSerializer(serializers.ModelSerializer):
         model = Campaign
         fields = ('name','primary_url',)
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     country = serializers.SerializerMethodField()
     campaigns = CampaignSerializer(many=True)
     description = serializers.SerializerMethodField()
@@ -41,6 +70,28 @@ class ProjectSerializer(serializers.ModelSerializer):
     def get_fully_funded(self, obj):
         return obj.account.funded()
 
+    @staticmethod
+    def optimize(queryset, fields=None):
+        """Fetch everything the serializer reads (limited to `fields`, if
+        given) in a fixed number of queries. Funding is always needed for
+        sorting; donations are summed by the database. See attach_funding"""
+        queryset = queryset.select_related('account').annotate(
+            donations_total=Sum('account__donations__amount'))
+        if fields is None or 'country' in fields:
+            queryset = queryset.select_related('country')
+        if fields is None or 'campaigns' in fields:
+            queryset = queryset.prefetch_related('campaigns')
+        return queryset
+
     class Meta:
         model = Project
-        fields = ('title','tagline','slug','description','country','campaigns', 'volunteername', 'volunteerhomestate','abstract', 'fully_funded', 'primary_url')
\ No newline at end of file
+        fields = ('title','tagline','slug','description','country','campaigns', 'volunteername', 'volunteerhomestate','abstract', 'fully_funded', 'primary_url')
+
+
+def attach_funding(projects):
+    """Copy the donation totals annotated by ProjectSerializer.optimize onto
+    each project's account, so that funded(), etc. need no more queries"""
+    projects = list(projects)
+    for project in projects:
+        project.account.dynamic_total = project.donations_total
+    return projects
@@ -88,24 +88,21 @@ CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
     },
-    'zipped_shortterm': {
-        'BACKEND': 'django_gzipping_cache.cache.GzippingCache',
-        'LOCATION': 'shortterm',
-    },
     'shortterm': {
         'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
         'TIMEOUT': 60*5,    # 5 minutes
         'KEY_PREFIX': 'shortterm',
     },
-    'zipped_midterm': {
-        'BACKEND': 'django_gzipping_cache.cache.GzippingCache',
-        'LOCATION': 'midterm',
-    },
     'midterm': {
         'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
         'TIMEOUT': 60*60,    # 1 hour
         'KEY_PREFIX': 'midterm',
-    }
+    },
+    # API rate limiting counters
+    'throttle': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+        'KEY_PREFIX': 'throttle',
+    },
 }
 
 # APP_SPECIFIC_VALUES
@@ -124,11 +121,17 @@ DONOR_EXPIRE_AFTER = 30      # minutes
 # Where to cut project "abstract"s
 ABSTRACT_LENGTH = 256
 
+# How long (in seconds) live account totals may be cached
+LIVE_TOTALS_TIMEOUT = 15
+
 # GPG info for encrypted fields
 GNUPG_HOME = ''     # Directory containing keys. If empty, GPG will not be used
 GPG_RECIPIENTS = {
     'peacecorps.DonorInfo.xml': '00000000'
 }
+# How GPGField encrypts/decrypts; see peacecorps/encryption.py
+GPG_BACKEND = 'peacecorps.encryption.GnuPGBackend'
+GPG_BACKEND_OPTIONS = {}
 
 # Password expire after a set number of days
 PASSWORD_EXPIRE_AFTER = 60   # days
@@ -171,7 +174,7 @@ REST_FRAMEWORK = {
         #'rest_framework.renderers.BrowsableAPIRenderer',
     ),
     'DEFAULT_THROTTLE_CLASSES': (
-        'rest_framework.throttling.AnonRateThrottle',
+        'peacecorps.throttling.FixedWindowAnonRateThrottle',
     ),
     'DEFAULT_THROTTLE_RATES': {
         'anon': '15/second',
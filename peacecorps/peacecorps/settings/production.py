@@ -27,8 +27,30 @@ if MEMCACHED_URL:
     _backend = 'django_elasticache.memcached.ElastiCache'
     CACHES['shortterm']['BACKEND'] = _backend
     CACHES['shortterm']['LOCATION'] = MEMCACHED_URL
-    CACHES['midterm']['BACKEND'] = _backend
-    CACHES['midterm']['LOCATION'] = MEMCACHED_URL
+    CACHES['throttle']['BACKEND'] = _backend
+    CACHES['throttle']['LOCATION'] = MEMCACHED_URL
+    # Hot pages are also held in a small, per-process LRU
+    CACHES['midterm_shared'] = dict(CACHES['midterm'], BACKEND=_backend,
+                                    LOCATION=MEMCACHED_URL)
+    CACHES['midterm'] = {
+        'BACKEND': 'peacecorps.backends.TwoTierCache',
+        'LOCATION': 'midterm_shared',
+        'TIMEOUT': CACHES['midterm']['TIMEOUT'],
+        'OPTIONS': {
+            'LOCAL_TIMEOUT': 10,
+            'MAX_BYTES': 32 * 1024 * 1024,
+            'GENERATION_INTERVAL': 2,
+        },
+    }
+else:
+    # Without memcached, fall back to a cache shared by this node's workers
+    _cache_dir = os.environ.get('CACHE_DIR', '/tmp/peacecorps-cache')
+    for _alias, _max_bytes in (('shortterm', 32), ('midterm', 256),
+                               ('throttle', 8)):
+        CACHES[_alias]['BACKEND'] = 'peacecorps.backends.LRUFileBasedCache'
+        CACHES[_alias]['LOCATION'] = os.path.join(_cache_dir, _alias)
+        CACHES[_alias]['OPTIONS'] = {'MAX_ENTRIES': 10000,
+                                     'MAX_BYTES': _max_bytes * 1024 * 1024}
 
 JINJA2_CONSTANTS['ANALYTICS_ID'] = 'GTM-PDX8KJ'
 
@@ -40,6 +62,12 @@ GNUPG_HOME = os.environ.get('GNUPG_HOME', '')
 GPG_RECIPIENTS = {
     'peacecorps.DonorInfo.xml': os.environ.get('GPG_ENCRYPT_ID', '')
 }
+GPG_BACKEND = os.environ.get('GPG_BACKEND',
+                             'peacecorps.encryption.GnuPGBackend')
+GPG_BACKEND_OPTIONS = {
+    'MAX_PROCESSES': int(os.environ.get('GPG_MAX_PROCESSES', 4)),
+    'TIMEOUT': int(os.environ.get('GPG_TIMEOUT', 10)),
+}
 
 if os.environ.get('USE_PAYGOV', ''):
     INSTALLED_APPS += ('paygov',)
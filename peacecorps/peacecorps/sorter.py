@@ -0,0 +1,92 @@
+"""The sorter (the "Projects and Funds" page) lists projects a page at a time,
+reading from the precomputed SorterEntry table. The page itself renders the
+first page of cards; the sorter API serves the rest"""
+import base64
+import json
+
+from django.db.models import Q, Sum
+
+from peacecorps.cache import fingerprint
+from peacecorps.models import Project
+
+
+PAGE_SIZE = 24
+
+
+def encode_cursor(entry):
+    position = [entry.funded, entry.volunteername, entry.project_id]
+    return base64.urlsafe_b64encode(
+        json.dumps(position).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor):
+    """Returns the position (funded, volunteername, project id) following
+    which the next page starts. Raises ValueError if invalid"""
+    try:
+        funded, name, pk = json.loads(
+            base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+    except (TypeError, ValueError):
+        raise ValueError("invalid cursor")
+    if not (isinstance(funded, bool) and isinstance(name, str)
+            and isinstance(pk, int)):
+        raise ValueError("invalid cursor")
+    return funded, name, pk
+
+
+def page(entries, cursor=None, size=None):
+    """A page (of `size`, default PAGE_SIZE) of the SorterEntry queryset, in
+    sorter order (those still in need of funding first, then by volunteer
+    name). Returns the entries and the cursor for the next page, or None if
+    this is the last. Raises ValueError if the cursor is invalid"""
+    size = size or PAGE_SIZE
+    if cursor:
+        funded, name, pk = decode_cursor(cursor)
+        entries = entries.filter(
+            Q(funded__gt=funded)
+            | Q(funded=funded, volunteername__gt=name)
+            | Q(funded=funded, volunteername=name, project__gt=pk))
+    entries = list(entries.order_by('funded', 'volunteername', 'project')[
+        :size + 1])
+    if len(entries) > size:
+        entries = entries[:size]
+        return entries, encode_cursor(entries[-1])
+    return entries, None
+
+
+def card_projects(entries):
+    """The entries' projects, in the same order, with everything their cards
+    display (donation totals included) fetched in a single query. Each
+    project's `sorter_filters` is copied from its entry"""
+    projects = Project.objects.filter(
+        pk__in=[entry.project_id for entry in entries]).select_related(
+        'account', 'country', 'volunteerpicture').annotate(
+        donations_total=Sum('account__donations__amount'))
+    by_pk = {project.pk: project for project in projects}
+    result = []
+    for entry in entries:
+        project = by_pk.get(entry.project_id)
+        if project:
+            project.account.dynamic_total = project.donations_total
+            project.sorter_filters = entry.filters
+            result.append(project)
+    return result
+
+
+def card_version(project):
+    """Everything displayed in a project's sorter card"""
+    account = project.account
+    picture = project.volunteerpicture
+    return fingerprint(
+        project.title, project.slug, project.abstract,
+        str(project.description), project.volunteername,
+        project.volunteerhomestate, picture.url if picture else None,
+        project.country.code, account.goal, account.community_contribution,
+        account.total_donated(), project.sorter_filters)
+
+
+def card_context(entries):
+    """Template context for donations/includes/sorter_projects.jinja"""
+    projects = card_projects(entries)
+    return {'projects': projects,
+            'card_versions': {project.pk: card_version(project)
+                              for project in projects}}
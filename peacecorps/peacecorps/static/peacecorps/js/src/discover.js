@@ -214,7 +214,7 @@ Discover.prototype.highlightSelected = function() {
 
 /**
  * Internal method; hides all filterable items unless their data-in-filter
- * includes the filterName
+ * includes the filterName, then triggers discover:filter
  **/
 Discover.prototype._filter = function(filterName) {
   var escaped = filterName.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'),
@@ -224,6 +224,7 @@ Discover.prototype._filter = function(filterName) {
     var $this = $(this);
     $this.attr('aria-hidden', !regex.test($this.attr('data-in-filter')));
   });
+  this.$el.trigger('discover:filter', [filterName]);
 };
 
 module.exports = Discover;
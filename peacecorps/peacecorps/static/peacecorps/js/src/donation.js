@@ -8,7 +8,9 @@ var UpdatePercent = require('./update_donatepercent');
 var Landing = require('./landing');
 var form = require('./form');
 var jsusers = require('./jsusers');
+var liveTotals = require('./live_totals');
 var showOnce = require('./showOnce');
+var SorterLoader = require('./sorter_loader');
 var toggle = require('./toggle');
 
 //  Note that we set up an event listener and call it immediately to check the
@@ -52,6 +54,7 @@ $().ready(function() {
   var $discoverApp = $('.js-discoverApp'),
       $form = $('.js-form'),
       $share = $('.share'),
+      $sorterMore = $('.js-sorterMore'),
       $doc = $(document);
 
   // TODO I want to rebuild the Init class to remove this check at some point.
@@ -64,6 +67,7 @@ $().ready(function() {
   Landing.createDataFilter();
 
   new UpdatePercent($('.js-fundingBar'));
+  liveTotals.init($doc);
 
   var discover = null,
       //hash = window.location.hash.substr(1) || 'issue',
@@ -77,7 +81,7 @@ $().ready(function() {
     discoverHashObj = discover.parseHash();
     project = discoverHashObj.params['project'];
   }
-  $('.js-collapsibleItem').each(function() {
+  function initCollapsible() {
     var collapsible,
         $this = $(this),
         id = $this.attr('id'),
@@ -104,7 +108,14 @@ $().ready(function() {
     }
 
     collapsible.render();
-  });
+  }
+  $('.js-collapsibleItem').each(initCollapsible);
+  if (discover && $sorterMore.length > 0) {
+    new SorterLoader(discover, $sorterMore, function($new) {
+      $new.find('.js-collapsibleItem').each(initCollapsible);
+      liveTotals.init($new);
+    });
+  }
   if (discoverSelectedCollapsible) {
     discover.selectedCollapsible = discoverSelectedCollapsible;
     //discoverSelectedCollapsible.hidden = false;
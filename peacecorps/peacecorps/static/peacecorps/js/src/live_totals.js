@@ -0,0 +1,92 @@
+/*
+ * Pages are cached for some time, so the funding progress they were
+ * rendered with may be out of date. Elements with a data-account-code
+ * attribute are updated from the totals API.
+ */
+'use strict';
+
+var $ = require('jquery');
+
+var liveTotals = {
+  url: '/api/totals/',
+  //  The API's limit on codes per request
+  maxCodes: 100,
+
+  //  Matches the humanize_cents template function, e.g. $1,234.50
+  humanizeCents: function(cents) {
+    var parts = (cents / 100).toFixed(2).split('.');
+    return '$' + parts[0].replace(/\B(?=(\d{3})+(?!\d))/g, ',') + '.' +
+      parts[1];
+  },
+
+  //  Matches the radialProgress background in project-top.jinja
+  radialGradient: function(percent) {
+    if (percent < 50) {
+      return 'linear-gradient(90deg, #F2EFE8 50%, transparent 50%, ' +
+        'transparent), linear-gradient(' + (90 + 3.6 * percent) + 'deg, ' +
+        '#A12122 50%, #F2EFE8 50%, #F2EFE8)';
+    }
+    return 'linear-gradient(' + (-90 + 3.6 * (percent - 50)) + 'deg, ' +
+      '#A12122 50%, transparent 50%, transparent), linear-gradient(270deg, ' +
+      '#A12122 50%, #F2EFE8 50%, #F2EFE8)';
+  },
+
+  codes: function($els) {
+    var codes = [];
+    $els.each(function() {
+      //  attr rather than data; the latter converts numeric codes
+      var code = $(this).attr('data-account-code');
+      if (codes.indexOf(code) < 0) {
+        codes.push(code);
+      }
+    });
+    return codes;
+  },
+
+  update: function($els, totals) {
+    $els.each(function() {
+      var $el = $(this),
+          account = totals[$el.attr('data-account-code')],
+          percent;
+      if (!account) {
+        return;
+      }
+      percent = Math.min(account.percent_raised, 100) + '%';
+      $el.find('.js-totalsWidth').css('width', percent);
+      $el.find('.js-totalsLeft').css('left', percent);
+      $el.find('.js-totalsRaised').text(
+        liveTotals.humanizeCents(account.total_raised));
+      $el.find('.js-totalsRadial').css(
+        'background-image',
+        liveTotals.radialGradient(Math.min(account.percent_raised, 100)));
+      $el.find('.js-totalsRemaining').text(
+        liveTotals.humanizeCents(account.remaining));
+      //  Dollars, as in DonationAmountForm
+      $el.find('.js-totalsMax').attr(
+        'max', (account.remaining / 100).toFixed(2));
+      //  Donations only add up, so a rendered "funded" need not be undone
+      if (account.funded) {
+        $el.find('.js-totalsUnfunded').hide();
+        $el.find('.js-totalsFunded').show();
+      }
+    });
+  },
+
+  init: function($root) {
+    var $els = $root.find('[data-account-code]'),
+        codes = liveTotals.codes($els),
+        i,
+        done = function(totals) {
+          liveTotals.update($els, totals);
+        };
+    for (i = 0; i < codes.length; i += liveTotals.maxCodes) {
+      $.ajax({
+        url: liveTotals.url,
+        method: 'GET',
+        data: {codes: codes.slice(i, i + liveTotals.maxCodes).join(',')}
+      }).done(done);
+    }
+  }
+};
+
+module.exports = liveTotals;
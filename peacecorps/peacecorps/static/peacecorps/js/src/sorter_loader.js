@@ -0,0 +1,105 @@
+/*
+ * The sorter page only renders the first page of projects. Further pages
+ * (of the selected issue or country, or of all volunteers) are fetched from
+ * the sorter API, each filter following its own cursor.
+ */
+'use strict';
+
+var $ = require('jquery');
+
+var SorterLoader = function(discover, $button, onLoad) {
+  var self = this;
+  this.discover = discover;
+  this.$button = $button;
+  this.$list = discover.$('.js-sorterList');
+  this.onLoad = onLoad || function() {};
+  //  The next page's cursor, per filter; null once there are no more, and
+  //  undefined until the filter's first page is requested
+  this.cursors = {volunteer: $button.attr('data-next') || null};
+  this.pending = {};
+
+  $button.click(function(ev) {
+    ev.preventDefault();
+    self.load(self.currentFilter());
+  });
+  discover.$el.on('discover:filter', function(ev, filter) {
+    self.select(filter);
+  });
+  this.select(this.currentFilter());
+};
+
+SorterLoader.prototype.url = '/api/sorter/';
+
+/* API parameters for a filter, or null if it doesn't list projects */
+SorterLoader.prototype.params = function(filter) {
+  var match;
+  if (filter === 'volunteer') {
+    return {};
+  }
+  match = /^issue-(\d+)$/.exec(filter);
+  if (match) {
+    return {issue: match[1]};
+  }
+  match = /^country-(.+)$/.exec(filter);
+  if (match) {
+    return {country: match[1]};
+  }
+  return null;
+};
+
+SorterLoader.prototype.currentFilter = function() {
+  var state = this.discover.state;
+  return state[state.length - 1];
+};
+
+/* Show the button while there may be more projects to load (disabled while
+ * loading); fetch the first page of issues and countries, as the page only
+ * includes those projects which are first overall */
+SorterLoader.prototype.select = function(filter) {
+  var hasProjects = this.params(filter) !== null;
+  if (hasProjects && this.cursors[filter] === undefined) {
+    this.load(filter);
+  }
+  this.$button.toggle(hasProjects && this.cursors[filter] !== null)
+    .prop('disabled', !!this.pending[filter]);
+};
+
+/* Fetch the filter's next page. If the request fails, the button may be
+ * used to try again */
+SorterLoader.prototype.load = function(filter) {
+  var self = this,
+      data = this.params(filter);
+  if (data === null || this.pending[filter] || this.cursors[filter] === null) {
+    return;
+  }
+  data.html = 'true';
+  if (this.cursors[filter]) {
+    data.cursor = this.cursors[filter];
+  }
+  //  An empty cursor is the first page, once requested
+  this.cursors[filter] = this.cursors[filter] || '';
+  this.pending[filter] = true;
+  this.select(this.currentFilter());
+  $.ajax({url: this.url, method: 'GET', data: data}).done(function(page) {
+    self.cursors[filter] = page.next;
+    self.append($($.parseHTML(page.html)).filter('li'));
+  }).always(function() {
+    self.pending[filter] = false;
+    self.select(self.currentFilter());
+  });
+};
+
+/* Add any cards not already present, then re-apply the current filter */
+SorterLoader.prototype.append = function($items) {
+  var $list = this.$list,
+      $new = $items.filter(function() {
+        var id = $(this).attr('data-project-id');
+        return $list.find('[data-project-id="' + id + '"]').length === 0;
+      });
+  $list.append($new);
+  this.discover.$filterables = this.discover.$('[data-in-filter]');
+  this.discover._filter(this.currentFilter());
+  this.onLoad($new);
+};
+
+module.exports = SorterLoader;
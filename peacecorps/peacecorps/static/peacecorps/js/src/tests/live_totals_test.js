@@ -0,0 +1,89 @@
+'use strict';
+
+var setup = require('./setup');
+setup = setup; // HACK not using module yet.
+
+var $ = require('jquery');
+var sinon = require('sinon');
+var test = require('tapes');
+
+var liveTotals = require('../live_totals');
+
+test('humanizeCents', function(t) {
+  t.equals(liveTotals.humanizeCents(5), '$0.05');
+  t.equals(liveTotals.humanizeCents(123456789), '$1,234,567.89');
+  t.end();
+});
+
+test('radialGradient', function(t) {
+  t.ok(/linear-gradient\(108deg/.test(liveTotals.radialGradient(5)));
+  t.ok(/^linear-gradient\(0deg/.test(liveTotals.radialGradient(75)));
+  t.end();
+});
+
+test('init', function(t) {
+  t.test('should request each code once', function(t) {
+    var $root = $('<div><div data-account-code="123" /></div>'),
+        stub = sinon.stub($, 'ajax');
+    stub.returns({done: function() {}});
+    $root.append('<div data-account-code="SPF-ABC" />',
+                 '<div data-account-code="123" />');
+
+    liveTotals.init($root);
+    t.ok(stub.calledOnce, 'ajax was called once');
+    t.equals(stub.firstCall.args[0].data.codes, '123,SPF-ABC');
+
+    $.ajax.restore();
+    t.end();
+  });
+  t.test('should not request without codes', function(t) {
+    var stub = sinon.stub($, 'ajax');
+    liveTotals.init($('<div />'));
+    t.notOk(stub.called, 'ajax was not called');
+    $.ajax.restore();
+    t.end();
+  });
+  t.end();
+});
+
+test('update', function(t) {
+  var $el = $('<div data-account-code="123">' +
+              '<div class="js-totalsWidth"></div>' +
+              '<span class="js-totalsLeft js-totalsRaised"></span></div>'),
+      $other = $('<div data-account-code="456">' +
+                 '<div class="js-totalsWidth"></div></div>');
+
+  liveTotals.update($el.add($other), {
+    '123': {percent_raised: 50, total_raised: 150000}});
+  t.equals($el.find('.js-totalsWidth')[0].style.width, '50%');
+  t.equals($el.find('.js-totalsLeft')[0].style.left, '50%');
+  t.equals($el.find('.js-totalsRaised').text(), '$1,500.00');
+  t.equals($other.find('.js-totalsWidth')[0].style.width, '',
+           'Missing accounts are left alone');
+  t.end();
+});
+
+test('update form', function(t) {
+  var $el = $('<div data-account-code="123">' +
+              '<span class="js-totalsRemaining"></span>' +
+              '<input class="js-totalsMax" max="20.00" />' +
+              '<div class="js-totalsUnfunded"></div>' +
+              '<span class="js-totalsFunded" style="display: none"></span>' +
+              '</div>');
+
+  liveTotals.update($el, {'123': {percent_raised: 90, total_raised: 9000,
+                                  remaining: 1050, funded: false}});
+  t.equals($el.find('.js-totalsRemaining').text(), '$10.50');
+  t.equals($el.find('.js-totalsMax').attr('max'), '10.50');
+  t.equals($el.find('.js-totalsFunded')[0].style.display, 'none');
+  t.equals($el.find('.js-totalsUnfunded')[0].style.display, '');
+
+  liveTotals.update($el, {'123': {percent_raised: 100, total_raised: 10000,
+                                  remaining: 0, funded: true}});
+  t.equals($el.find('.js-totalsMax').attr('max'), '0.00');
+  t.equals($el.find('.js-totalsFunded')[0].style.display, '',
+           'Funded content is shown');
+  t.equals($el.find('.js-totalsUnfunded')[0].style.display, 'none',
+           'Donation controls are hidden');
+  t.end();
+});
@@ -0,0 +1,115 @@
+'use strict';
+
+var setup = require('./setup');
+setup = setup; // HACK not using module yet.
+
+var $ = require('jquery');
+var sinon = require('sinon');
+var test = require('tapes');
+
+var Discover = require('../discover');
+var SorterLoader = require('../sorter_loader');
+
+function sorter() {
+  var $root = $('<div />'),
+      $list = $('<ul class="js-sorterList" />').appendTo($root),
+      $button = $('<button data-next="abc" />').appendTo($root);
+  $('<a data-controls-filter="volunteer"></a>').prependTo($root);
+  $('<a data-controls-filter="country-KE"></a>').prependTo($root);
+  $list.append('<li data-project-id="1" data-in-filter="volunteer" />');
+  return {$root: $root, $list: $list, $button: $button,
+          discover: new Discover($root)};
+}
+
+//  A settled request; successful if given a page
+function response(page) {
+  var xhr = {
+    done: function(fn) {
+      if (page) {
+        fn(page);
+      }
+      return xhr;
+    },
+    always: function(fn) {
+      fn();
+      return xhr;
+    }
+  };
+  return xhr;
+}
+
+test('params', function(t) {
+  var params = SorterLoader.prototype.params;
+  t.deepEquals(params('volunteer'), {});
+  t.deepEquals(params('issue-3'), {issue: '3'});
+  t.deepEquals(params('country-KE'), {country: 'KE'});
+  t.equals(params('issue'), null);
+  t.equals(params('country'), null);
+  t.end();
+});
+
+test('load', function(t) {
+  t.test('should follow the cursor, skipping loaded projects', function(t) {
+    var s = sorter(),
+        stub = sinon.stub($, 'ajax'),
+        loaded = sinon.spy(),
+        loader;
+    stub.returns(response({
+      next: null, html: '<li data-project-id="1" data-in-filter="a" />' +
+                        '<li data-project-id="2" data-in-filter="b" />'}));
+    s.discover.select('volunteer', true);
+    loader = new SorterLoader(s.discover, s.$button, loaded);
+    t.notOk(stub.called, 'the first page is already present');
+
+    s.$button.click();
+    t.ok(stub.calledOnce, 'ajax was called once');
+    t.deepEquals(stub.firstCall.args[0].data, {html: 'true', cursor: 'abc'});
+    t.equals(s.$list.children().length, 2);
+    t.equals(loaded.firstCall.args[0].attr('data-project-id'), '2');
+    t.equals(s.discover.$filterables.length, 2);
+    t.equals(loader.cursors.volunteer, null);
+    t.equals(s.$button.css('display'), 'none', 'no more to load');
+
+    $.ajax.restore();
+    t.end();
+  });
+  t.test('should fetch the first page of other filters', function(t) {
+    var s = sorter(),
+        stub = sinon.stub($, 'ajax');
+    //  Never settles
+    stub.returns({done: function() { return this; },
+                  always: function() { return this; }});
+    s.discover.select('volunteer', true);
+    new SorterLoader(s.discover, s.$button);
+    s.discover.select('country-KE', true);
+    t.ok(stub.calledOnce, 'ajax was called once');
+    t.deepEquals(stub.firstCall.args[0].data,
+                 {country: 'KE', html: 'true'});
+    s.discover.select('volunteer', true);
+    s.discover.select('country-KE', true);
+    t.ok(stub.calledOnce, 'pending requests are not repeated');
+
+    $.ajax.restore();
+    t.end();
+  });
+  t.test('should allow retrying failed requests', function(t) {
+    var s = sorter(),
+        stub = sinon.stub($, 'ajax');
+    stub.returns(response(null));
+    s.discover.select('volunteer', true);
+    new SorterLoader(s.discover, s.$button);
+    s.discover.select('country-KE', true);
+    t.ok(stub.calledOnce, 'ajax was called once');
+    t.notEquals(s.$button.css('display'), 'none');
+    t.notOk(s.$button.prop('disabled'), 'the button is enabled');
+
+    s.$button.click();
+    t.ok(stub.calledTwice, 'the button retries');
+    t.deepEquals(stub.secondCall.args[0].data,
+                 {country: 'KE', html: 'true'});
+
+    $.ajax.restore();
+    t.end();
+  });
+  t.end();
+});
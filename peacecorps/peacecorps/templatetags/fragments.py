@@ -0,0 +1,35 @@
+"""Cache rendered fragments of a page (e.g. each project card in the sorter).
+All fragments for a list of objects are retrieved in a single round trip;
+only those missing from the cache are rendered"""
+from django.core.cache import caches
+from django_jinja import library
+from jinja2 import Markup
+
+
+def fragment_key(name, pk, version):
+    return 'fragment:%s:%s:%s' % (name, pk, version)
+
+
+@library.global_function
+def cached_fragments(name, objects, render, versions, cache_alias='midterm'):
+    """Returns a dictionary mapping each object's pk to its rendered HTML.
+    `render` is called (generally with a macro) for each object not found in
+    the cache. `versions` maps pks to a version string, which should change
+    whenever the object's fragment would"""
+    cache = caches[cache_alias]
+    keys = {obj.pk: fragment_key(name, obj.pk, versions.get(obj.pk, ''))
+            for obj in objects}
+    found = cache.get_many(list(keys.values()))
+
+    fragments, missing = {}, {}
+    for obj in objects:
+        key = keys[obj.pk]
+        if key in found:
+            fragments[obj.pk] = Markup(found[key])
+        else:
+            html = str(render(obj))
+            missing[key] = html
+            fragments[obj.pk] = Markup(html)
+    if missing:
+        cache.set_many(missing)
+    return fragments
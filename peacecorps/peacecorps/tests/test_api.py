@@ -1,10 +1,16 @@
-from unittest.mock import Mock
+import json
+import re
+from unittest.mock import Mock, patch
 
+from django.core.urlresolvers import reverse
+from django.db import connections, DEFAULT_DB_ALIAS
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from peacecorps import api
 from peacecorps.models import (
-    Account, Campaign, Country, DonorInfo, Media, Project)
+    Account, Campaign, Country, country_registry, DonorInfo, Media, Project,
+    SorterEntry)
 
 
 class ProjectDetailTests(TestCase):
@@ -84,6 +90,96 @@ class ProjectDetailTests(TestCase):
         self.assertEqual(result['featured_image'], 'urlhere')
 
 
+class AccountTotalsTests(TestCase):
+    def test_totals(self):
+        Account.objects.create(name='A', code='AAA', current=500, goal=1000)
+        Account.objects.create(name='B', code='BBB', current=1000, goal=1000)
+        response = self.client.get(reverse('api:totals'),
+                                   {'codes': 'AAA,BBB,MISSING'})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue('max-age' in response['Cache-Control'])
+        result = json.loads(response.content.decode('utf-8'))
+        self.assertEqual(sorted(result.keys()), ['AAA', 'BBB'])
+        self.assertEqual(result['AAA']['percent_raised'], 50)
+        self.assertEqual(result['AAA']['remaining'], 500)
+        self.assertFalse(result['AAA']['funded'])
+        self.assertTrue(result['BBB']['funded'])
+
+    def test_cached(self):
+        """Totals and unknown codes are cached, under keys which are valid
+        whatever the codes"""
+        Account.objects.create(name='A', code='AAA', current=500, goal=1000)
+        codes = {'codes': 'AAA,MISSING,' + 'spaces and \u2603 ' * 20}
+        with self.settings(CACHES={'shortterm': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                'LOCATION': 'totals-tests'}}):
+            response = self.client.get(reverse('api:totals'), codes)
+            self.assertEqual(response.status_code, 200)
+            with self.assertNumQueries(0):
+                response = self.client.get(reverse('api:totals'), codes)
+        result = json.loads(response.content.decode('utf-8'))
+        self.assertEqual(list(result.keys()), ['AAA'])
+
+    def test_bad_requests(self):
+        response = self.client.get(reverse('api:totals'))
+        self.assertEqual(response.status_code, 400)
+        codes = ','.join(str(i) for i in range(api.AccountTotals.MAX_CODES
+                                               + 1))
+        response = self.client.get(reverse('api:totals'), {'codes': codes})
+        self.assertEqual(response.status_code, 400)
+
+
+class ProjectBatchTests(TestCase):
+    fixtures = ['tests.yaml']
+
+    def test_matches_detail(self):
+        """Each project should be serialized just as by ProjectDetail;
+        unknown slugs are skipped"""
+        slugs = list(Project.published_objects.exclude(
+            overflow=None).values_list('slug', flat=True)[:5])
+        response = self.client.get(reverse('api:project_batch'),
+                                   {'slugs': ','.join(slugs + ['missing'])})
+        self.assertEqual(response.status_code, 200)
+        result = json.loads(response.content.decode('utf-8'))
+        self.assertEqual(sorted(result.keys()), sorted(slugs))
+        for slug in slugs:
+            detail = self.client.get(
+                reverse('api:project_detail', kwargs={'slug': slug}))
+            self.assertEqual(result[slug],
+                             json.loads(detail.content.decode('utf-8')))
+
+    def test_query_count(self):
+        """The number of queries does not depend on the number of
+        projects"""
+        slugs = list(Project.published_objects.values_list(
+            'slug', flat=True)[:api.ProjectBatch.MAX_SLUGS])
+        with CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as cap:
+            response = self.client.get(reverse('api:project_batch'),
+                                       {'slugs': ','.join(slugs)})
+        self.assertEqual(len(json.loads(response.content.decode('utf-8'))),
+                         len(slugs))
+        self.assertTrue(len(cap) <= 3)
+
+    def test_cache_keys(self):
+        """Slugs from the query string are hashed into valid memcached
+        keys"""
+        for slug in ('brick-oven-bakery', 'with spaces\n', '\u2603' * 300):
+            key = api._cache_key('project', slug)
+            self.assertTrue(len(key) < 250)
+            self.assertTrue(re.match(r'^[\w:]+$', key))
+        self.assertNotEqual(api._cache_key('project', 'a'),
+                            api._cache_key('project', 'b'))
+
+    def test_bad_requests(self):
+        response = self.client.get(reverse('api:project_batch'))
+        self.assertEqual(response.status_code, 400)
+        slugs = ','.join(str(i) for i in range(api.ProjectBatch.MAX_SLUGS
+                                               + 1))
+        response = self.client.get(reverse('api:project_batch'),
+                                   {'slugs': slugs})
+        self.assertEqual(response.status_code, 400)
+
+
 class ProjectDonationTests(TestCase):
     fixtures = ['countries']
 
@@ -156,3 +252,108 @@ class ProjectDonationTests(TestCase):
                              result['agency_tracking_id'])
             paygov.delete()
         account.delete()
+
+    def test_query_count(self):
+        """The lookup (with the account's total) and the DonorInfo insert.
+        Countries come from the (already loaded) registry"""
+        account = Account.objects.create(
+            name='PROJ', code='PROJ', category=Account.PROJECT, goal=200)
+        Project.objects.create(
+            title='Project', slug='proj', account=account, published=True,
+            country=Country.objects.get(name='Egypt'))
+        data = {
+            'payment_amount': '2',
+            'payer_name': 'William Williams',
+            'billing_address':  '1 Main Street',
+            'billing_city': 'Anytown',
+            'billing_state': 'MD',
+            'billing_zip':  '20852',
+            'country': 'USA',
+            'payment_type': 'CreditCard',
+            'information_consent': 'true'}
+        country_registry.all()
+        with CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as cap:
+            response = self.client.post(
+                reverse('api:project_payment', kwargs={'slug': 'proj'}),
+                json.dumps(data), content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue('agency_tracking_id' in
+                        json.loads(response.content.decode('utf-8')))
+        self.assertEqual(len(cap), 2)
+
+
+class SorterProjectsTests(TestCase):
+    fixtures = ['tests.yaml']
+
+    def setUp(self):
+        SorterEntry.objects.rebuild()
+
+    def get(self, **params):
+        response = self.client.get(reverse('api:sorter'), params)
+        return json.loads(response.content.decode('utf-8'))
+
+    def test_rebuild(self):
+        """Each published project has an entry listing its issues"""
+        self.assertEqual(SorterEntry.objects.count(),
+                         Project.published_objects.count())
+        project = Project.published_objects.get(slug='brick-oven-bakery')
+        entry = project.sorter_entry
+        issue = project.issue()
+        self.assertTrue(entry.filters.startswith(
+            'country-' + project.country.code))
+        if issue:
+            self.assertTrue('issue-%s' % issue.pk in entry.filters)
+            self.assertTrue(issue in entry.issues.all())
+
+        project.published = False
+        project.save()
+        SorterEntry.objects.rebuild([project.pk])
+        self.assertFalse(SorterEntry.objects.filter(project=project).exists())
+
+    def test_filters(self):
+        project = Project.published_objects.get(slug='brick-oven-bakery')
+        results = self.get(country=project.country.code)['results']
+        self.assertTrue(results)
+        self.assertTrue(all(result['country']['code'] == project.country.code
+                            for result in results))
+        self.assertTrue(project.slug in [r['slug'] for r in results])
+
+        for result in self.get(funded='true')['results']:
+            self.assertTrue(result['funded'])
+        for result in self.get(funded='false')['results']:
+            self.assertFalse(result['funded'])
+
+        issue = project.issue()
+        if issue:
+            results = self.get(issue=issue.pk)['results']
+            self.assertTrue(project.slug in [r['slug'] for r in results])
+
+        response = self.client.get(reverse('api:sorter'), {'issue': 'abc'})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get(reverse('api:sorter'), {'cursor': 'abc'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_html(self):
+        """With html=true, the page's cards are rendered as on the sorter"""
+        self.assertFalse('html' in self.get())
+        data = self.get(html='true')
+        self.assertTrue(data['results'])
+        self.assertEqual(data['html'].count('class="discover_proj"'),
+                         len(data['results']))
+        for result in data['results']:
+            self.assertTrue(
+                'data-project-id="%s"' % result['id'] in data['html'])
+
+    def test_pagination(self):
+        """Following the cursors visits each project once, in order"""
+        with patch.object(api.SorterProjects, 'PAGE_SIZE', 2):
+            data = self.get()
+            slugs = [result['slug'] for result in data['results']]
+            while data['next']:
+                self.assertEqual(len(data['results']), 2)
+                data = self.get(cursor=data['next'])
+                slugs.extend(result['slug'] for result in data['results'])
+        expected = SorterEntry.objects.order_by(
+            'funded', 'volunteername', 'project').values_list(
+            'project__slug', flat=True)
+        self.assertEqual(slugs, list(expected))
@@ -0,0 +1,154 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from django.core.cache import caches
+from django.test import TestCase
+
+from peacecorps import backends
+from peacecorps.backends import LRUFileBasedCache, TwoTierCache
+
+
+TWO_TIER = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'test-shared',
+    },
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'test-shared',
+    },
+}
+
+
+def two_tier(**options):
+    return TwoTierCache('shared', {'OPTIONS': options})
+
+
+def other_process(cache):
+    """Give the instance its own local tier, as if in another process"""
+    cache._tier = backends.LocalTier()
+    return cache
+
+
+class TwoTierCacheTests(TestCase):
+    def setUp(self):
+        backends._local_tiers.clear()
+
+    def test_local_hits(self):
+        """Once read, values are served from the local tier"""
+        with self.settings(CACHES=TWO_TIER):
+            cache = two_tier(GENERATION_INTERVAL=60)
+            caches['shared'].set('key', 'value')
+            self.assertEqual(cache.get('key'), 'value')
+            caches['shared'].set('key', 'changed')
+            self.assertEqual(cache.get('key'), 'value')
+            self.assertEqual(cache.get('missing', 'default'), 'default')
+
+    def test_local_timeout(self):
+        with self.settings(CACHES=TWO_TIER):
+            cache = two_tier(LOCAL_TIMEOUT=-1, GENERATION_INTERVAL=60)
+            cache.set('key', 'value')
+            caches['shared'].set('key', 'changed')
+            self.assertEqual(cache.get('key'), 'changed')
+
+    def test_size_cap(self):
+        """Least recently used entries are evicted to stay under the cap;
+        they remain in the shared tier"""
+        with self.settings(CACHES=TWO_TIER):
+            cache = two_tier(MAX_BYTES=2500)
+            cache.set('a', 'a' * 1000)
+            cache.set('b', 'b' * 1000)
+            cache.get('a')
+            cache.set('c', 'c' * 1000)
+            self.assertEqual(sorted(cache._tier.entries), [':1:a', ':1:c'])
+            self.assertTrue(cache._tier.size <= 2500)
+            self.assertEqual(cache.get('b'), 'b' * 1000)
+
+            cache.set('huge', 'h' * 5000)
+            self.assertFalse(':1:huge' in cache._tier.entries)
+            self.assertEqual(cache.get('huge'), 'h' * 5000)
+
+    def test_generation(self):
+        """Deleting in one process clears the local tier of the others"""
+        with self.settings(CACHES=TWO_TIER):
+            first = two_tier(GENERATION_INTERVAL=0)
+            second = other_process(two_tier(GENERATION_INTERVAL=0))
+            first.set('key', 'value')
+            self.assertEqual(second.get('key'), 'value')
+            first.delete('key')
+            self.assertEqual(second.get('key'), None)
+
+    def test_shared_by_threads(self):
+        """Each thread gets its own backend instance, but they share the
+        process' local tier"""
+        with self.settings(CACHES=TWO_TIER):
+            first = two_tier(GENERATION_INTERVAL=60)
+            first.get('key')    # checks the generation
+            first.set('key', 'value')
+            caches['shared'].set('key', 'changed')
+            results = []
+            thread = threading.Thread(target=lambda: results.append(
+                two_tier(GENERATION_INTERVAL=60).get('key')))
+            thread.start()
+            thread.join()
+            self.assertEqual(results, ['value'])
+
+    def test_mutable_values(self):
+        """Mutable values are copied on each hit; immutable ones aren't"""
+        with self.settings(CACHES=TWO_TIER):
+            cache = two_tier(GENERATION_INTERVAL=60)
+            cache.get('list')   # checks the generation
+            cache.set('list', [1, 2])
+            cache.get('list').append(3)
+            self.assertEqual(cache.get('list'), [1, 2])
+
+            value = 'x' * 100
+            cache.set('string', value)
+            self.assertTrue(cache.get('string') is value)
+
+    def test_get_many(self):
+        with self.settings(CACHES=TWO_TIER):
+            cache = two_tier()
+            cache.set('local', 1)
+            caches['shared'].set('remote', 2)
+            self.assertEqual(cache.get_many(['local', 'remote', 'missing']),
+                             {'local': 1, 'remote': 2})
+            self.assertTrue(':1:remote' in cache._tier.entries)
+
+
+class LRUFileBasedCacheTests(TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+
+    def age(self, cache, key, seconds):
+        then = time.time() - seconds
+        os.utime(cache._key_to_file(key), (then, then))
+
+    def test_shared(self):
+        """Separate instances (i.e. workers) see the same entries"""
+        first = LRUFileBasedCache(self.dir, {})
+        second = LRUFileBasedCache(self.dir, {})
+        first.set('key', 'value')
+        self.assertEqual(second.get('key'), 'value')
+
+    def test_lru(self):
+        """Least recently read files are culled first once over the size
+        bound"""
+        cache = LRUFileBasedCache(self.dir, {'OPTIONS': {
+            'MAX_BYTES': 1500, 'CULL_TO': 0.5}})
+        cache.set('a', os.urandom(500))
+        cache.set('b', os.urandom(500))
+        self.age(cache, 'a', 30)
+        self.age(cache, 'b', 20)
+        cache.get('a')      # refreshes a
+        cache.set('c', os.urandom(500))
+        self.age(cache, 'c', 10)
+        cache.set('d', os.urandom(500))
+
+        self.assertFalse(cache.has_key('b'))
+        self.assertTrue(cache.has_key('a'))
+        self.assertTrue(cache.has_key('d'))
@@ -0,0 +1,153 @@
+import gzip
+
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+
+from peacecorps import cache
+
+
+LOCMEM = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'test-cache',
+    }
+}
+
+
+class NormalizedCacheTests(TestCase):
+    def setUp(self):
+        self.calls = []
+        self.factory = RequestFactory()
+
+    def view(self, request):
+        self.calls.append(request.GET.dict())
+        return HttpResponse('content')
+
+    def test_normalize_query(self):
+        request = self.factory.get('/path/', {'utm_source': 'email',
+                                              'payment_status': 'full'})
+        cache.normalize_query(request, ('payment_status',))
+        self.assertEqual(request.GET.dict(), {'payment_status': 'full'})
+        self.assertEqual(request.META['QUERY_STRING'], 'payment_status=full')
+        self.assertEqual(request.get_full_path(),
+                         '/path/?payment_status=full')
+
+    def test_normalize_set_params(self):
+        """Sets of values should hit the same cache entry regardless of
+        order or duplication"""
+        request = self.factory.get('/path/', {'fields': 'title, slug,title'})
+        cache.normalize_query(request, ('fields',), ('fields',))
+        self.assertEqual(request.GET['fields'], 'slug,title')
+        self.assertEqual(request.META['QUERY_STRING'], 'fields=slug%2Ctitle')
+
+    def test_ignores_extra_params(self):
+        """Params outside the allow-list should hit the same cache entry"""
+        with self.settings(CACHES=LOCMEM):
+            view = cache.normalized_cache(
+                60, 'default', allowed_params=('payment_status',))(self.view)
+            view(self.factory.get('/path/'))
+            view(self.factory.get('/path/', {'utm_source': 'email'}))
+            view(self.factory.get('/path/', {'fbclid': 'abcd'}))
+            self.assertEqual(len(self.calls), 1)
+
+            view(self.factory.get('/path/', {'payment_status': 'full'}))
+            view(self.factory.get('/path/', {'payment_status': 'full',
+                                             'utm_source': 'email'}))
+            self.assertEqual(len(self.calls), 2)
+            self.assertEqual(self.calls[1], {'payment_status': 'full'})
+
+    def test_bypass(self):
+        """Requests with form-error params are never cached"""
+        with self.settings(CACHES=LOCMEM):
+            view = cache.normalized_cache(
+                60, 'default', bypass_params=('nonce',))(self.view)
+            view(self.factory.get('/path/', {'nonce': '1'}))
+            view(self.factory.get('/path/', {'nonce': '1'}))
+            self.assertEqual(len(self.calls), 2)
+            # The bypassing view sees all of the params
+            self.assertEqual(self.calls[0], {'nonce': '1'})
+            view(self.factory.get('/path/'))
+            view(self.factory.get('/path/'))
+            self.assertEqual(len(self.calls), 3)
+
+
+class PrecompressedCacheTests(TestCase):
+    def setUp(self):
+        self.calls = 0
+        self.factory = RequestFactory()
+
+    def view(self, request):
+        self.calls += 1
+        return HttpResponse('content' * 100, content_type='text/plain')
+
+    def test_encodings(self):
+        """Compressed bodies are served to clients which accept them, both
+        when the response is first stored and on cache hits"""
+        with self.settings(CACHES=LOCMEM):
+            view = cache.precompressed_cache_page(60, 'default')(self.view)
+            response = view(self.factory.get(
+                '/path/', HTTP_ACCEPT_ENCODING='gzip, deflate'))
+            self.assertEqual(response['Content-Encoding'], 'gzip')
+            self.assertEqual(gzip.decompress(response.content),
+                             b'content' * 100)
+            self.assertTrue('Accept-Encoding' in response['Vary'])
+
+            response = view(self.factory.get(
+                '/path/', HTTP_ACCEPT_ENCODING='gzip, deflate'))
+            self.assertEqual(self.calls, 1)
+            self.assertEqual(response['Content-Encoding'], 'gzip')
+            self.assertEqual(response['Content-Type'], 'text/plain')
+            self.assertEqual(response['Content-Length'],
+                             str(len(response.content)))
+
+            response = view(self.factory.get('/path/'))
+            self.assertEqual(self.calls, 1)
+            self.assertFalse(response.has_header('Content-Encoding'))
+            self.assertEqual(response.content, b'content' * 100)
+
+            response = view(self.factory.get(
+                '/path/', HTTP_ACCEPT_ENCODING='gzip;q=0'))
+            self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_malformed_q(self):
+        """Unparseable q values do not cause errors"""
+        request = self.factory.get('/', HTTP_ACCEPT_ENCODING='gzip;q=.')
+        self.assertTrue(cache._accepts(request, 'gzip'))
+        request = self.factory.get('/', HTTP_ACCEPT_ENCODING='gzip;q=0.0.1')
+        self.assertFalse(cache._accepts(request, 'gzip'))
+
+    def test_brotli(self):
+        if not cache.brotli:
+            self.skipTest('brotli is not installed')
+        with self.settings(CACHES=LOCMEM):
+            view = cache.precompressed_cache_page(60, 'default')(self.view)
+            response = view(self.factory.get(
+                '/path/', HTTP_ACCEPT_ENCODING='gzip, br'))
+            self.assertEqual(response['Content-Encoding'], 'br')
+            self.assertEqual(cache.brotli.decompress(response.content),
+                             b'content' * 100)
+
+
+class ConditionalTests(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.view = cache.conditional(lambda request: (1,))(
+            lambda request: HttpResponse('content'))
+        self.etag = cache.fingerprint('/path/', (1,))
+
+    def test_encoded_etag(self):
+        """ETags with an encoding suffix only match if the client still
+        accepts that encoding"""
+        tag = '"%s-gzip"' % self.etag
+        response = self.view(self.factory.get(
+            '/path/', HTTP_IF_NONE_MATCH=tag, HTTP_ACCEPT_ENCODING='gzip'))
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], tag)
+
+        response = self.view(self.factory.get(
+            '/path/', HTTP_IF_NONE_MATCH=tag))
+        self.assertEqual(response.status_code, 200)
+        response = self.view(self.factory.get(
+            '/path/', HTTP_IF_NONE_MATCH='"%s-bogus"' % self.etag,
+            HTTP_ACCEPT_ENCODING='gzip'))
+        self.assertEqual(response.status_code, 200)
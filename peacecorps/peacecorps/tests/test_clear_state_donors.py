@@ -26,3 +26,32 @@ class ClearStaleDonorTests(TestCase):
         self.assertEqual(1, account.donorinfos.count())
         self.assertEqual(1, len(logger.output))
         self.assertTrue('Deleted 5' in logger.output[0])
+
+    def test_batches(self):
+        """Donor infos are deleted in batches, which stop once the time
+        budget is exhausted, oldest first"""
+        account = Account.objects.create(name='Example', code='EXEXEX')
+        DonorInfo.objects.bulk_create([
+            DonorInfo(agency_tracking_id=str(i)*5, account=account,
+                      expires_at=timezone.now() - timedelta(minutes=i))
+            for i in range(5)])
+        DonorInfo.objects.create(
+            agency_tracking_id='future', account=account,
+            expires_at=timezone.now() + timedelta(hours=1))
+        with self.assertLogs('peacecorps.clear_stale_donors') as logger:
+            clear.Command().handle(batch_size=2)
+        self.assertEqual(1, account.donorinfos.count())
+        self.assertEqual(1, len(logger.output))
+        self.assertTrue('in 3 batches' in logger.output[0])
+        self.assertTrue('lag 0s' in logger.output[0])
+
+        DonorInfo.objects.bulk_create([
+            DonorInfo(agency_tracking_id=str(i)*5, account=account,
+                      expires_at=timezone.now() - timedelta(minutes=i))
+            for i in range(5)])
+        with self.assertLogs('peacecorps.clear_stale_donors') as logger:
+            clear.Command().handle(batch_size=2, time_budget=0)
+        self.assertEqual(4, account.donorinfos.count())
+        self.assertEqual(2, len(logger.output))
+        self.assertTrue('Deleted 2' in logger.output[0])
+        self.assertTrue('Time budget exhausted' in logger.output[1])
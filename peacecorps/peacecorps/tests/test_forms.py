@@ -1,6 +1,6 @@
 from django.test import TestCase
 
-from peacecorps.models import Account, Country
+from peacecorps.models import Account, Country, country_registry
 from peacecorps.forms import DonationAmountForm, DonationPaymentForm
 
 
@@ -104,6 +104,41 @@ class DonationPaymentTests(TestCase):
         form = DonationPaymentForm(data=form_data)
         self.assertTrue(form.is_valid())
 
+    def test_countries(self):
+        """Countries are validated and rendered without queries, but reflect
+        changes to the Country table"""
+        str(DonationPaymentForm()['country'])     # warm the registry
+        with self.assertNumQueries(0):
+            form = DonationPaymentForm(data=self.form_data(country='CAN'))
+            self.assertTrue(form.is_valid())
+            self.assertEqual(form.cleaned_data['country'].name, 'Canada')
+            self.assertFalse(DonationPaymentForm(
+                data=self.form_data(country='MEX')).is_valid())
+            html = str(DonationPaymentForm()['country'])
+            self.assertTrue('<option value="USA" selected="selected">' in html)
+            self.assertEqual(html, str(DonationPaymentForm()['country']))
+        self.assertFalse('MEX' in html)
+
+        Country.objects.create(code='MEX', name='Mexico')
+        self.assertTrue(DonationPaymentForm(
+            data=self.form_data(country='MEX')).is_valid())
+        self.assertTrue('MEX' in str(DonationPaymentForm()['country']))
+
+    def test_country_memo(self):
+        """Submitted values are marked as selected, but do not add to the
+        memoized HTML"""
+        rendered = country_registry._current()['rendered']
+        str(DonationPaymentForm()['country'])
+        num_rendered = len(rendered)
+        for code in ('CAN', 'USA', 'ZZZ', '"><script>'):
+            html = str(DonationPaymentForm(
+                data=self.form_data(country=code))['country'])
+            self.assertEqual(
+                '<option value="%s" selected="selected">' % code in html,
+                code in ('CAN', 'USA'))
+        self.assertFalse('<script>' in html)
+        self.assertEqual(len(rendered), num_rendered)
+
 
 class DonationAmountTests(TestCase):
     def test_custom_required(self):
@@ -149,3 +184,10 @@ class DonationAmountTests(TestCase):
         account.current = 3000
         form = DonationAmountForm(data=data, account=account)
         self.assertTrue(form.is_valid())
+
+    def test_max_attribute(self):
+        """The per-project limit is also rendered on the input"""
+        form = DonationAmountForm(account=Account(goal=8000, current=3001))
+        self.assertTrue('max="49.99"' in str(form['payment_amount']))
+        form = DonationAmountForm()
+        self.assertFalse('max=' in str(form['payment_amount']))
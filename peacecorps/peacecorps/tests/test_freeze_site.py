@@ -0,0 +1,104 @@
+from io import StringIO
+import json
+import os
+import shutil
+import tempfile
+
+from django.core.management.base import OutputWrapper
+from django.test import TestCase
+
+from peacecorps.management.commands import freeze_site
+from peacecorps.models import Project
+
+
+class FreezeSiteTests(TestCase):
+    fixtures = ['tests.yaml']
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+
+    def freeze(self):
+        stdout = StringIO()
+        command = freeze_site.Command()
+        command.stdout = OutputWrapper(stdout)
+        command.handle(self.dir, host='testserver', static_url='/static/')
+        return stdout.getvalue().strip().split('\n')
+
+    def test_asset_hasher(self):
+        hasher = freeze_site.AssetHasher(self.dir, '/assets/')
+        html = hasher.rewrite(
+            '<link href="/static/favicon.ico" />'
+            '<img src="/static/does/not/exist.png" />')
+        name = hasher.hashed['favicon.ico']
+        self.assertTrue(name.startswith('favicon.'))
+        self.assertTrue('href="/assets/%s"' % name in html)
+        self.assertTrue('src="/static/does/not/exist.png"' in html)
+        self.assertTrue(os.path.exists(os.path.join(self.dir, 'static',
+                                                    name)))
+
+    def test_incremental(self):
+        """Pages are written once, then only re-rendered when their content
+        changes"""
+        lines = self.freeze()
+        self.assertEqual(len(lines), len(freeze_site.public_pages()))
+        project = Project.published_objects.get(slug='brick-oven-bakery')
+        path = os.path.join(self.dir, 'donate', 'project',
+                            'brick-oven-bakery', 'index.html')
+        self.assertTrue(os.path.exists(path))
+        with open(os.path.join(self.dir, freeze_site.MANIFEST)) as f:
+            self.assertTrue('/donate/project/brick-oven-bakery/'
+                            in json.load(f))
+
+        self.assertEqual(self.freeze(), [''])
+
+        project.title = 'A New Title'
+        project.save()
+        lines = self.freeze()
+        self.assertTrue('Rendered /donate/project/brick-oven-bakery/'
+                        in lines)
+        self.assertFalse(any('/donate/fund/' in line for line in lines))
+
+        project.published = False
+        project.save()
+        lines = self.freeze()
+        self.assertTrue('Removed /donate/project/brick-oven-bakery/'
+                        in lines)
+        self.assertFalse(os.path.exists(path))
+
+    def test_bypasses_page_cache(self):
+        """Re-rendered pages reflect the edit, even if the page cache still
+        holds the old version"""
+        locmem = {alias: {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'freeze-' + alias}
+            for alias in ('default', 'shortterm', 'midterm', 'throttle')}
+        path = os.path.join(self.dir, 'donate', 'project',
+                            'brick-oven-bakery', 'index.html')
+        with self.settings(CACHES=locmem):
+            # Prime the page cache
+            self.client.get('/donate/project/brick-oven-bakery/')
+            project = Project.published_objects.get(slug='brick-oven-bakery')
+            project.title = 'A New Title'
+            project.save()
+            self.freeze()
+        with open(path) as f:
+            self.assertTrue('A New Title' in f.read())
+
+    def test_force(self):
+        """Forcing re-renders every page, but still removes those which are
+        no longer public"""
+        self.freeze()
+        project = Project.published_objects.get(slug='brick-oven-bakery')
+        project.published = False
+        project.save()
+
+        stdout = StringIO()
+        command = freeze_site.Command()
+        command.stdout = OutputWrapper(stdout)
+        command.handle(self.dir, host='testserver', static_url='/static/',
+                       force=True)
+        lines = stdout.getvalue().strip().split('\n')
+        self.assertEqual(len(freeze_site.public_pages()) + 1, len(lines))
+        self.assertTrue('Removed /donate/project/brick-oven-bakery/'
+                        in lines)
@@ -1,9 +1,11 @@
 import os.path
 import shutil
+import subprocess
 from unittest import skipUnless
 
 from django.test import TestCase
 
+from peacecorps.encryption import BoundedGnuPGBackend, GPGError, pgpy
 from peacecorps.models import DonorInfo, Account
 
 
@@ -52,3 +54,50 @@ class GPGTests(TestCase):
             #   Decodes correctly
             from_db = DonorInfo.objects.get(pk=di.pk)
             self.assertEqual(from_db.xml, 'Plain Text')
+
+    @skipUnless(shutil.which('gpg') and pgpy, "GPG or PGPy is not installed")
+    def test_in_process_encryption(self):
+        """Values encrypted in-process can be decrypted by gpg"""
+        gnupg_home = os.path.join('peacecorps', 'tests', 'gpg')
+        with self.settings(GNUPG_HOME=gnupg_home,
+                           GPG_RECIPIENTS={
+                               'peacecorps.DonorInfo.xml': 'C68F6B22'},
+                           GPG_BACKEND='peacecorps.encryption.'
+                                       'InProcessBackend'):
+            di = DonorInfo(agency_tracking_id='TRACK', account=self.account,
+                           xml='Plain Text')
+            di.save()
+
+            values = DonorInfo.objects.filter(pk=di.pk).values_list('xml')
+            byte_str = values[0][0]
+            if isinstance(byte_str, memoryview):
+                byte_str = byte_str.tobytes()
+            self.assertTrue('BEGIN PGP MESSAGE' in byte_str.decode('utf-8'))
+
+            #   The gpg CLI can decrypt it
+            decrypted = subprocess.check_output(
+                ['gpg', '--homedir', gnupg_home, '--batch', '--quiet',
+                 '--decrypt'], input=byte_str)
+            self.assertEqual(decrypted, b'Plain Text')
+
+            from_db = DonorInfo.objects.get(pk=di.pk)
+            self.assertEqual(from_db.xml, 'Plain Text')
+
+    @skipUnless(shutil.which('gpg'), "GPG is not installed")
+    def test_bounded(self):
+        """Round trip through the bounded backend, recording metrics"""
+        with self.settings(GNUPG_HOME=os.path.join('peacecorps', 'tests',
+                                                   'gpg'),
+                           GPG_BACKEND_OPTIONS={'MAX_PROCESSES': 2}):
+            backend = BoundedGnuPGBackend()
+            cipher_text = backend.encrypt(b'Plain Text', 'C68F6B22')
+            self.assertTrue(b'BEGIN PGP MESSAGE' in cipher_text)
+            self.assertEqual(backend.decrypt(cipher_text), b'Plain Text')
+            self.assertRaises(GPGError, backend.encrypt, b'Plain Text',
+                              'NOTAKEY0')
+
+            metrics = backend.metrics()
+            self.assertEqual(metrics['encrypt']['count'], 2)
+            self.assertEqual(metrics['encrypt']['errors'], 1)
+            self.assertEqual(metrics['decrypt']['count'], 1)
+            self.assertTrue(metrics['decrypt']['max_seconds'] > 0)
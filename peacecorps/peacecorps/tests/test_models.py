@@ -1,10 +1,16 @@
+from datetime import date, timedelta
 import json
 import os
 import shutil
+import time
 from unittest.mock import Mock, patch
 
 from django.conf import settings
+from django.core.cache import caches
+from django.db import IntegrityError
+from django.db.models.signals import post_save
 from django.test import TestCase
+from django.utils import timezone
 
 from peacecorps import models
 
@@ -197,6 +203,285 @@ class ProjectTests(TestCase):
         proj.volunteerhomestate = 'IN'
         self.assertEqual(proj.volunteer_statename(), 'Indiana')
 
+    def test_overflow_denormalized(self):
+        """Owner and overflow slugs should be kept current, so that the
+        overflow url requires no queries"""
+        paccount = models.Account.objects.create(
+            name='P', code='PROJ', category=models.Account.PROJECT)
+        caccount = models.Account.objects.create(
+            name='C', code='CPN', category=models.Account.SECTOR)
+        country = models.Country.objects.get(name='Mexico')
+        campaign = models.Campaign.objects.create(
+            name='Campaign', account=caccount,
+            campaigntype=models.Campaign.SECTOR)
+        self.assertEqual(
+            models.Account.objects.get(pk='CPN').owner_slug, 'campaign')
+
+        proj = models.Project.objects.create(
+            title='Project', country=country, account=paccount,
+            overflow=caccount)
+        proj = models.Project.objects.get(pk=proj.pk)
+        self.assertEqual(proj.overflow_slug, 'campaign')
+        self.assertEqual(proj.overflow_kind, models.Account.SECTOR)
+        with self.assertNumQueries(0):
+            self.assertEqual(proj.overflow_url(), '/donate/fund/campaign/')
+
+        campaign.slug = 'renamed'
+        campaign.save()
+        proj = models.Project.objects.get(pk=proj.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(proj.overflow_url(), '/donate/fund/renamed/')
+
+        oaccount = models.Account.objects.create(
+            name='O', code='OTH', category=models.Account.PROJECT)
+        other = models.Project.objects.create(
+            title='Other', country=country, account=oaccount,
+            overflow=paccount)
+        self.assertEqual(other.overflow_url(), '/donate/project/project/')
+        self.assertEqual(paccount.owner_slug, 'project')
+
+        proj.overflow = None
+        proj.save()
+        self.assertEqual(proj.overflow_url(), None)
+        self.assertEqual(proj.overflow_slug, None)
+
+        # Saves which change neither the account nor the slug don't touch
+        # the denormalized slugs
+        campaign = models.Campaign.objects.get(pk=campaign.pk)
+        with self.assertNumQueries(1):
+            campaign.save()
+
+        # Moving to another account clears the old account's slug
+        naccount = models.Account.objects.create(
+            name='N', code='NEW', category=models.Account.SECTOR)
+        campaign.account = naccount
+        campaign.save()
+        self.assertEqual(
+            models.Account.objects.get(pk='CPN').owner_slug, None)
+        self.assertEqual(
+            models.Account.objects.get(pk='NEW').owner_slug, 'renamed')
+
+
+class SorterEntryTests(TestCase):
+    fixtures = ['countries.yaml']
+
+    def test_kept_current(self):
+        """Entries should follow publication, issue and funding changes"""
+        paccount = models.Account.objects.create(
+            name='P', code='PROJ', goal=1000)
+        caccount = models.Account.objects.create(name='C', code='CPN')
+        country = models.Country.objects.get(name='Mexico')
+        proj = models.Project.objects.create(
+            title='Project', country=country, account=paccount)
+        self.assertFalse(models.SorterEntry.objects.exists())
+
+        proj.published = True
+        proj.save()
+        entry = models.SorterEntry.objects.get(project=proj)
+        self.assertEqual(entry.filters, 'country-' + country.code)
+        self.assertFalse(entry.funded)
+
+        campaign = models.Campaign.objects.create(
+            name='Campaign', account=caccount,
+            campaigntype=models.Campaign.SECTOR)
+        issue = models.Issue.objects.create(name='AAA')
+        proj.campaigns.add(campaign)
+        issue.campaigns.add(campaign)
+        entry = models.SorterEntry.objects.get(project=proj)
+        self.assertEqual(entry.filters, 'country-%s,issue-%s' % (
+            country.code, issue.pk))
+        self.assertEqual(list(entry.issues.all()), [issue])
+
+        models.Donation.objects.create(account=paccount, amount=1000)
+        self.assertTrue(models.SorterEntry.objects.get(project=proj).funded)
+
+        issue.delete()
+        entry = models.SorterEntry.objects.get(project=proj)
+        self.assertEqual(entry.filters, 'country-' + country.code)
+
+        proj.published = False
+        proj.save()
+        self.assertFalse(models.SorterEntry.objects.exists())
+
+    def test_deferred(self):
+        """Saves within deferred() are rebuilt once, at its end. Donations
+        only update the funded flag"""
+        country = models.Country.objects.get(name='Mexico')
+        account = models.Account.objects.create(
+            name='P', code='PROJ', goal=1000)
+        with models.SorterEntry.objects.deferred():
+            proj = models.Project.objects.create(
+                title='Project', country=country, account=account,
+                published=True)
+            self.assertFalse(models.SorterEntry.objects.exists())
+        self.assertFalse(models.SorterEntry.objects.get(project=proj).funded)
+
+        with patch.object(models.SorterEntry.objects, 'rebuild') as rebuild:
+            models.Donation.objects.create(account=account, amount=1000)
+        self.assertFalse(rebuild.called)
+        self.assertTrue(models.SorterEntry.objects.get(project=proj).funded)
+
+    def test_targeted(self):
+        """Campaign and issue changes rebuild only the affected projects'
+        entries. Loading fixtures (raw saves) rebuilds nothing"""
+        country = models.Country.objects.get(name='Mexico')
+        campaign = models.Campaign.objects.create(
+            name='Campaign', campaigntype=models.Campaign.SECTOR,
+            account=models.Account.objects.create(name='C', code='CPN'))
+        issue = models.Issue.objects.create(name='AAA')
+        issue.campaigns.add(campaign)
+        projects = [models.Project.objects.create(
+            title='Project %s' % i, country=country, published=True,
+            account=models.Account.objects.create(
+                name='P%s' % i, code='PROJ%s' % i)) for i in range(3)]
+        projects[0].campaigns.add(campaign)
+
+        with patch.object(models.SorterEntry.objects, 'rebuild') as rebuild:
+            campaign.project_set.add(projects[1])
+            rebuild.assert_called_once_with({projects[1].pk})
+            rebuild.reset_mock()
+            issue.delete()
+            rebuild.assert_called_once_with(
+                {projects[0].pk, projects[1].pk})
+            rebuild.reset_mock()
+            campaign.delete()
+            rebuild.assert_called_once_with(
+                {projects[0].pk, projects[1].pk})
+            rebuild.reset_mock()
+            post_save.send(sender=models.Project, instance=projects[2],
+                           created=False, raw=True)
+            self.assertFalse(rebuild.called)
+
+
+class PayGovAlertTests(TestCase):
+    LOCMEM = {'midterm': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'paygov-alert-tests'}}
+
+    def test_active(self):
+        """The active alert is cached, yet follows time windows and edits"""
+        now = timezone.now()
+        with self.settings(CACHES=self.LOCMEM):
+            caches['midterm'].clear()
+            self.assertEqual(models.PayGovAlert.objects.active(), None)
+            current = models.PayGovAlert.objects.create(
+                message='Current', start_date_time=now - timedelta(hours=1),
+                end_date_time=now + timedelta(hours=1))
+            upcoming = models.PayGovAlert.objects.create(
+                message='Upcoming', start_date_time=now + timedelta(hours=2),
+                end_date_time=now + timedelta(hours=3))
+
+            with self.assertNumQueries(1):
+                self.assertEqual(models.PayGovAlert.objects.active(), current)
+            with self.assertNumQueries(0):
+                self.assertEqual(models.PayGovAlert.objects.active(), current)
+
+            later = now + timedelta(hours=2, minutes=30)
+            with patch('peacecorps.models.timezone.now', return_value=later):
+                with self.assertNumQueries(0):
+                    self.assertEqual(models.PayGovAlert.objects.active(),
+                                     upcoming)
+
+            upcoming.start_date_time = now - timedelta(minutes=30)
+            upcoming.save()
+            self.assertEqual(models.PayGovAlert.objects.active(), upcoming)
+            upcoming.delete()
+            self.assertEqual(models.PayGovAlert.objects.active(), current)
+
+
+class CountryRegistryTests(TestCase):
+    def test_reloads(self):
+        """The snapshot is reused, but reloaded when an unknown id is looked
+        up and once it reaches its maximum age"""
+        registry = models.CountryRegistry()
+        registry.all()
+        # bulk_create skips the signal which invalidates the registries
+        models.Country.objects.bulk_create([
+            models.Country(code='ATL', name='Atlantis')])
+        country = models.Country.objects.get(code='ATL')
+        with self.assertNumQueries(0):
+            self.assertEqual(registry.by_code('ATL'), None)
+        with self.assertNumQueries(1):
+            self.assertEqual(registry.by_pk(country.pk), country)
+
+        models.Country.objects.filter(pk=country.pk).update(name='Lemuria')
+        with self.assertNumQueries(0):
+            self.assertEqual(registry.by_name('Lemuria'), None)
+        later = time.time() + models.CountryRegistry.MAX_AGE
+        with patch('peacecorps.models.time.time', return_value=later):
+            self.assertEqual(registry.by_name('Lemuria'), country)
+
+
+class DonationRollupTests(TestCase):
+    def setUp(self):
+        self.account = models.Account.objects.create(
+            name='Example', code='EXEXEX')
+        self.other = models.Account.objects.create(
+            name='Other', code='OTHER')
+
+    def test_record(self):
+        """Recording increments the account's totals for that day and
+        payment type"""
+        Rollup = models.DonationRollup
+        Rollup.objects.record(self.account.pk, 'CreditCard', 1000,
+                              date(2015, 3, 1))
+        Rollup.objects.record(self.account.pk, 'CreditCard', 500,
+                              date(2015, 3, 1))
+        Rollup.objects.record(self.account.pk, 'DirectDebit', 200,
+                              date(2015, 3, 1))
+        Rollup.objects.record(self.account.pk, 'CreditCard', 300,
+                              date(2015, 3, 3))
+        Rollup.objects.record(self.other.pk, 'CreditCard', 9999,
+                              date(2015, 3, 1))
+
+        rollup = Rollup.objects.get(account=self.account, day=date(2015, 3, 1),
+                                    payment_type='CreditCard')
+        self.assertEqual((1500, 2), (rollup.amount, rollup.count))
+
+        rollups = self.account.donation_rollups.all()
+        self.assertEqual(rollups.totals(), {'total': 2000, 'donations': 4})
+        self.assertEqual(
+            list(rollups.daily_totals()),
+            [{'day': date(2015, 3, 1), 'total': 1700, 'donations': 3},
+             {'day': date(2015, 3, 3), 'total': 300, 'donations': 1}])
+        self.assertEqual(rollups.cumulative_totals(),
+                         [(date(2015, 3, 1), 1700), (date(2015, 3, 3), 2000)])
+        self.assertEqual(
+            rollups.between(start=date(2015, 3, 2)).totals(),
+            {'total': 300, 'donations': 1})
+        self.assertEqual(
+            Rollup.objects.between(end=date(2015, 3, 2)).totals(),
+            {'total': 11699, 'donations': 4})
+        self.assertEqual(
+            Rollup.objects.between(date(2016, 1, 1)).totals(),
+            {'total': 0, 'donations': 0})
+
+    def test_record_conflict(self):
+        """If creating the row conflicts, the update is retried once before
+        giving up"""
+        with patch.object(models.DonationRollupManager, 'create',
+                          side_effect=IntegrityError) as create:
+            self.assertRaises(
+                IntegrityError, models.DonationRollup.objects.record,
+                self.account.pk, 'CreditCard', 1000)
+        self.assertEqual(create.call_count, 2)
+
+    def test_capture(self):
+        """Donations which weren't rolled up are captured, once"""
+        models.Donation.objects.create(account=self.account, amount=100,
+                                       rolled_up=True)
+        models.Donation.objects.create(account=self.account, amount=200)
+        models.Donation.objects.create(account=self.account, amount=300)
+
+        models.DonationRollup.objects.capture(self.account.donations.all())
+        models.DonationRollup.objects.capture(self.account.donations.all())
+        rollup = models.DonationRollup.objects.get()
+        self.assertEqual((self.account.pk, '', 500, 2), (
+            rollup.account_id, rollup.payment_type, rollup.amount,
+            rollup.count))
+        self.assertFalse(
+            models.Donation.objects.filter(rolled_up=False).exists())
+
 
 class FAQTests(TestCase):
     def test_slug(self):
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 import logging
 import tempfile
 from unittest.mock import Mock, patch
@@ -9,7 +9,8 @@ import json
 
 from peacecorps.management.commands import sync_accounting as sync
 from peacecorps.models import (
-    Account, Campaign, Country, Donation, Project, SectorMapping)
+    Account, Campaign, Country, Donation, DonationRollup, Project,
+    SectorMapping)
 
 
 class SyncAccountingTests(TestCase):
@@ -84,6 +85,10 @@ class SyncAccountingTests(TestCase):
             None, Donation.objects.filter(pk=before_donation.pk).first())
         self.assertNotEqual(
             None, Donation.objects.filter(pk=after_donation.pk).first())
+        # ...though it's still counted in the rollups
+        rollup = DonationRollup.objects.get(account=acc222)
+        self.assertEqual((date(2009, 12, 15), 5432, 1), (
+            rollup.day, rollup.amount, rollup.count))
 
         # amount donated to should also be updated
         self.assertEqual(123423, Account.objects.get(pk=acc222.pk).current)
@@ -326,6 +331,13 @@ class SyncAccountingTests(TestCase):
         self.assertEqual(create.call_args_list[0][0][0]['PROJ_NO'], 'SPF-STR')
         self.assertEqual(create.call_args_list[1][0][0]['PROJ_NO'], '123-456')
 
+    @patch('peacecorps.management.commands.sync_accounting.create_account')
+    def test_process_rows_in_sorter(self, create):
+        """The sorter's entries should be rebuilt after a sync"""
+        with patch.object(sync.SorterEntry.objects, 'rebuild') as rebuild:
+            sync.process_rows_in([{'PROJ_NO': '123-456', 'SECTOR': 'IT'}])
+            self.assertTrue(rebuild.called)
+
     def test_account_type_country(self):
         row = {'PROJ_NO': '123-CFD'}
         self.assertEqual(Account.COUNTRY, sync.account_type(row))
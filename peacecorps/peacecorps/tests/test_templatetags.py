@@ -1,5 +1,8 @@
+from unittest.mock import Mock
+
 from django.test import TestCase
 
+from peacecorps.templatetags.fragments import cached_fragments
 from peacecorps.templatetags.humanize_cents import humanize_cents
 
 
@@ -11,3 +14,31 @@ class HumanizeTest(TestCase):
         self.assertEqual('$0.12', humanize_cents(12))
         self.assertEqual('$1.23', humanize_cents(123))
         self.assertEqual('$12,345,678.90', humanize_cents(1234567890))
+
+
+class CachedFragmentsTest(TestCase):
+    def test_only_misses_rendered(self):
+        """Fragments are rendered once per version; changing an object's
+        version re-renders only that object"""
+        objects = [Mock(pk=1), Mock(pk=2), Mock(pk=3)]
+        render = Mock(side_effect=lambda obj: '<p>%s</p>' % obj.pk)
+        versions = {1: 'a', 2: 'a', 3: 'a'}
+        caches = {'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'fragment-test'}}
+        with self.settings(CACHES=caches):
+            result = cached_fragments('test', objects, render, versions,
+                                      cache_alias='default')
+            self.assertEqual(render.call_count, 3)
+            self.assertEqual(result[2], '<p>2</p>')
+
+            result = cached_fragments('test', objects, render, versions,
+                                      cache_alias='default')
+            self.assertEqual(render.call_count, 3)
+            self.assertEqual(result[3], '<p>3</p>')
+
+            versions[2] = 'b'
+            cached_fragments('test', objects, render, versions,
+                             cache_alias='default')
+            self.assertEqual(render.call_count, 4)
+            self.assertEqual(render.call_args[0][0].pk, 2)
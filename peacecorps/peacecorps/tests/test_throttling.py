@@ -0,0 +1,48 @@
+from unittest.mock import patch
+
+from django.test import RequestFactory, TestCase
+from rest_framework.request import Request
+
+from peacecorps.throttling import FixedWindowAnonRateThrottle
+
+
+LOCMEM = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'throttle': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'test-throttle',
+    },
+}
+
+
+class Throttle(FixedWindowAnonRateThrottle):
+    rate = '3/second'
+
+
+class FixedWindowThrottleTests(TestCase):
+    def setUp(self):
+        factory = RequestFactory()
+        self.request = Request(factory.get('/', REMOTE_ADDR='10.0.0.1'))
+        self.other = Request(factory.get('/', REMOTE_ADDR='10.0.0.2'))
+
+    def test_window(self):
+        """Requests are counted per client within each window"""
+        with self.settings(CACHES=LOCMEM), \
+                patch.object(Throttle, 'timer', return_value=100.25):
+            for _ in range(3):
+                self.assertTrue(Throttle().allow_request(self.request, None))
+            throttle = Throttle()
+            self.assertFalse(throttle.allow_request(self.request, None))
+            self.assertEqual(throttle.wait(), 0.75)
+            self.assertTrue(Throttle().allow_request(self.other, None))
+
+        with self.settings(CACHES=LOCMEM), \
+                patch.object(Throttle, 'timer', return_value=101.0):
+            self.assertTrue(Throttle().allow_request(self.request, None))
+
+    def test_dummy_cache(self):
+        """Without a counter store, requests are let through"""
+        for _ in range(5):
+            self.assertTrue(Throttle().allow_request(self.request, None))
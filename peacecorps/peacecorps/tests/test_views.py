@@ -1,12 +1,20 @@
 import json
-from urllib.parse import quote as urlquote
+from unittest.mock import patch
+from urllib.parse import quote as urlquote, urlparse
 
 from django.core.urlresolvers import reverse
 from django.db import connections, DEFAULT_DB_ALIAS
-from django.test import Client, TestCase, TransactionTestCase
+from django.http import QueryDict
+from django.test import Client, RequestFactory, TestCase, TransactionTestCase
 from django.test.utils import CaptureQueriesContext
 
-from peacecorps.models import Account, Campaign, Country, FAQ, Project
+from peacecorps import sorter
+from peacecorps.models import (
+    Account, Campaign, Country, country_registry, Donation, DonorInfo, FAQ,
+    Project, SorterEntry)
+from peacecorps.views import (
+    campaign_form, CountryCampaignListAPI, project_form, project_versions,
+    ProjectExportAPI, ProjectListAPI, site_versions)
 
 
 class DonationsTests(TestCase):
@@ -216,6 +224,20 @@ class DonatePagesTests(TestCase):
         response = self.client.get('/donate/project/brick-oven-bakery/')
         self.assertEqual(response.status_code, 200)
 
+    def test_sorter_first_page(self):
+        """The sorter renders only the first page of projects; the "Load
+        more" button fetches the next"""
+        SorterEntry.objects.rebuild()
+        url = reverse('donate projects funds')
+        with patch.object(sorter, 'PAGE_SIZE', 2):
+            content = self.client.get(url).content.decode('utf-8')
+        self.assertEqual(content.count('class="discover_proj"'), 2)
+        entries, cursor = sorter.page(SorterEntry.objects.all(), size=2)
+        for entry in entries:
+            self.assertTrue(
+                'data-project-id="%s"' % entry.project_id in content)
+        self.assertTrue('data-next="%s"' % cursor in content)
+
     def test_fund_rendering(self):
         response = self.client.get(reverse(
             'donate campaign', kwargs={'slug': 'health-hivaids-fund'}))
@@ -371,6 +393,128 @@ class DonatePagesTests(TestCase):
         self.assertContains(response, urlquote('http://example.com/'))
 
 
+class ConditionalGetTests(TestCase):
+    fixtures = ['tests.yaml']
+
+    def test_project_not_modified(self):
+        """A matching ETag or If-Modified-Since results in a 304 until the
+        project changes"""
+        url = reverse('donate project', kwargs={'slug': 'brick-oven-bakery'})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        last_modified = response['Last-Modified']
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+        # A different query string has a different ETag
+        response = self.client.get(url + '?payment_status=full',
+                                   HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+        # Donations change the page
+        project = Project.objects.get(slug='brick-oven-bakery')
+        project.account.donations.create(amount=100)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_cached_body_matches_etag(self):
+        """The page cache is keyed on the validators, so an edit changes the
+        ETag and the body together"""
+        caches = {alias: {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'conditional-tests-' + alias}
+            for alias in ('default', 'midterm', 'shortterm', 'throttle')}
+        url = reverse('donate project', kwargs={'slug': 'brick-oven-bakery'})
+        with self.settings(CACHES=caches):
+            first = self.client.get(url)
+            project = Project.objects.get(slug='brick-oven-bakery')
+            project.title = 'A Brand New Title'
+            project.save()
+            second = self.client.get(url)
+        self.assertNotEqual(first['ETag'], second['ETag'])
+        self.assertFalse(b'A Brand New Title' in first.content)
+        self.assertTrue(b'A Brand New Title' in second.content)
+
+    def test_project_versions_queries(self):
+        """A project's validators take a few small queries, however many
+        donations and campaigns it has"""
+        with self.assertNumQueries(3):
+            self.assertTrue(project_versions(None, 'brick-oven-bakery'))
+        with self.assertNumQueries(1):
+            self.assertIsNone(project_versions(None, 'nonproj'))
+
+    def test_missing_project(self):
+        """No validators for pages which don't exist"""
+        response = self.client.get(reverse('donate project',
+                                           kwargs={'slug': 'nonproj'}))
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(response.has_header('ETag'))
+
+    def test_site_wide(self):
+        """Listing pages change when any project is edited"""
+        url = reverse('donate projects funds')
+        etag = self.client.get(url)['ETag']
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        api_url = reverse('projects api')
+        api_etag = self.client.get(api_url)['ETag']
+        response = self.client.get(api_url, HTTP_IF_NONE_MATCH=api_etag)
+        self.assertEqual(response.status_code, 304)
+
+        project = Project.published_objects.first()
+        project.published = False
+        project.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get(api_url, HTTP_IF_NONE_MATCH=api_etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_site_versions_cached(self):
+        """Site-wide validators are read from the cache, which edits clear"""
+        caches = {alias: {
+            'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}
+            for alias in ('default', 'midterm', 'throttle')}
+        caches['shortterm'] = {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'site-versions-tests'}
+        with self.settings(CACHES=caches):
+            versions = site_versions(None)
+            with self.assertNumQueries(0):
+                self.assertEqual(site_versions(None), versions)
+
+            project = Project.published_objects.first()
+            project.title = 'A New Title'
+            project.save()
+            self.assertNotEqual(site_versions(None), versions)
+
+    def test_project_campaigns(self):
+        """Adding a project to (or removing it from) a campaign changes the
+        project's page, from either side of the relationship"""
+        url = reverse('donate project', kwargs={'slug': 'brick-oven-bakery'})
+        project = Project.objects.get(slug='brick-oven-bakery')
+        campaign = Campaign.objects.create(
+            name='New Fund', account=Account.objects.create(
+                name='New Fund', code='NEWFUND'),
+            campaigntype=Campaign.SECTOR)
+
+        etag = self.client.get(url)['ETag']
+        project.campaigns.add(campaign)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+        etag = response['ETag']
+        campaign.project_set.clear()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+
 class QueryCountTests(TransactionTestCase):
     fixtures = ['tests', 'countries', 'issues']
 
@@ -383,6 +527,183 @@ class QueryCountTests(TransactionTestCase):
             self.assertTrue(len(cap) < 10)
 
 
+class CheckoutQueryCountTests(TestCase):
+    fixtures = ['countries']
+    form_data = {
+        'payer_name': 'William Williams',
+        'billing_address': '1 Main Street',
+        'billing_city': 'Anytown',
+        'billing_state': 'MD',
+        'billing_zip': '20852',
+        'country': 'USA',
+        'payment_type': 'CreditCard',
+        'information_consent': 'true'}
+
+    def setUp(self):
+        proj_acc = Account.objects.create(
+            name='PROJPROJ', code='PROJPROJ', category=Account.PROJECT,
+            goal=200000)
+        cmpn_acc = Account.objects.create(
+            name='CMPNCMPN', code='CMPNCMPN', category=Account.OTHER)
+        Project.objects.create(
+            title='Project', slug='sluggy',
+            country=Country.objects.get(name='Egypt'), account=proj_acc,
+            overflow=cmpn_acc, published=True)
+        Campaign.objects.create(
+            slug='cmpn', name='Campaign', account=cmpn_acc, published=True)
+        Donation.objects.create(account=proj_acc, amount=100)
+        country_registry.all()
+
+    def post(self, view, slug):
+        """Submit the checkout form, returning the response and the number
+        of queries"""
+        request = RequestFactory().post(
+            '/?payment_amount=20', self.form_data, HTTP_HOST='example.com')
+        with CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as cap:
+            response = view(request, slug)
+        return response, len(cap)
+
+    def test_checkout(self):
+        """The lookup (with the account's total) and the DonorInfo insert.
+        Countries come from the (already loaded) registry"""
+        response, num_queries = self.post(project_form, 'sluggy')
+        self.assertContains(response, 'agency_tracking_id')
+        self.assertEqual(num_queries, 2)
+
+        response, num_queries = self.post(campaign_form, 'cmpn')
+        self.assertContains(response, 'agency_tracking_id')
+        self.assertEqual(num_queries, 2)
+
+        self.assertEqual(DonorInfo.objects.count(), 2)
+        self.assertTrue('/project/sluggy/success' in
+                        DonorInfo.objects.order_by('pk').first().xml)
+
+
+class ListAPIQueryCountTests(TestCase):
+    fixtures = ['countries']
+    description = json.dumps({"data": [{"type": "text",
+                                        "data": {"text": "Description"}}]})
+
+    def setUp(self):
+        """1,000 projects, half funded, each with a sector fund"""
+        country = Country.objects.get(name='Egypt')
+        fund_account = Account.objects.create(
+            name='SECTOR', code='SECTOR', category=Account.SECTOR)
+        fund = Campaign.objects.create(
+            name='Sector', slug='sector', account=fund_account,
+            campaigntype=Campaign.SECTOR, description=self.description)
+        Account.objects.bulk_create(
+            Account(name='P%s' % i, code='P%s' % i, category=Account.PROJECT,
+                    goal=100, current=(i % 2) * 100)
+            for i in range(1000))
+        Project.objects.bulk_create(
+            Project(title='Project %s' % i, slug='project-%s' % i,
+                    description=self.description, country=country,
+                    account_id='P%s' % i, volunteername='Volunteer',
+                    published=True)
+            for i in range(1000))
+        Project.campaigns.through.objects.bulk_create(
+            Project.campaigns.through(project=project, campaign=fund)
+            for project in Project.objects.all())
+        Campaign.objects.create(
+            name='Egypt Fund', slug='egypt', account=Account.objects.create(
+                name='EGYPT', code='EGYPT', category=Account.COUNTRY),
+            campaigntype=Campaign.COUNTRY, country=country,
+            description=self.description)
+
+    def get(self, view, **params):
+        """Call the view directly (skipping the ETag checks), returning the
+        results and the number of queries"""
+        request = RequestFactory().get('/', params)
+        with CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as cap:
+            response = view.as_view()(request).render()
+        return json.loads(response.content.decode('utf-8')), len(cap)
+
+    def test_projects(self):
+        """The number of queries should not grow with the number of
+        projects: one for the projects, one for their campaigns"""
+        results, num_queries = self.get(ProjectListAPI)
+        self.assertEqual(len(results), 1000)
+        self.assertEqual(len([r for r in results if r['fully_funded']]), 500)
+        self.assertEqual(results[0]['campaigns'][0]['name'], 'Sector')
+        self.assertTrue(num_queries <= 2)
+
+        results, num_queries = self.get(ProjectListAPI, funded='true')
+        self.assertEqual(len(results), 500)
+        self.assertTrue(num_queries <= 2)
+
+    def test_campaigns(self):
+        results, num_queries = self.get(CountryCampaignListAPI)
+        self.assertEqual(results[0]['country'], 'Egypt')
+        self.assertTrue(num_queries <= 1)
+
+    def test_sparse_fields(self):
+        """Only the requested fields are serialized; the campaigns are not
+        fetched unless requested"""
+        results, num_queries = self.get(
+            ProjectListAPI, fields='slug,fully_funded,unknown')
+        self.assertEqual(set(results[0].keys()), {'slug', 'fully_funded'})
+        self.assertEqual(num_queries, 1)
+
+        results, _ = self.get(CountryCampaignListAPI, fields='name')
+        self.assertEqual(results, [{'name': 'Egypt Fund'}])
+
+    def test_cursor_pagination(self):
+        """Following the next links visits each project once, in pk
+        order"""
+        data, num_queries = self.get(ProjectListAPI, page_size='300',
+                                     fields='slug')
+        self.assertEqual(num_queries, 1)
+        slugs = [result['slug'] for result in data['results']]
+        while data['next']:
+            self.assertEqual(len(data['results']), 300)
+            cursor = QueryDict(urlparse(data['next']).query)['cursor']
+            data, _ = self.get(ProjectListAPI, page_size='300',
+                               fields='slug', cursor=cursor)
+            slugs.extend(result['slug'] for result in data['results'])
+        self.assertEqual(slugs, list(Project.objects.order_by(
+            'pk').values_list('slug', flat=True)))
+
+        # Funding is judged by the accounts, even if the sorter's entries
+        # (not built here) are missing or stale
+        data, _ = self.get(ProjectListAPI, page_size='500', funded='true')
+        self.assertEqual(len(data['results']), 500)
+        self.assertTrue(all(r['fully_funded'] for r in data['results']))
+        self.assertEqual(data['next'], None)
+
+        data, _ = self.get(ProjectListAPI, page_size='70', funded='false')
+        results = data['results']
+        while data['next']:
+            self.assertEqual(len(data['results']), 70)
+            cursor = QueryDict(urlparse(data['next']).query)['cursor']
+            data, _ = self.get(ProjectListAPI, page_size='70',
+                               funded='false', cursor=cursor)
+            results.extend(data['results'])
+        self.assertEqual(len(results), 500)
+        self.assertFalse(any(r['fully_funded'] for r in results))
+
+        response = self.client.get(reverse('projects api'),
+                                   {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_export(self):
+        """Each project is streamed on its own line; campaigns are fetched
+        per chunk rather than per project"""
+        request = RequestFactory().get('/', {'fields': 'slug,campaigns'})
+        with CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as cap:
+            response = ProjectExportAPI.as_view()(request)
+            self.assertTrue(response.streaming)
+            lines = b''.join(response.streaming_content).decode(
+                'utf-8').strip().split('\n')
+        self.assertEqual(len(lines), 1000)
+        first = json.loads(lines[0])
+        self.assertEqual(set(first.keys()), {'slug', 'campaigns'})
+        self.assertEqual(first['campaigns'][0]['name'], 'Sector')
+        # Each chunk: the projects, then their campaigns
+        self.assertTrue(
+            len(cap) <= 2 * (1 + 1000 // ProjectExportAPI.chunk_size))
+
+
 class FAQTests(TestCase):
     def answer(self, value):
         return json.dumps({"data": [{
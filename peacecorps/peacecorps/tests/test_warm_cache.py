@@ -0,0 +1,45 @@
+from io import StringIO
+
+from django.core.management.base import OutputWrapper
+from django.core.urlresolvers import reverse
+from django.test import TestCase
+
+from peacecorps.management.commands import warm_cache
+from peacecorps.models import Project
+
+
+class WarmCacheTests(TestCase):
+    fixtures = ['tests.yaml']
+
+    def test_public_urls(self):
+        """Static pages and each published project/fund should be present;
+        unpublished projects should not"""
+        project = Project.published_objects.first()
+        project.published = False
+        project.save()
+
+        urls = warm_cache.public_urls()
+        self.assertEqual(urls[0], reverse('donate landing'))
+        self.assertTrue(reverse('donate faqs') in urls)
+        self.assertTrue(reverse(
+            'donate campaign', kwargs={'slug': 'education-fund'}) in urls)
+        self.assertTrue(reverse(
+            'donate project', kwargs={'slug': 'brick-oven-bakery'}) in urls)
+        self.assertTrue(reverse(
+            'api:project_detail', kwargs={'slug': 'brick-oven-bakery'})
+            in urls)
+        self.assertFalse(reverse(
+            'donate project', kwargs={'slug': project.slug}) in urls)
+
+    def test_handle(self):
+        """Each url is requested and reported"""
+        stdout = StringIO()
+        command = warm_cache.Command()
+        command.stdout = OutputWrapper(stdout)
+        with self.assertLogs('peacecorps.warm_cache') as logger:
+            command.handle(host='testserver', workers=1)
+        lines = stdout.getvalue().strip().split('\n')
+        self.assertEqual(len(lines), len(warm_cache.public_urls()))
+        for line in lines:
+            self.assertTrue(line.startswith('200 '))
+        self.assertTrue('0 failures' in logger.output[0])
@@ -20,28 +20,31 @@ def donor_custom_fields():
     return data
 
 
+def collection_request_data():
+    data = {
+        'agency_tracking_id': 'PCIOCI1234',
+        'agency_memo': '()(5555555)',
+        'form_id': 'DONORFORM',
+        'payment_amount': 2000,
+        'payment_type': 'CreditCard',
+        'payer_name': 'William Williams',
+        'billing_address': '1 Main St',
+        'billing_city': 'Anytown',
+        'billing_state': 'MD',
+        'billing_zip': '20852',
+        'success_url': 'https://success.com',
+        'failure_url': 'https://failure.com'
+    }
+    data.update(payxml.generate_custom_fields(donor_custom_fields()))
+    return data
+
+
 class PayXMLGenerationTests(TestCase):
 
     fixtures = ['countries.yaml']
 
     def test_xml(self):
-        data = {
-            'agency_tracking_id': 'PCIOCI1234',
-            'agency_memo': '()(5555555)',
-            'form_id': 'DONORFORM',
-            'payment_amount': 2000,
-            'payment_type': 'CreditCard',
-            'payer_name': 'William Williams',
-            'billing_address': '1 Main St',
-            'billing_city': 'Anytown',
-            'billing_state': 'MD',
-            'billing_zip': '20852',
-            'success_url': 'https://success.com',
-            'failure_url': 'https://failure.com'
-        }
-
-        data.update(payxml.generate_custom_fields(donor_custom_fields()))
-
+        data = collection_request_data()
         collection_request = payxml.generate_collection_request(data)
         self.assertEqual('collection_request', collection_request.tag)
         protocol_versions = collection_request.findall('./protocol_version')
@@ -91,6 +94,34 @@ class PayXMLGenerationTests(TestCase):
 
         self.assertEqual(optg, tostring(optional_fields).decode('utf-8'))
 
+    def test_render_collection_request(self):
+        """The template must produce exactly what ElementTree would,
+        including escaped values"""
+        def assert_same(data):
+            self.assertEqual(
+                tostring(payxml.generate_collection_request(data)).decode(
+                    'utf-8'),
+                payxml.render_collection_request(data))
+
+        assert_same(collection_request_data())
+
+        data = collection_request_data()
+        data.update(payxml.generate_custom_fields({}))
+        data['payment_amount'] = 1234567
+        assert_same(data)
+
+        data = collection_request_data()
+        data['payer_name'] = 'Jos\xe9 "Pepe" <O\'Brien> & Sons \u2603'
+        data['billing_address'] = 'Line 1\nLine 2\r\tUnit {0} %s'
+        data['success_url'] = 'https://example.com/?a=1&b=2'
+        data['agency_memo'] = payxml.generate_agency_memo({
+            'comments': 'Caf\xe9 & <b>bar</b>', 'payment_amount': 1999,
+            'project_code': '14-54FF'})
+        data.update(payxml.generate_custom_fields({
+            'card_dedication': '"Quoted" & \u00fcnicode',
+            'dedication_name': '<script>'}))
+        assert_same(data)
+
     def test_generate_agency_memo(self):
         """The data dictionary should be serialized in the predictable way.
         Allow all fields to be optional"""
@@ -0,0 +1,40 @@
+from django.core.cache import caches
+from rest_framework.throttling import AnonRateThrottle
+
+
+class FixedWindowAnonRateThrottle(AnonRateThrottle):
+    """AnonRateThrottle backed by an atomic counter per client per window
+    (rather than a list of request times read and rewritten per request).
+    With memcached, this is a single incr for all but the first request in
+    each window, and the count is shared by all web nodes"""
+    cache_alias = 'throttle'
+
+    @property
+    def cache(self):
+        # Looked up per use as cache connections are per thread
+        return caches[self.cache_alias]
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        key = self.get_cache_key(request, view)
+        if key is None:
+            return True
+
+        self.now = self.timer()
+        window = int(self.now // self.duration)
+        self.window_end = (window + 1) * self.duration
+        key = '%s:%d' % (key, window)
+
+        try:
+            count = self.cache.incr(key)
+        except ValueError:  # first request in this window
+            # memcached timeouts are whole seconds; outlast the window
+            if self.cache.add(key, 1, self.duration + 1):
+                count = 1
+            else:           # lost the race to another request
+                count = self.cache.incr(key)
+        return count <= self.num_requests
+
+    def wait(self):
+        return max(self.window_end - self.now, 0)
@@ -2,38 +2,58 @@ from django.apps import apps
 from django.conf import settings
 from django.conf.urls import include, patterns, url
 from django.conf.urls.static import static
+from django.views.decorators.cache import cache_control
 from django.views.generic import RedirectView
 
 from peacecorps import api, views
-from peacecorps.cache import midterm_cache, shortterm_cache
+from peacecorps.cache import (
+    conditional, donate_page_cache, list_api_cache, midterm_cache,
+    shortterm_cache)
 
 _slug = r'(?P<slug>[a-zA-Z0-9_-]+)'
 
 apipatterns = patterns(
     '',
     url(r'^project/' + _slug + r'/$',
-        shortterm_cache(api.ProjectDetail.as_view()), name='project_detail'),
+        conditional(views.project_versions)(
+            shortterm_cache(api.ProjectDetail.as_view())),
+        name='project_detail'),
+    url(r'^projects/$', api.ProjectBatch.as_view(), name='project_batch'),
     url(r'^project/' + _slug + r'/payment/$',
         api.ProjectDonation.as_view(), name='project_payment'),
     url(r'^fund/' + _slug + r'/payment/$',
         api.FundDonation.as_view(), name='fund_payment'),
+    url(r'^totals/$',
+        cache_control(max_age=settings.LIVE_TOTALS_TIMEOUT)(
+            api.AccountTotals.as_view()),
+        name='totals'),
+    url(r'^sorter/$', api.SorterProjects.as_view(), name='sorter'),
 )
 
 
 urlpatterns = patterns(
     '',
-    url(r'^donate/$', midterm_cache(views.donate_landing),
+    url(r'^donate/$',
+        conditional(views.site_versions)(
+            midterm_cache(views.donate_landing)),
         name='donate landing'),
     url(r'^donate/projects-funds/$',
-        midterm_cache(views.donate_projects_funds),
+        conditional(views.site_versions)(
+            midterm_cache(views.donate_projects_funds)),
         name='donate projects funds'),
     url(r'^donate/projects-funds/memorial/$',
-        midterm_cache(views.memorial_funds), name='donate memorial funds'),
-    url(r'^donate/faq/$', midterm_cache(views.FAQs.as_view()),
+        conditional(views.site_versions)(
+            midterm_cache(views.memorial_funds)),
+        name='donate memorial funds'),
+    url(r'^donate/faq/$',
+        conditional(views.faq_versions)(
+            midterm_cache(views.FAQs.as_view())),
         name='donate faqs'),
 
     url(r'^donate/fund/' + _slug + r'/$',
-        midterm_cache(views.fund_detail), name='donate campaign'),
+        conditional(views.fund_versions)(
+            donate_page_cache(views.fund_detail)),
+        name='donate campaign'),
     # not cached so the values are up-to-date
     url(r'^donate/fund/' + _slug + r'/payment/$',
         views.campaign_form, name='campaign form'),
@@ -46,7 +66,9 @@ urlpatterns = patterns(
         name='campaign failure'),
 
     url(r'^donate/project/' + _slug + r'/$',
-        midterm_cache(views.donate_project), name='donate project'),
+        conditional(views.project_versions)(
+            donate_page_cache(views.donate_project)),
+        name='donate project'),
     # not cached so the values are up-to-date
     url(r'^donate/project/' + _slug + r'/payment/$',
         views.project_form, name='project form'),
@@ -63,12 +85,16 @@ urlpatterns = patterns(
 
     url(r'^api/', include(apipatterns, namespace='api')),
 
+    url(r'^donate/api/v1/projects/export/$',
+        views.ProjectExportAPI.as_view(), name='projects export'),
     url(r'^donate/api/v1/projects/',
-        views.ProjectListAPI.as_view(),
+        conditional(views.site_versions)(
+            list_api_cache(views.ProjectListAPI.as_view())),
         name='projects api'),
 
     url(r'^donate/api/v1/campaigns/country',
-        views.CountryCampaignListAPI.as_view(),
+        conditional(views.site_versions)(
+            list_api_cache(views.CountryCampaignListAPI.as_view())),
         name='campaigns api'),
 )
 
@@ -1,56 +1,138 @@
 # @todo split into smaller files; remove "donate_" prefix
 from collections import defaultdict
+import json
 from urllib.parse import quote as urlquote
 
 from django.conf import settings
+from django.core.cache import caches
 from django.core.urlresolvers import reverse
-from django.db.models import Prefetch
-from django.http import HttpResponseRedirect
+from django.db.models import Count, Max
+from django.http import (
+    Http404, HttpResponseRedirect, StreamingHttpResponse)
 from django.shortcuts import get_object_or_404, render
 from django.utils.crypto import get_random_string
 from django.views.generic import DetailView, ListView
 from django.views.decorators.csrf import csrf_exempt
-from django.core.exceptions import ObjectDoesNotExist
 
+from peacecorps import sorter
+from peacecorps.cache import fingerprint
 from peacecorps.forms import DonationAmountForm, DonationPaymentForm
 from peacecorps.models import (
-    Account, Campaign, FAQ, FeaturedCampaign, FeaturedProjectFrontPage,
-    Issue, Project, PayGovAlert)
+    Account, Campaign, country_registry, Donation, FAQ, FeaturedCampaign,
+    FeaturedProjectFrontPage, Issue, Media, Project, PayGovAlert,
+    SITE_VERSIONS_KEY, SorterEntry)
+from peacecorps.pagination import OptionalCursorPagination
 from peacecorps.payxml import convert_to_paygov
-from peacecorps.serializers import ProjectSerializer, CountryCampaignSerializer
+from peacecorps.serializers import (
+    attach_funding, CountryCampaignSerializer, ProjectSerializer,
+    requested_fields)
 from rest_framework.generics import ListAPIView
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.views import APIView
+
+
+def _latest(queryset, field='updated_at'):
+    """The most recent modification and the number of rows. Together, these
+    change whenever a row is added, edited, or removed"""
+    agg = queryset.order_by().aggregate(latest=Max(field), count=Count('pk'))
+    return agg['latest'], agg['count']
+
+
+def _aggregate_versions(queryset, *fields):
+    """Latest timestamp of each of the fields (which may span relations) of
+    a single object. None if the object does not exist"""
+    agg = queryset.aggregate(*[Max(field) for field in fields])
+    if agg[fields[0] + '__max'] is None:
+        return None
+    return tuple(agg[field + '__max'] for field in fields)
+
+
+def site_versions(request, *args, **kwargs):
+    """Validators for pages (and APIs) which list content from across the
+    site. These are cached (and the cache entry deleted whenever the content
+    changes; see models.site_content_changed), so checking them costs a
+    single cache round trip. The cache's timeout bounds staleness where the
+    cache isn't shared by every server"""
+    cache = caches['shortterm']
+    versions = cache.get(SITE_VERSIONS_KEY)
+    if versions is None:
+        versions = uncached_site_versions()
+        cache.set(SITE_VERSIONS_KEY, versions)
+    return versions
+
+
+def uncached_site_versions():
+    # The default Account manager sums donations, which we don't need
+    return (_latest(Project.published_objects.all())
+            + _latest(Campaign.published_objects.all())
+            + _latest(Account._base_manager.all())
+            + _latest(Donation.objects.all(), 'time')
+            + _latest(Media.objects.all())
+            + _latest(Issue.objects.all())
+            + tuple(FeaturedCampaign.objects.values_list('campaign', 'image'))
+            + tuple(FeaturedProjectFrontPage.objects.values_list(
+                'project', 'image')))
+
+
+def faq_versions(request):
+    return _latest(FAQ.objects.all())
+
+
+def project_versions(request, slug):
+    """Changes to the project's campaigns and issues (including which it
+    belongs to) also touch the project's updated_at. The to-many relations
+    are aggregated separately, so that no query joins donations against
+    campaigns"""
+    row = Project.published_objects.filter(slug=slug).values_list(
+        'pk', 'account', 'updated_at', 'account__updated_at',
+        'overflow__updated_at', 'featured_image__updated_at',
+        'volunteerpicture__updated_at').first()
+    if row is None:
+        return None
+    pk, account_id = row[:2]
+    donated = Donation.objects.filter(account=account_id).aggregate(
+        latest=Max('time'))
+    campaigns = Campaign.objects.filter(project=pk).aggregate(
+        latest=Max('updated_at'), issue=Max('issue__updated_at'))
+    return row[2:] + (donated['latest'], campaigns['latest'],
+                      campaigns['issue'])
+
+
+def fund_versions(request, slug):
+    return _aggregate_versions(
+        Campaign.published_objects.filter(slug=slug), 'updated_at',
+        'account__updated_at', 'account__donations__time',
+        'featured_image__updated_at')
 
 
 def project_form(request, slug):
     """Wrapper around donation_payment which passes in the correct project"""
-    project = get_object_or_404(
-        Project.published_objects.select_related(
-            'volunteerpicture', 'featured_image', 'account', 'overflow'),
-        slug=slug)
+    try:
+        project = Project.published_objects.get_with_account_total(slug=slug)
+    except Project.DoesNotExist:
+        raise Http404
     account = project.account
-    if account.funded() and project.overflow:
-        if project.overflow.category == Account.PROJECT:
-            path_name = 'donate project'
-        else:
-            path_name = 'donate campaign'
+    if account.funded() and project.overflow_id:
         return HttpResponseRedirect(
-            reverse(path_name,
-                    kwargs={'slug': project.overflow.project_or_fund().slug})
-            + '?payment_status=full')
+            project.overflow_url() + '?payment_status=full')
     else:
         return donation_payment(request, account, project=project)
 
 
 def campaign_form(request, slug):
     """Wrapper around donation_payment which passes in the correct campaign"""
-    campaign = get_object_or_404(
-        Campaign.published_objects.select_related('account'), slug=slug)
+    try:
+        campaign = Campaign.published_objects.get_with_account_total(
+            slug=slug)
+    except Campaign.DoesNotExist:
+        raise Http404
     return donation_payment(request, campaign.account, campaign=campaign)
 
 
 def donation_payment(request, account, project=None, campaign=None):
     """Collect donor contact information. Expects a GET param, payment_amount,
-    in dollars."""
+    in dollars. Submitting the form costs only the lookup and the DonorInfo
+    insert; see CheckoutQueryCountTests"""
     form = DonationAmountForm(data=request.GET, account=account)
     if not form.is_valid():
         if project:
@@ -64,11 +146,6 @@ def donation_payment(request, account, project=None, campaign=None):
     # convert to cents
     payment_amount = int(form.cleaned_data['payment_amount'] * 100)
 
-    try:
-        pay_gov_alert = PayGovAlert.objects.latest('id')
-    except ObjectDoesNotExist:
-        pay_gov_alert = None;
-
     context = {
         'title': 'Giving Checkout',
         'payment_amount': payment_amount,
@@ -77,7 +154,6 @@ def donation_payment(request, account, project=None, campaign=None):
         'agency_id': settings.PAY_GOV_AGENCY_ID,
         'app_name': settings.PAY_GOV_APP_NAME,
         'oci_servlet_url': settings.PAY_GOV_OCI_URL,
-        'pay_gov_alert': pay_gov_alert,
     }
 
     if request.method == 'POST':
@@ -104,6 +180,7 @@ def donation_payment(request, account, project=None, campaign=None):
         context['agency_tracking_id'] = paygov.agency_tracking_id
         return render(request, 'donations/checkout_review.jinja', context)
     else:
+        context['pay_gov_alert'] = PayGovAlert.objects.active()
         return render(request, 'donations/checkout_form.jinja', context)
 
 
@@ -132,7 +209,7 @@ def donate_project(request, slug):
     """A profile for each project. Also includes a donation form"""
     project = get_object_or_404(
         Project.published_objects.select_related(
-            'volunteerpicture', 'featured_image', 'account', 'overflow'),
+            'volunteerpicture', 'featured_image', 'account'),
         slug=slug)
 
     if 'payment_amount' in request.GET:
@@ -152,6 +229,13 @@ def donate_project(request, slug):
         })
 
 
+def _fund_card_version(fund):
+    """Everything displayed in a country fund's sorter card"""
+    return fingerprint(fund.name, fund.slug, fund.abstract,
+                       str(fund.description), fund.country.code,
+                       fund.country.name)
+
+
 def donate_projects_funds(request):
     """
     The page that displays a sorter for all projects, issues, volunteers.
@@ -162,45 +246,33 @@ def donate_projects_funds(request):
     country_funds = country_funds.order_by('country__name')
 
     issues = Issue.objects.prefetch_related('campaigns').order_by('name')
-    projects = Project.published_objects.prefetch_related(
-        Prefetch('account', queryset=Account.objects.all()),
-        'campaigns',
-        'country',
-        'volunteerpicture'
-    ).order_by('volunteername')
-    # Sort projects by fully-funded/non-fully-funded
-    projects = sorted(projects, key= lambda t: t.account.funded())
-    # Before we can build projects_by_issue, we need to know which funds are
-    # associated with which issues
-    issues_by_campaign = defaultdict(list)
-    for issue in issues:
-        for campaign in issue.campaigns.all():
-            issues_by_campaign[campaign.id].append(issue.id)
-
-    projects_by_issue = defaultdict(int)
-    projects_by_country = defaultdict(int)
-    # This will be used to indicate which issues a project is a part of
-    project_filters = {}
-    for project in projects:
-        projects_by_country[project.country.code] += 1
-        project_filters[project.id] = 'country-' + project.country.code
-        for campaign in project.campaigns.all():
-            for issue_id in issues_by_campaign[campaign.id]:
-                project_filters[project.id] += ",issue-" + str(issue_id)
-                projects_by_issue[issue_id] += 1
 
-    return render(
-        request,
-        'donations/all.jinja',
-        {
-            'title': 'Projects and Funds',
-            'country_funds': country_funds,
-            'issues': issues,
-            'projects': projects,
-            'projects_by_country': projects_by_country,
-            'projects_by_issue': projects_by_issue,
-            'project_filters': project_filters,
-        })
+    # Issue/country membership is precomputed; see SorterEntry
+    projects_by_country = defaultdict(int)
+    for country_id, count in SorterEntry.objects.values_list(
+            'country').annotate(count=Count('pk')).order_by():
+        projects_by_country[country_registry.by_pk(country_id).code] = count
+    issue_counts = SorterEntry.issues.through.objects.values(
+        'issue').annotate(count=Count('pk'))
+    projects_by_issue = defaultdict(
+        int, ((row['issue'], row['count']) for row in issue_counts))
+
+    # Only the first page of projects; the rest are fetched by the sorter's
+    # "Load more" button. See api.SorterProjects
+    entries, sorter_next = sorter.page(SorterEntry.objects.all())
+    context = sorter.card_context(entries)
+    fund_card_versions = {fund.id: _fund_card_version(fund)
+                          for fund in country_funds}
+    context.update({
+        'title': 'Projects and Funds',
+        'country_funds': country_funds,
+        'issues': issues,
+        'projects_by_country': projects_by_country,
+        'projects_by_issue': projects_by_issue,
+        'sorter_next': sorter_next,
+        'fund_card_versions': fund_card_versions,
+    })
+    return render(request, 'donations/all.jinja', context)
 
 
 def memorial_funds(request):
@@ -276,8 +348,7 @@ class AbstractReturn(DetailView):
 
 class ProjectReturn(AbstractReturn):
     queryset = Project.objects.select_related(
-        'account', 'country', 'featured_image', 'overflow',
-        'volunteerpicture')
+        'account', 'country', 'featured_image', 'volunteerpicture')
 
 
 class CampaignReturn(AbstractReturn):
@@ -305,16 +376,25 @@ class ProjectListAPI(ListAPIView):
     List API view of projects
     """
     serializer_class = ProjectSerializer
+    pagination_class = OptionalCursorPagination
 
     def get_queryset(self):
 
         country = self.request.query_params.get('country', None)
         funded = self.request.query_params.get('funded', None)
 
-        queryset = Project.published_objects.all()
+        queryset = ProjectSerializer.optimize(
+            Project.published_objects.all(), requested_fields(self.request))
 
         if country:
             queryset = queryset.filter(country__name__iexact=country)
+
+        if self.paginator.requested(self.request):
+            # Pages are ordered by pk; funding status is filtered as pages
+            # are read (see paginate_queryset)
+            return queryset
+
+        queryset = attach_funding(queryset)
         if funded is not None:
             if funded == "true":
                 queryset = filter(lambda x: x.account.funded(), queryset)
@@ -326,6 +406,62 @@ class ProjectListAPI(ListAPIView):
 
         return queryset
 
+    def paginate_queryset(self, queryset):
+        funded = self.request.query_params.get('funded', None)
+        keep = None
+        if funded in ("true", "false"):
+            keep = _funding_filter(funded == "true")
+        page = self.paginator.paginate_queryset(
+            queryset, self.request, view=self, keep=keep)
+        return None if page is None else attach_funding(page)
+
+
+def _funding_filter(funded):
+    """Matches projects (from ProjectSerializer.optimize) by whether their
+    accounts are fully funded, as judged for unpaginated lists"""
+    def keep(project):
+        attach_funding([project])
+        return project.account.funded() == funded
+    return keep
+
+
+class ProjectExportAPI(APIView):
+    """
+    All published projects as newline-delimited JSON (one project per line,
+    in pk order), streamed so that memory use stays flat as the catalogue
+    grows. Accepts the projects API's `fields` parameter
+    """
+    chunk_size = 200
+
+    def get(self, request):
+        fields = requested_fields(request)
+        queryset = ProjectSerializer.optimize(
+            Project.published_objects.order_by('pk'), fields)
+
+        def lines():
+            # Each chunk is its own (keyset) query, so no cursor is held
+            # open while the response streams
+            last_pk = None
+            while True:
+                chunk = queryset
+                if last_pk is not None:
+                    chunk = chunk.filter(pk__gt=last_pk)
+                chunk = list(chunk[:self.chunk_size])
+                if not chunk:
+                    return
+                serializer = ProjectSerializer(
+                    attach_funding(chunk), many=True,
+                    context={'request': request})
+                for row in serializer.data:
+                    yield json.dumps(row, cls=JSONEncoder) + '\n'
+                if len(chunk) < self.chunk_size:
+                    return
+                last_pk = chunk[-1].pk
+
+        return StreamingHttpResponse(
+            lines(), content_type='application/x-ndjson')
+
+
 class CountryCampaignListAPI(ListAPIView):
     """
     List API view of country campaigns
@@ -336,7 +472,9 @@ class CountryCampaignListAPI(ListAPIView):
 
         country = self.request.query_params.get('country', None)
 
-        queryset = Campaign.published_objects.filter(campaigntype=Campaign.COUNTRY)
+        queryset = CountryCampaignSerializer.optimize(
+            Campaign.published_objects.filter(campaigntype=Campaign.COUNTRY),
+            requested_fields(self.request))
 
         if country:
             queryset = queryset.filter(country__name__iexact=country)